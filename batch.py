@@ -0,0 +1,202 @@
+"""Headless batch runner: schedule many workloads from files without any GUI.
+
+A workload file holds "name,arrival,service" lines in the same layout as
+parse_processes() in parser1.h. Several workloads can share one file when
+separated by blank lines. Results are written as each workload finishes.
+
+    python batch.py workloads/ -a 1,2-4,5 -o results.jsonl
+    python batch.py big.txt -a 1,2,3,4,5,6,7,8 --format summary -j 8
+
+With --stream each file is a single workload that is read line by line
+while it is scheduled, and per-process records are written as processes
+complete, so workloads larger than memory can be run:
+
+    python batch.py huge.txt --stream -a 1,5 -t 100000000 -o records.jsonl
+
+A recording written by trace_io.py is read as one workload, without
+parsing any text.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from multiprocessing import Pool
+
+import scheduler
+import compare
+import trace_io
+from cache import ResultCache
+
+SUMMARY_FIELDS = ["workload", "algorithm", "mean_turnaround", "mean_norm_turn", "finished", "processes"]
+
+# Horizon for --stream without -t: the workload can't be measured up front
+STREAM_LAST_INSTANT = 2 ** 62
+
+
+def iter_workload_files(paths):
+    """Expand files and directories (recursively, in sorted order) into file paths"""
+    for path in paths:
+        if path == "-" or not os.path.isdir(path):
+            yield path
+            continue
+        for directory, subdirectories, files in os.walk(path):
+            subdirectories.sort()
+            for file_name in sorted(files):
+                yield os.path.join(directory, file_name)
+
+
+def iter_workloads(paths):
+    """Yield (workload id, processes) for every workload, reading files lazily"""
+    for path in iter_workload_files(paths):
+        if path != "-" and trace_io.is_recording(path):
+            yield f"{path}#0", trace_io.load(path).processes()
+            continue
+        stream = sys.stdin if path == "-" else open(path)
+        try:
+            index = 0
+            lines = []
+            for line in stream:
+                if line.strip():
+                    lines.append(line)
+                    continue
+                if lines:
+                    yield f"{path}#{index}", scheduler.parse_processes(lines)
+                    index += 1
+                    lines = []
+            if lines:
+                yield f"{path}#{index}", scheduler.parse_processes(lines)
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+
+def default_last_instant(processes):
+    """A horizon long enough for every work-conserving policy to finish the workload"""
+    if not processes:
+        return 0
+    return max(process[1] for process in processes) + sum(process[-1] for process in processes)
+
+
+_caches = {}
+
+
+def run_workload(job):
+    """Run every algorithm on one workload; returns (workload id, results)"""
+    workload_id, processes, algorithms, last_instant, cache_dir = job
+    if last_instant is None:
+        last_instant = default_last_instant(processes)
+    if cache_dir:
+        # One disk-backed cache per worker process; results go straight to disk
+        if cache_dir not in _caches:
+            _caches[cache_dir] = ResultCache(max_entries=0, directory=cache_dir)
+        return workload_id, _caches[cache_dir].schedule(processes, last_instant, algorithms)
+    return workload_id, scheduler.schedule(processes, last_instant, algorithms)
+
+
+def write_summary(writer, workload_id, row):
+    writer.writerow({"workload": workload_id, "algorithm": row["name"],
+                     "mean_turnaround": f"{row['mean_turnaround']:.4f}",
+                     "mean_norm_turn": f"{row['mean_norm_turn']:.4f}",
+                     "finished": row["finished"], "processes": row["processes"]})
+
+
+def write_results(out, output_format, workload_id, results, writer=None):
+    for result in results:
+        if output_format == "json":
+            record = scheduler.result_to_record(result)
+            record["workload"] = workload_id
+            out.write(json.dumps(record, separators=(",", ":")) + "\n")
+        elif output_format == "summary":
+            write_summary(writer, workload_id, compare.summarize(result))
+        else:
+            out.write(f"# {workload_id}\n")
+            out.write(scheduler.format_output(output_format, [result]))
+    out.flush()
+
+
+def stream_workload(path, algorithms, last_instant, out, output_format, writer=None):
+    """Schedule one workload file without loading it, once per algorithm
+
+    In json format each process's record is written as it completes, tagged
+    with the workload and algorithm; the summary row is written at the end.
+    """
+    if last_instant is None:
+        last_instant = STREAM_LAST_INSTANT
+    for algorithm_id, quantum in algorithms:
+        name = scheduler.algorithm_name(algorithm_id, quantum)
+
+        def on_finish(record):
+            if output_format == "json":
+                out.write(json.dumps({"workload": path, "algorithm": name, **record},
+                                     separators=(",", ":")) + "\n")
+
+        if path != "-" and trace_io.is_recording(path):
+            row = scheduler.stream_algorithm(algorithm_id, quantum, trace_io.load(path).iter_processes(),
+                                             last_instant, on_finish)
+        else:
+            stream = sys.stdin if path == "-" else open(path)
+            try:
+                row = scheduler.stream_algorithm(algorithm_id, quantum, scheduler.iter_processes(stream),
+                                                 last_instant, on_finish)
+            finally:
+                if stream is not sys.stdin:
+                    stream.close()
+        if output_format == "summary":
+            write_summary(writer, path, row)
+        out.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Schedule workload files without the GUI.")
+    parser.add_argument("paths", nargs="+", help="workload files or directories ('-' for stdin)")
+    parser.add_argument("-a", "--algorithms", default="1,2,3,4,5,6,7,8",
+                        help="algorithm list as in the main.exe input, e.g. 1,2-4,8-1")
+    parser.add_argument("-t", "--last-instant", type=int, default=None,
+                        help="simulation horizon (default: enough to finish every workload)")
+    parser.add_argument("-f", "--format", choices=["json", "summary", scheduler.TRACE, scheduler.SHOW_STATISTICS],
+                        default="json", help="output format (default: json lines)")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="worker processes")
+    parser.add_argument("--cache-dir", help="reuse and store results in this directory")
+    parser.add_argument("--stream", action="store_true",
+                        help="read each file as one workload while scheduling it, in bounded memory")
+    args = parser.parse_args(argv)
+
+    algorithms = scheduler.parse_algorithms(args.algorithms)
+    if args.stream:
+        if args.format not in ("json", "summary"):
+            parser.error("--stream writes json or summary output only")
+        if args.jobs > 1 or args.cache_dir:
+            parser.error("--stream runs sequentially and uncached; drop -j/--cache-dir")
+        if "-" in args.paths and len(algorithms) > 1:
+            parser.error("--stream can only run one algorithm over stdin")
+        if args.last_instant is None and any(algorithm_id == 8 for algorithm_id, _ in algorithms):
+            parser.error("--stream needs -t for Aging, which never finishes on its own")
+    jobs = ((workload_id, processes, algorithms, args.last_instant, args.cache_dir)
+            for workload_id, processes in iter_workloads(args.paths))
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    writer = None
+    if args.format == "summary":
+        writer = csv.DictWriter(out, fieldnames=SUMMARY_FIELDS)
+        writer.writeheader()
+    try:
+        if args.stream:
+            for path in iter_workload_files(args.paths):
+                stream_workload(path, algorithms, args.last_instant, out, args.format, writer)
+        elif args.jobs > 1:
+            with Pool(args.jobs) as pool:
+                for workload_id, results in pool.imap(run_workload, jobs, chunksize=16):
+                    write_results(out, args.format, workload_id, results, writer)
+        else:
+            for job in jobs:
+                write_results(out, args.format, *run_workload(job), writer)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
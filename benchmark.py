@@ -0,0 +1,158 @@
+"""Benchmark every scheduling policy against process count and horizon.
+
+For each algorithm, process count and time scale a seeded workload is
+generated and scheduled. Scaling every arrival and service time by the
+same factor stretches last_instant while keeping the number of
+scheduling decisions fixed, which separates per-tick from per-decision
+costs. Each run records wall time (best of --repeat), peak traced memory
+and decisions per second, where a decision is one dispatch (run segment).
+The horizon lets every policy but Aging finish the workload, so a run
+that finishes fewer processes is reported as incomplete: its timing
+measures a broken schedule, not the policy.
+
+    python benchmark.py -o bench.json
+    python benchmark.py --counts 1000,10000 --scales 1,100 --compare bench.json
+
+Results are written as JSON so two versions can be diffed with --compare.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import scheduler
+import workload
+from batch import default_last_instant
+
+DEFAULT_ALGORITHMS = "1,2-4,3,4,5,6,7,8-4"
+
+
+def make_workload(count, scale, seed=0):
+    """Seeded Poisson/exponential workload at ~75% load, times multiplied by `scale`"""
+    return [(name, arrival * scale, service * scale)
+            for name, arrival, service in workload.generate(count, "poisson", "exponential", seed)]
+
+
+def measure(algorithm_id, quantum, processes, last_instant, mode, repeat):
+    """Best wall time, peak traced memory, decision count and finished processes for one configuration"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = scheduler.execute_algorithm(algorithm_id, quantum, processes, last_instant, mode)
+        best = min(best, time.perf_counter() - start)
+    decisions = len(result["segments"])
+    finished = sum(1 for finish in result["finish"] if finish)
+    del result
+
+    # Memory is traced in a separate run so tracing overhead doesn't skew the timing
+    tracemalloc.start()
+    scheduler.execute_algorithm(algorithm_id, quantum, processes, last_instant, mode)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, decisions, finished
+
+
+def expected_finished(algorithm_id, processes):
+    """Processes a run must finish within default_last_instant(); Aging only finishes 4-field lines"""
+    if algorithm_id == 8:
+        return sum(1 for process in processes if len(process) == 4)
+    return len(processes)
+
+
+def run_benchmarks(algorithms, counts, scales, mode=scheduler.EVENTS, repeat=3, seed=0, progress=None):
+    rows = []
+    for count in counts:
+        for scale in scales:
+            processes = make_workload(count, scale, seed)
+            last_instant = default_last_instant(processes)
+            for algorithm_id, quantum in algorithms:
+                # Quanta scale with the workload so the schedule keeps its shape
+                scaled_quantum = quantum * scale if algorithm_id in (2, 8) else quantum
+                seconds, peak, decisions, finished = measure(algorithm_id, scaled_quantum, processes,
+                                                             last_instant, mode, repeat)
+                row = {
+                    "algorithm": scheduler.algorithm_name(algorithm_id, scaled_quantum),
+                    "algorithm_id": algorithm_id,
+                    "processes": count,
+                    "scale": scale,
+                    "last_instant": last_instant,
+                    "mode": mode,
+                    "seconds": seconds,
+                    "peak_bytes": peak,
+                    "decisions": decisions,
+                    "decisions_per_second": decisions / seconds if seconds else float("inf"),
+                    "finished": finished,
+                    "complete": finished >= expected_finished(algorithm_id, processes),
+                }
+                rows.append(row)
+                if progress:
+                    progress(row)
+    return rows
+
+
+def _row_key(row):
+    return row["algorithm_id"], row["processes"], row["scale"], row["mode"]
+
+
+def format_row(row):
+    return (f"{row['algorithm']:<10} n={row['processes']:<8} T={row['last_instant']:<12} "
+            f"{row['seconds'] * 1000:10.2f} ms {row['peak_bytes'] / 1024:10.1f} KiB "
+            f"{row['decisions_per_second']:12.0f} dec/s {row['finished']:>8} done"
+            + ("" if row["complete"] else "  <-- incomplete"))
+
+
+def format_comparison(old_rows, new_rows):
+    """Per-configuration time and memory ratios (new / old) for rows present in both runs"""
+    old = {_row_key(row): row for row in old_rows}
+    lines = [f"{'Policy':<10} {'n':>8} {'T':>12} {'time x':>8} {'mem x':>8}"]
+    for row in new_rows:
+        before = old.get(_row_key(row))
+        if not before:
+            continue
+        time_ratio = row["seconds"] / before["seconds"] if before["seconds"] else float("inf")
+        memory_ratio = row["peak_bytes"] / before["peak_bytes"] if before["peak_bytes"] else float("inf")
+        flag = "  <-- slower" if time_ratio > 1.2 else ""
+        lines.append(f"{row['algorithm']:<10} {row['processes']:>8} {row['last_instant']:>12} "
+                     f"{time_ratio:8.2f} {memory_ratio:8.2f}{flag}")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the scheduling policies.")
+    parser.add_argument("-a", "--algorithms", default=DEFAULT_ALGORITHMS,
+                        help=f"algorithm list as in the main.exe input (default: {DEFAULT_ALGORITHMS})")
+    parser.add_argument("--counts", default="100,1000", help="comma-separated process counts")
+    parser.add_argument("--scales", default="1,10", help="comma-separated time scale factors")
+    parser.add_argument("--mode", choices=[scheduler.EVENTS, scheduler.TICK], default=scheduler.EVENTS)
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per configuration (best is kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="previous results file to diff against")
+    args = parser.parse_args(argv)
+
+    rows = run_benchmarks(scheduler.parse_algorithms(args.algorithms),
+                          [int(c) for c in args.counts.split(",")],
+                          [int(s) for s in args.scales.split(",")],
+                          args.mode, args.repeat, args.seed,
+                          progress=lambda row: print(format_row(row), flush=True))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"python": platform.python_version(), "platform": platform.platform(),
+                       "runs": rows}, f, indent=1)
+    if args.compare:
+        with open(args.compare) as f:
+            old_rows = json.load(f)["runs"]
+        print()
+        sys.stdout.write(format_comparison(old_rows, rows))
+    incomplete = [row for row in rows if not row["complete"]]
+    if incomplete:
+        sys.exit(f"{len(incomplete)} run(s) finished fewer processes than the horizon allows; "
+                 f"their timings are not comparable")
+
+
+if __name__ == "__main__":
+    main()
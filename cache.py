@@ -0,0 +1,113 @@
+"""Memoized scheduling results.
+
+Results are keyed on a SHA-256 of the canonical (processes, last_instant,
+algorithm id, quantum) tuple. Recently used results are kept in memory up
+to a fixed number of entries. With a directory, every result is also
+written there as a JSON record, so later sessions and other processes can
+reuse it. The simulation mode is not part of the key: both modes give
+identical results.
+
+    cache = ResultCache(max_entries=64, directory=".sched-cache")
+    result = cache.execute(2, 4, processes, 100)
+    print(cache.stats)
+
+Cached results are shared between callers and must not be modified.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+import scheduler
+
+
+def result_key(processes, last_instant, algorithm_id, quantum):
+    """Canonical hash of one scheduling job"""
+    canonical = json.dumps([[list(process) for process in processes], last_instant, algorithm_id, quantum],
+                           separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class ResultCache:
+    """LRU of result dicts with an optional on-disk store behind it"""
+
+    def __init__(self, max_entries=128, directory=None):
+        self.max_entries = max_entries
+        self.directory = directory
+        self.entries = OrderedDict()
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+        self.lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".json")
+
+    def _remember(self, key, result):
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def get(self, key):
+        """Cached result for `key`, or None"""
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return self.entries[key]
+        if self.directory and os.path.exists(self._path(key)):
+            try:
+                with open(self._path(key)) as f:
+                    result = scheduler.record_to_result(json.load(f))
+            except (OSError, ValueError, KeyError):
+                result = None  # unreadable or half-written entry: recompute it
+            if result is not None:
+                with self.lock:
+                    self.stats["disk_hits"] += 1
+                    self._remember(key, result)
+                return result
+        with self.lock:
+            self.stats["misses"] += 1
+        return None
+
+    def put(self, key, result):
+        with self.lock:
+            self._remember(key, result)
+        if self.directory:
+            # Write to a temporary file first so readers never see a partial record
+            fd, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(scheduler.result_to_record(result), f, separators=(",", ":"))
+            os.replace(temporary, self._path(key))
+
+    def execute(self, algorithm_id, quantum, processes, last_instant, mode=scheduler.EVENTS, progress=None):
+        """scheduler.execute_algorithm(), answered from the cache when possible"""
+        key = result_key(processes, last_instant, algorithm_id, quantum)
+        result = self.get(key)
+        if result is None:
+            result = scheduler.execute_algorithm(algorithm_id, quantum, processes, last_instant, mode, progress)
+            self.put(key, result)
+        return result
+
+    def schedule(self, processes, last_instant, algorithms, mode=scheduler.EVENTS, progress=None):
+        """scheduler.schedule(), answered from the cache when possible"""
+        return [self.execute(algorithm_id, quantum, processes, last_instant, mode, progress)
+                for algorithm_id, quantum in algorithms]
+
+    def clear(self):
+        """Drop the in-memory entries (the on-disk store is left alone)"""
+        with self.lock:
+            self.entries.clear()
+
+    def describe(self):
+        """One-line hit/miss summary"""
+        stats = self.stats
+        lookups = stats["hits"] + stats["disk_hits"] + stats["misses"]
+        rate = 100.0 * (stats["hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        return (f"cache: {stats['hits']} hits, {stats['disk_hits']} disk hits, {stats['misses']} misses "
+                f"({rate:.0f}% hit rate), {len(self.entries)}/{self.max_entries} entries")
@@ -0,0 +1,106 @@
+"""Run several scheduling policies on the same workload side by side.
+
+Each policy runs in its own worker process, so comparing all eight costs
+about as much wall time as the slowest one instead of the sum of them.
+
+    python compare.py < input.txt
+
+reads the usual main.exe input (with a comma-separated algorithm list)
+and prints the comparison table.
+"""
+
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import scheduler
+from cache import result_key
+from process_table import ProcessTable
+
+# What clicking each entry of the GUI's algorithm list runs
+ALL_ALGORITHMS = scheduler.parse_algorithms("1,2,3,4,5,6,7,8")
+
+
+def algorithms_with_quantum(quantum=None):
+    """ALL_ALGORITHMS, with RR and Aging using `quantum` instead of their default"""
+    if quantum is None:
+        return ALL_ALGORITHMS
+    return [(algorithm_id, quantum if algorithm_id in scheduler.QUANTUM_POLICIES else default)
+            for algorithm_id, default in ALL_ALGORITHMS]
+
+
+def summarize(result):
+    """Mean turnaround / normalized turnaround row for one result"""
+    metrics = ProcessTable.from_result(result).summary(percentiles=())
+    return {
+        "name": result["name"],
+        "algorithm_id": result["algorithm_id"],
+        "quantum": result["quantum"],
+        "mean_turnaround": metrics["mean_turnaround"],
+        "mean_norm_turn": metrics["mean_norm_turn"],
+        "finished": metrics["finished"],
+        "processes": metrics["processes"],
+    }
+
+
+def _compare_one(job):
+    algorithm_id, quantum, processes, last_instant = job
+    return summarize(scheduler.execute_algorithm(algorithm_id, quantum, processes, last_instant))
+
+
+def _execute_one(job):
+    algorithm_id, quantum, processes, last_instant = job
+    return scheduler.execute_algorithm(algorithm_id, quantum, processes, last_instant)
+
+
+def compare_algorithms(processes, last_instant, algorithms=ALL_ALGORITHMS, max_workers=None, cache=None):
+    """Summary rows for every (algorithm_id, quantum), in the order given
+
+    Policies run concurrently in a process pool; max_workers=1 runs them
+    one after another in this process. With a cache.ResultCache, cached
+    policies are not rerun and the others' full results are added to it.
+    """
+    jobs = [(algorithm_id, quantum, processes, last_instant) for algorithm_id, quantum in algorithms]
+    if cache is not None:
+        return _compare_cached(jobs, max_workers, cache)
+    if max_workers == 1 or len(jobs) <= 1:
+        return [_compare_one(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_compare_one, jobs))
+
+
+def _compare_cached(jobs, max_workers, cache):
+    keys = [result_key(processes, last_instant, algorithm_id, quantum)
+            for algorithm_id, quantum, processes, last_instant in jobs]
+    results = [cache.get(key) for key in keys]
+    missing = [i for i, result in enumerate(results) if result is None]
+    if max_workers == 1 or len(missing) <= 1:
+        computed = [_execute_one(jobs[i]) for i in missing]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            computed = list(pool.map(_execute_one, [jobs[i] for i in missing]))
+    for i, result in zip(missing, computed):
+        cache.put(keys[i], result)
+        results[i] = result
+    return [summarize(result) for result in results]
+
+
+def format_comparison(rows):
+    """Side-by-side table of the summary rows"""
+    lines = ["Policy     |  Mean TAT | Mean NormTurn | Finished",
+             "-----------+-----------+---------------+---------"]
+    for row in rows:
+        # RR's name carries its quantum already; Aging's does not
+        name = f"{row['name']}-{row['quantum']}" if row["algorithm_id"] == 8 else row["name"]
+        lines.append(f"{name:<11}|{row['mean_turnaround']:10.2f} |{row['mean_norm_turn']:14.2f} |"
+                     f" {row['finished']}/{row['processes']}")
+    complete = [row for row in rows if row["processes"] and row["finished"] == row["processes"]]
+    if complete:
+        best = min(complete, key=lambda row: row["mean_turnaround"])
+        lines.append("")
+        lines.append(f"Lowest mean turnaround: {best['name']}")
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    _, algorithms, last_instant, processes = scheduler.parse_input(sys.stdin.read())
+    print(format_comparison(compare_algorithms(processes, last_instant, algorithms)), end="")
@@ -0,0 +1,302 @@
+"""Virtualized Gantt chart canvas.
+
+Only the bars inside the visible time/process window are drawn, so the
+number of canvas items depends on the window size rather than on the
+length of the schedule. Items are kept in pools and moved or recoloured
+on every redraw instead of being deleted and recreated. The view scrolls
+horizontally and vertically and zooms around the mouse pointer.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from bisect import bisect_right
+
+from profiling import profiler
+
+LABEL_WIDTH = 40    # process name column, left of the time axis
+HEADER_HEIGHT = 50  # title and time axis, above the first row
+ROW_HEIGHT = 30
+ROW_GAP = 3
+MIN_ZOOM = 0.001    # pixels per time unit
+MAX_ZOOM = 200.0
+DEFAULT_ZOOM = 25.0
+MIN_MARK_WIDTH = 12  # narrower bars are drawn without their '*' / '.' marker
+
+
+def visible_runs(lane, starts, t0, t1, min_width):
+    """Segments of one lane overlapping [t0, t1) as (start, end, mark) bars
+
+    `starts` holds the start of every segment in `lane`. Segments narrower
+    than `min_width` time units are merged with their neighbours, and the
+    merged bar's mark is None, so at most one bar is drawn per pixel.
+    """
+    runs = []
+    i = max(bisect_right(starts, t0) - 1, 0)
+    while i < len(lane) and lane[i][0] < t1:
+        start, end, mark = lane[i]
+        i += 1
+        if end <= t0:
+            continue
+        if runs:
+            last_start, last_end, last_mark = runs[-1]
+            narrow = end - start < min_width or last_end - last_start < min_width
+            if narrow and start - last_end < min_width:
+                runs[-1] = (last_start, end, None)
+                continue
+        runs.append((start, end, mark))
+    return runs
+
+
+def _tick_step(zoom, min_spacing=20):
+    """Smallest 1, 2 or 5 x 10^k time step whose axis labels are min_spacing pixels apart"""
+    step = 1
+    while True:
+        for factor in (1, 2, 5):
+            if step * factor * zoom >= min_spacing:
+                return step * factor
+        step *= 10
+
+
+class _ItemPool:
+    """Canvas items of one kind, reused across redraws instead of deleted and recreated"""
+
+    def __init__(self, canvas, kind, tag):
+        self.canvas = canvas
+        self.create = getattr(canvas, "create_" + kind)
+        self.tag = tag
+        self.items = []
+        self.used = 0
+        self.shown = 0
+
+    def begin(self):
+        self.used = 0
+
+    def take(self, coords, **options):
+        if self.used < len(self.items):
+            item = self.items[self.used]
+            self.canvas.coords(item, *coords)
+            if self.used >= self.shown:
+                options["state"] = "normal"
+            self.canvas.itemconfigure(item, **options)
+        else:
+            item = self.create(*coords, tags=(self.tag,), **options)
+            self.items.append(item)
+        self.used += 1
+        return item
+
+    def finish(self):
+        for item in self.items[self.used:self.shown]:
+            self.canvas.itemconfigure(item, state="hidden")
+        self.shown = self.used
+
+
+class GanttView(tk.Frame):
+    """Scrollable, zoomable Gantt chart of (start, end, mark) lanes"""
+
+    def __init__(self, master, color_for=None, **canvas_options):
+        super().__init__(master, bg=canvas_options.get("bg", "#ffffff"))
+        self.canvas = tk.Canvas(self, **canvas_options)
+        self.xscroll = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.xview)
+        self.yscroll = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.yscroll.grid(row=0, column=1, sticky="ns")
+        self.xscroll.grid(row=1, column=0, sticky="ew")
+        toolbar = tk.Frame(self, bg=self["bg"])
+        toolbar.grid(row=2, column=0, columnspan=2, sticky="w")
+        for text, command in (("−", lambda: self.zoom_by(0.8)), ("+", lambda: self.zoom_by(1.25)),
+                              ("Fit", self.zoom_to_fit)):
+            ttk.Button(toolbar, text=text, width=4, command=command).pack(side=tk.LEFT, padx=2, pady=2)
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.color_for = color_for or (lambda name: "#3498db")
+        self.last_instant = 0
+        self.names = []
+        self.lanes = []
+        self.starts = []
+        self.zoom = DEFAULT_ZOOM
+        self.view_start = 0.0  # first visible time unit
+        self.first_row = 0
+        self._redraw_pending = False
+
+        # Pools in stacking order, bottom to top
+        self._pools = {}
+        for name, kind in (("grid", "line"), ("bar", "rectangle"), ("highlight", "rectangle"),
+                           ("mark", "text"), ("axis", "text"),
+                           ("row_label", "rectangle"), ("row_text", "text"), ("title", "text")):
+            self._pools[name] = _ItemPool(self.canvas, kind, "gantt_" + name)
+
+        self.canvas.bind("<Configure>", lambda event: self.redraw())
+        self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Shift-MouseWheel>", lambda event: self._on_wheel(event, horizontal=True))
+        self.canvas.bind("<Control-MouseWheel>", self._on_zoom_wheel)
+        # X11 reports the wheel as buttons 4 and 5
+        self.canvas.bind("<Button-4>", lambda event: self.yview("scroll", -1, "units"))
+        self.canvas.bind("<Button-5>", lambda event: self.yview("scroll", 1, "units"))
+        self.canvas.bind("<Shift-Button-4>", lambda event: self.xview("scroll", -1, "units"))
+        self.canvas.bind("<Shift-Button-5>", lambda event: self.xview("scroll", 1, "units"))
+        self.canvas.bind("<Control-Button-4>", lambda event: self.zoom_by(1.25, event.x))
+        self.canvas.bind("<Control-Button-5>", lambda event: self.zoom_by(0.8, event.x))
+
+    # -- data ---------------------------------------------------------------
+
+    def set_data(self, last_instant, lanes):
+        """Show a new schedule: `lanes` maps process name -> [(start, end, mark)] in time order"""
+        self.last_instant = last_instant
+        self.names = list(lanes)
+        self.lanes = [list(lane) for lane in lanes.values()]
+        self.starts = [[start for start, _, _ in lane] for lane in self.lanes]
+        self.view_start = 0.0
+        self.first_row = 0
+        self.redraw()
+
+    def clear(self):
+        self.set_data(0, {})
+
+    # -- viewport -----------------------------------------------------------
+
+    def _plot_width(self):
+        return max(self.canvas.winfo_width() - LABEL_WIDTH, 1)
+
+    def _visible_rows(self):
+        return max((self.canvas.winfo_height() - HEADER_HEIGHT) // (ROW_HEIGHT + ROW_GAP), 1)
+
+    def _span(self):
+        """Time units visible at the current zoom"""
+        return self._plot_width() / self.zoom
+
+    def _clamp(self):
+        self.view_start = min(max(self.view_start, 0.0), max(self.last_instant - self._span(), 0.0))
+        self.first_row = min(max(self.first_row, 0), max(len(self.lanes) - self._visible_rows(), 0))
+
+    def xview(self, *args):
+        """Scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units" | "pages")"""
+        span = self._span()
+        if args[0] == "moveto":
+            self.view_start = float(args[1]) * self.last_instant
+        elif args[0] == "scroll":
+            step = span * 0.9 if args[2] == "pages" else max(span / 10, 1)
+            self.view_start += int(args[1]) * step
+        self.redraw()
+
+    def yview(self, *args):
+        rows = self._visible_rows()
+        if args[0] == "moveto":
+            self.first_row = int(round(float(args[1]) * len(self.lanes)))
+        elif args[0] == "scroll":
+            self.first_row += int(args[1]) * (max(rows - 1, 1) if args[2] == "pages" else 1)
+        self.redraw()
+
+    def zoom_by(self, factor, anchor_x=None):
+        """Zoom in (factor > 1) or out, keeping the time under anchor_x in place"""
+        if anchor_x is None:
+            anchor_x = LABEL_WIDTH + self._plot_width() / 2
+        offset = max(anchor_x - LABEL_WIDTH, 0)
+        anchor_time = self.view_start + offset / self.zoom
+        self.zoom = min(max(self.zoom * factor, MIN_ZOOM), MAX_ZOOM)
+        self.view_start = anchor_time - offset / self.zoom
+        self.redraw()
+
+    def zoom_to_fit(self):
+        if self.last_instant:
+            self.zoom = min(max(self._plot_width() / self.last_instant, MIN_ZOOM), MAX_ZOOM)
+        self.view_start = 0.0
+        self.redraw()
+
+    def _on_wheel(self, event, horizontal=False):
+        units = -1 if event.delta > 0 else 1
+        (self.xview if horizontal else self.yview)("scroll", units, "units")
+
+    def _on_zoom_wheel(self, event):
+        self.zoom_by(1.25 if event.delta > 0 else 0.8, event.x)
+
+    # -- drawing ------------------------------------------------------------
+
+    def redraw(self):
+        """Schedule a redraw; bursts of scroll events collapse into one"""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._draw)
+
+    def _draw(self):
+        with profiler.phase("gantt render", "render"):
+            self._draw_items()
+
+    def _draw_items(self):
+        self._redraw_pending = False
+        self._clamp()
+        canvas = self.canvas
+        pools = self._pools
+        for pool in pools.values():
+            pool.begin()
+
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
+        if not self.lanes:
+            pools["title"].take((width // 2, height // 2), text="No data to display",
+                                font=("Arial", 12), fill="#7f8c8d")
+        else:
+            self._draw_schedule(width)
+
+        for pool in pools.values():
+            pool.finish()
+        for pool in pools.values():
+            canvas.tag_raise(pool.tag)
+        self._update_scrollbars()
+
+    def _draw_schedule(self, width):
+        pools = self._pools
+        zoom = self.zoom
+        t0 = self.view_start
+        t1 = t0 + self._span()
+        rows = range(self.first_row, min(self.first_row + self._visible_rows() + 1, len(self.lanes)))
+        rows_bottom = HEADER_HEIGHT + len(rows) * (ROW_HEIGHT + ROW_GAP)
+
+        def x_of(time):
+            return LABEL_WIDTH + (time - t0) * zoom
+
+        # Time axis and grid lines
+        step = _tick_step(zoom)
+        tick = int(t0 // step) * step
+        while tick <= min(t1, self.last_instant):
+            if tick >= t0:
+                x = x_of(tick + 0.5) if step == 1 else x_of(tick)
+                pools["axis"].take((x, 35), text=str(tick % 10 if step == 1 else tick),
+                                   font=("Arial", 8, "bold"), fill="#34495e")
+                pools["grid"].take((x, 45, x, rows_bottom), fill="#bdc3c7", width=1)
+            tick += step
+
+        # One bar per visible (merged) run; marks only where they fit
+        min_width = 1.0 / zoom
+        for position, row in enumerate(rows):
+            name = self.names[row]
+            color = self.color_for(name)
+            y1 = HEADER_HEIGHT + position * (ROW_HEIGHT + ROW_GAP)
+            y2 = y1 + ROW_HEIGHT
+            for start, end, mark in visible_runs(self.lanes[row], self.starts[row], t0, t1, min_width):
+                x1 = max(x_of(start), LABEL_WIDTH)
+                x2 = min(x_of(end), width + 1)
+                pools["bar"].take((x1, y1, x2, y2), fill=color, outline="#2c3e50", width=1)
+                if x2 - x1 > 4:
+                    pools["highlight"].take((x1 + 1, y1 + 1, x2 - 1, y2 - 1), fill="", outline="white", width=1)
+                if mark and x2 - x1 >= MIN_MARK_WIDTH:
+                    pools["mark"].take(((x1 + x2) / 2, (y1 + y2) / 2), text=mark,
+                                       fill="white", font=("Arial", 8, "bold"))
+            # Process name label with background, frozen at the left edge
+            pools["row_label"].take((5, y1, LABEL_WIDTH - 5, y2), fill="#34495e", outline="#2c3e50")
+            pools["row_text"].take((LABEL_WIDTH // 2, (y1 + y2) // 2), text=name,
+                                   font=("Arial", 9, "bold"), fill="white")
+
+        pools["title"].take((width // 2, 15), text="Gantt Chart", font=("Arial", 12, "bold"), fill="#2c3e50")
+
+    def _update_scrollbars(self):
+        if self.last_instant:
+            first = self.view_start / self.last_instant
+            self.xscroll.set(first, min(first + self._span() / self.last_instant, 1.0))
+        else:
+            self.xscroll.set(0.0, 1.0)
+        if self.lanes:
+            first = self.first_row / len(self.lanes)
+            self.yscroll.set(first, min(first + self._visible_rows() / len(self.lanes), 1.0))
+        else:
+            self.yscroll.set(0.0, 1.0)
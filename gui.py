@@ -1,14 +1,40 @@
+import time
+STARTUP_NS = time.perf_counter_ns()  # startup is timed from here to the first idle window
+
+import sys
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox, font
+from tkinter import ttk, scrolledtext, messagebox, font, filedialog
 import subprocess
 import random
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.patches as patches
-import numpy as np
+import threading
+import queue
+import scheduler
+import smp
+from cache import ResultCache
+from profiling import profiler, format_phases
+from gantt_view import GanttView
+
+# NumPy (metrics, compare, sweep, trace_io) and matplotlib (timeline_view) are
+# imported by the functions that need them, so they load on first use rather
+# than before the window can show
+IMPORTED_NS = time.perf_counter_ns()
 
 color_map = {}
 
+# Engine results of recent runs, so rerunning or toggling between algorithms is instant
+result_cache = ResultCache(max_entries=64)
+
+# Results on screen, kept so File > Save Recording can store them with the workload
+shown_results = []
+shown_table = None  # imported_table when shown_results were computed, None for typed processes
+
+# Typed workloads are checked line by line and capped. A workload imported from
+# a trace or opened from a recording with more processes than that stays a
+# ProcessTable: the process text only shows a read-only preview of it, and the
+# workers convert it to process tuples. Clear All goes back to typed processes.
+MAX_TYPED_PROCESSES = 50
+imported_table = None
+
 def generate_color(name):
     if name not in color_map:
         color_map[name] = "#%06x" % random.randint(0x444444, 0xFFFFFF)
@@ -26,165 +52,67 @@ algorithm_names = [
     ("AGING", "Aging: Priorities increase over time.")
 ]
 
-def parse_output_for_gantt(output):
-    lines = output.strip().split("\n")
-    process_blocks = {}
-    time_line = []
-
-    in_gantt = False
-    for line in lines:
-        if any(alg in line for alg, _ in algorithm_names if alg):
-            time_line = line.strip().split()[1:]
-            in_gantt = True
-        elif in_gantt and '|' in line:
-            parts = line.strip().split()
-            if len(parts) > 1:
-                pname = parts[0]
-                bars = ''.join(parts[1:]).replace('|', '')
-                process_blocks[pname] = list(bars)
-        elif in_gantt and '-' in line:
-            continue
-    return time_line, process_blocks
-
-def parse_scheduling_metrics(output):
-    """Parse scheduling metrics from output for timeline graph"""
-    lines = output.strip().split("\n")
-    processes = {}
-    
-    # Look for process completion information
-    for line in lines:
-        if "Process" in line and ("finished" in line or "completed" in line):
-            # Try to extract process completion data
-            parts = line.split()
-            if len(parts) >= 4:
-                process_name = parts[1]
-                # Extract timing information if available
-                for i, part in enumerate(parts):
-                    if part.isdigit():
-                        processes[process_name] = {"completion_time": int(part)}
-    
-    return processes
-
-def draw_gantt_chart(time_line, process_blocks):
-    canvas.delete("all")
-    
-    if not process_blocks:
-        canvas.create_text(250, 150, text="No data to display", 
-                          font=("Arial", 12), fill="#7f8c8d")
+def result_to_gantt(result):
+    """Convert an engine result into the (last_instant, lanes) pair the charts draw"""
+    lanes = {process[0]: lane for process, lane in zip(result["processes"], scheduler.process_segments(result))}
+    if result.get("cpus", 1) > 1:
+        # Below the process lanes, one lane per CPU labelled with what it ran
+        lanes.update(smp.cpu_lanes(result))
+    return result["last_instant"], lanes
+
+def start_main_exe():
+    """Start the compiled C++ backend; feed it with communicate(), kill() it to cancel"""
+    return subprocess.Popen(["main.exe"], stdin=subprocess.PIPE,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+def draw_gantt_chart(last_instant, lanes):
+    """Show the lanes in the Gantt tab; only the visible window is drawn"""
+    gantt_view.set_data(last_instant, lanes)
+
+# Created on the first visit to the Timeline tab; until then only the data is kept
+timeline_graph = None
+timeline_data = (0, {})
+
+def create_timeline_graph(last_instant, lanes):
+    """Update the timeline graph in place"""
+    global timeline_data
+    timeline_data = (last_instant, lanes)
+    if timeline_graph is None:
         return
-    
-    cell_width = 25
-    cell_height = 30
-    padding = 40
-    
-    # Draw title
-    canvas.create_text(250, 15, text="Gantt Chart", 
-                      font=("Arial", 12, "bold"), fill="#2c3e50")
-    
-    # Draw time axis
-    if time_line:
-        for i, time in enumerate(time_line):
-            if i * cell_width + padding < 480:  # Fit within canvas width
-                x = padding + i * cell_width + cell_width // 2
-                canvas.create_text(x, 35, text=str(time), 
-                                 font=("Arial", 8, "bold"), fill="#34495e")
-                # Draw vertical grid lines
-                canvas.create_line(x, 45, x, 45 + len(process_blocks) * (cell_height + 3), 
-                                 fill="#bdc3c7", width=1)
-    
-    # Draw process blocks with enhanced styling
-    for row_index, (pname, bars) in enumerate(process_blocks.items()):
-        color = generate_color(pname)
-        y_offset = 50 + row_index * (cell_height + 3)
-        
-        # Process name label with background
-        canvas.create_rectangle(5, y_offset, 35, y_offset + cell_height, 
-                              fill="#34495e", outline="#2c3e50")
-        canvas.create_text(20, y_offset + cell_height//2, text=pname, 
-                          font=("Arial", 9, "bold"), fill="white")
-        
-        for col_index, mark in enumerate(bars):
-            if mark in '*.' or mark.strip():
-                if col_index * cell_width + padding < 480:  # Fit within canvas
-                    x1 = padding + col_index * cell_width
-                    y1 = y_offset
-                    x2 = x1 + cell_width
-                    y2 = y1 + cell_height
-                    
-                    # Create gradient effect
-                    canvas.create_rectangle(x1, y1, x2, y2, 
-                                          fill=color, outline="#2c3e50", width=1)
-                    # Add inner highlight
-                    canvas.create_rectangle(x1+1, y1+1, x2-1, y2-1, 
-                                          fill="", outline="white", width=1)
-                    
-                    # Process execution marker
-                    canvas.create_text((x1 + x2)//2, (y1 + y2)//2, text=mark, 
-                                     fill="white", font=("Arial", 8, "bold"))
-
-def create_timeline_graph(time_line, process_blocks):
-    """Create a timeline graph using matplotlib"""
     try:
-        # Clear previous plot
-        for widget in timeline_frame.winfo_children():
-            if isinstance(widget, tk.Canvas):
-                widget.destroy()
-        
-        if not process_blocks:
-            return
-        
-        fig, ax = plt.subplots(figsize=(6, 4))
-        fig.patch.set_facecolor('#ecf0f1')
-        
-        processes = list(process_blocks.keys())
-        colors = [generate_color(p) for p in processes]
-        
-        # Create timeline bars
-        for i, (process, bars) in enumerate(process_blocks.items()):
-            y_pos = i
-            for j, mark in enumerate(bars):
-                if mark in '*.' or mark.strip():
-                    rect = patches.Rectangle((j, y_pos), 1, 0.8, 
-                                           linewidth=1, edgecolor='black', 
-                                           facecolor=generate_color(process), alpha=0.8)
-                    ax.add_patch(rect)
-                    # Add process label in the center
-                    ax.text(j + 0.5, y_pos + 0.4, mark, ha='center', va='center', 
-                           fontweight='bold', color='white', fontsize=8)
-        
-        # Customize the plot
-        ax.set_xlim(0, len(time_line) if time_line else 10)
-        ax.set_ylim(-0.5, len(processes) - 0.5)
-        ax.set_xlabel('Time Units', fontweight='bold', fontsize=9)
-        ax.set_ylabel('Processes', fontweight='bold', fontsize=9)
-        ax.set_title('Process Timeline', fontweight='bold', pad=15, fontsize=10)
-        
-        # Set y-axis labels
-        ax.set_yticks(range(len(processes)))
-        ax.set_yticklabels(processes)
-        
-        # Set x-axis labels
-        if time_line:
-            ax.set_xticks(range(len(time_line)))
-            ax.set_xticklabels(time_line)
-        
-        # Add grid
-        ax.grid(True, alpha=0.3)
-        ax.set_axisbelow(True)
-        
-        # Adjust layout for smaller space
-        plt.tight_layout()
-        
-        # Embed the plot in tkinter
-        canvas_widget = FigureCanvasTkAgg(fig, timeline_frame)
-        canvas_widget.draw()
-        canvas_widget.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        plt.close(fig)  # Close the figure to free memory
-        
+        timeline_graph.set_data(last_instant, lanes)
     except Exception as e:
         print(f"Error creating timeline graph: {e}")
 
+def load_timeline():
+    """Build the matplotlib timeline and show the latest schedule on it"""
+    global timeline_graph
+    if timeline_graph is not None:
+        return
+    with profiler.phase("load timeline", "render"):
+        from timeline_view import TimelineGraph
+        timeline_placeholder.destroy()
+        timeline_graph = TimelineGraph(timeline_frame, color_for=generate_color)
+    create_timeline_graph(*timeline_data)
+
+def on_chart_tab_changed(event):
+    if timeline_graph is None and chart_notebook.select() == str(timeline_frame):
+        # After the idle redraw, so the tab shows its placeholder while matplotlib loads
+        root.after_idle(load_timeline)
+
+def startup_finished(built_ns):
+    """Record the startup phases once the window has drawn and is idle"""
+    shown_ns = time.perf_counter_ns()
+    profiler.record("import modules", STARTUP_NS, IMPORTED_NS, "startup")
+    profiler.record("build window", IMPORTED_NS, built_ns, "startup")
+    profiler.record("first paint", built_ns, shown_ns, "startup")
+    startup_ms = (shown_ns - STARTUP_NS) / 1e6
+    show_profile()
+    status_var.set(f"Ready (started in {startup_ms:.0f} ms)")
+    if "--startup-time" in sys.argv:
+        print(f"Startup: {startup_ms:.1f} ms")
+        root.destroy()
+
 def animate_button(button):
     """Simple button animation effect"""
     original_bg = button.cget("bg")
@@ -209,26 +137,41 @@ def validate_inputs():
     """Validate user inputs before running scheduler"""
     try:
         total_time = int(time_entry.get())
+        if total_time <= 0:
+            raise ValueError("Values must be positive")
+
+        if not cpus_entry.get().strip().isdigit() or int(cpus_entry.get()) < 1:
+            raise ValueError("CPUs must be a positive integer")
+
+        quantum = quantum_entry.get().strip()
+        if quantum and (not quantum.isdigit() or int(quantum) < 1):
+            raise ValueError("Quantum must be a positive integer")
+
+        if imported_table is not None:
+            # Checked when it was imported; only the typed lines need checking
+            return True
+
         process_count = int(process_count_entry.get())
-        
-        if total_time <= 0 or process_count <= 0:
+        if process_count <= 0:
             raise ValueError("Values must be positive")
         
-        if process_count > 50:  # Reasonable upper limit
-            raise ValueError("Too many processes (max 50)")
+        if process_count > MAX_TYPED_PROCESSES:  # Reasonable upper limit
+            raise ValueError(f"Too many processes (max {MAX_TYPED_PROCESSES}); "
+                             f"import larger workloads from the File menu")
             
         process_data = process_text.get("1.0", tk.END).strip().split("\n")
         valid_lines = [line for line in process_data if line.strip()]
-        
+
         if len(valid_lines) != process_count:
             raise ValueError(f"Process count mismatch: expected {process_count}, got {len(valid_lines)}")
         
         for line_num, line in enumerate(valid_lines, 1):
             parts = line.split(",")
-            if len(parts) != 3:
-                raise ValueError(f"Line {line_num}: Invalid format (need name,arrival,service)")
+            if len(parts) not in (3, 4):
+                raise ValueError(f"Line {line_num}: Invalid format (need name,arrival,service "
+                                 f"or name,arrival,priority,service)")
             
-            name, arrival, service = parts
+            name, arrival, service = parts[0], parts[1], parts[-1]
             if not name.strip():
                 raise ValueError(f"Line {line_num}: Process name cannot be empty")
             
@@ -246,20 +189,352 @@ def validate_inputs():
                            f"Please check your inputs:\n{str(e)}")
         return False
 
+def process_lines(processes):
+    """name,arrival,service (or name,arrival,priority,service) lines for process tuples"""
+    return [",".join(str(field) for field in process) for process in processes]
+
+def workload_source():
+    """The current workload for a worker: the imported ProcessTable, or the typed lines"""
+    if imported_table is not None:
+        return imported_table
+    return [line for line in process_text.get("1.0", tk.END).strip().split("\n") if line.strip()]
+
+def workload_processes(source):
+    """Process tuples for a workload_source() (called on the worker thread)"""
+    if isinstance(source, list):
+        return scheduler.parse_processes(source)
+    return source.to_processes()
+
+# Background runs: a worker thread never touches Tk. It posts (function, args)
+# calls to the run's queue and the Tk thread polls and executes them.
+POLL_INTERVAL_MS = 50
+PARTIAL_INTERVAL = 0.5  # seconds between streamed partial timelines
+PROFILE_REFRESH_MS = 250  # delay before the Profile tab shows a finished run
+
+active_run = None
+
+def post(run, function, *args):
+    """Queue function(*args) to be called on the Tk thread"""
+    run["calls"].put((function, args))
+
+def start_background(worker, *args, determinate=True):
+    """Start worker(run, *args) on a daemon thread and poll its queue from the Tk thread"""
+    global active_run
+    run = {"cancel": threading.Event(), "calls": queue.Queue(), "process": None,
+           "partial_segments": [], "last_partial": 0.0}
+    active_run = run
+    profiler.start_run()
+    run_button.configure(state=tk.DISABLED)
+    compare_button.configure(state=tk.DISABLED)
+    sweep_button.configure(state=tk.DISABLED)
+    cancel_button.configure(state=tk.NORMAL)
+    progress_var.set(0)
+    if determinate:
+        progress_bar.configure(mode="determinate")
+    else:
+        progress_bar.configure(mode="indeterminate")
+        progress_bar.start(15)
+    threading.Thread(target=worker, args=(run, *args), daemon=True).start()
+    root.after(POLL_INTERVAL_MS, poll_background, run)
+
+def poll_background(run):
+    while True:
+        try:
+            function, args = run["calls"].get_nowait()
+        except queue.Empty:
+            break
+        function(*args)
+    if active_run is run:
+        root.after(POLL_INTERVAL_MS, poll_background, run)
+
+def finish_background(run):
+    global active_run
+    if active_run is run:
+        active_run = None
+    progress_bar.stop()
+    progress_bar.configure(mode="determinate")
+    progress_var.set(0)
+    run_button.configure(state=tk.NORMAL)
+    compare_button.configure(state=tk.NORMAL)
+    sweep_button.configure(state=tk.NORMAL)
+    cancel_button.configure(state=tk.DISABLED)
+    # After the charts' idle redraws, so their render phases are in the table
+    root.after(PROFILE_REFRESH_MS, show_profile)
+    root.after(3000, lambda: status_var.set("Ready") if active_run is None else None)
+
+def show_profile():
+    profile_area.delete("1.0", tk.END)
+    profile_area.insert(tk.END, format_phases(profiler.run_events()))
+
+def toggle_profiling():
+    if profile_var.get():
+        profiler.enable(track_memory=memory_var.get())
+    else:
+        profiler.disable()
+    memory_check.configure(state=tk.DISABLED if profile_var.get() else tk.NORMAL)
+
+def export_trace():
+    path = filedialog.asksaveasfilename(title="Export Chrome Trace", defaultextension=".json",
+                                        filetypes=[("Trace JSON", "*.json"), ("All files", "*.*")])
+    if not path:
+        return
+    try:
+        profiler.export_chrome_trace(path)
+        status_var.set(f"Trace written to {path} (open it in chrome://tracing or Perfetto)")
+    except OSError as e:
+        messagebox.showerror("Export Error", str(e))
+
+def cancel_run():
+    """Stop the running job: the engine checks the flag, main.exe is killed"""
+    run = active_run
+    if run is None:
+        return
+    run["cancel"].set()
+    if run["process"] is not None:
+        run["process"].kill()
+    status_var.set("Cancelling...")
+
+def show_partial(run, header, start, chunk):
+    """Merge newly streamed segments into the charts while the engine is still running"""
+    segments = run["partial_segments"]
+    del segments[start:]
+    segments.extend(chunk)
+    if segments and header["last_instant"]:
+        progress_var.set(100.0 * segments[-1][2] / header["last_instant"])
+    with profiler.phase("chart data", "render"):
+        last_instant, lanes = result_to_gantt(dict(header, segments=segments))
+    draw_gantt_chart(last_instant, lanes)
+    with profiler.phase("timeline update", "render"):
+        create_timeline_graph(last_instant, lanes)
+
+def metrics_report(results):
+    """Metrics tab text for a run (built on the worker thread)"""
+    import metrics
+    return "\n".join(metrics.format_metrics(result) for result in results)
+
+def show_results(output, results, report=""):
+    global shown_results, shown_table
+    shown_results = results
+    shown_table = imported_table
+    output_area.delete("1.0", tk.END)
+    output_area.insert(tk.END, output)
+    metrics_area.delete("1.0", tk.END)
+    metrics_area.insert(tk.END, report)
+    if results:
+        with profiler.phase("chart data", "render"):
+            last_instant, lanes = result_to_gantt(results[0])
+        draw_gantt_chart(last_instant, lanes)
+        with profiler.phase("timeline update", "render"):
+            create_timeline_graph(last_instant, lanes)
+    output_area.see(tk.END)
+    status_var.set(f"Scheduler completed successfully! ({result_cache.describe()})")
+
+def show_error(title, message):
+    output_area.delete("1.0", tk.END)
+    output_area.insert(tk.END, f"{title}:\n{message}")
+    output_area.see(tk.END)
+    status_var.set("Error occurred!")
+
+def report_phases(run, operation, results):
+    """Format the output and the metrics report, timing each (worker thread)"""
+    with profiler.phase("format output"):
+        output = scheduler.format_output(operation, results)
+    with profiler.phase("metrics"):
+        report = metrics_report(results)
+    post(run, show_results, output, results, report)
+
+def show_cancelled():
+    status_var.set("Run cancelled")
+
+def engine_worker(run, operation, algorithms, last_instant, source):
+    """Schedule with the Python engine, streaming the growing timeline as it goes"""
+    def progress(result):
+        if run["cancel"].is_set():
+            return False
+        now = time.monotonic()
+        if now - run["last_partial"] >= PARTIAL_INTERVAL:
+            # Only segments from the last one sent on: earlier ones never change
+            start = max(run["sent"] - 1, 0)
+            segments = result["segments"]
+            header = {"processes": result["processes"], "last_instant": result["last_instant"],
+                      "finish": list(result["finish"])}
+            post(run, show_partial, run, header, start, segments[start:])
+            run["sent"] = len(segments)
+            run["last_partial"] = now
+        return True
+
+    run["sent"] = 0
+    try:
+        with profiler.phase("parse input"):
+            processes = workload_processes(source)
+        with profiler.phase("schedule", "engine"):
+            results = result_cache.schedule(processes, last_instant, algorithms, progress=progress)
+        report_phases(run, operation, results)
+    except scheduler.Cancelled:
+        post(run, show_cancelled)
+    except Exception as e:
+        post(run, show_error, "Error running scheduler", str(e))
+    finally:
+        post(run, finish_background, run)
+
+def smp_worker(run, operation, algorithms, last_instant, source, cpus, queues):
+    """Schedule on several CPUs with the SMP simulator"""
+    def progress(result):
+        return not run["cancel"].is_set()
+
+    try:
+        with profiler.phase("parse input"):
+            processes = workload_processes(source)
+        with profiler.phase("schedule", "smp"):
+            results = [smp.simulate(algorithm_id, quantum, processes, last_instant, cpus, queues,
+                                    progress=progress)
+                       for algorithm_id, quantum in algorithms]
+        report_phases(run, operation, results)
+    except scheduler.Cancelled:
+        post(run, show_cancelled)
+    except Exception as e:
+        post(run, show_error, "Error running scheduler", str(e))
+    finally:
+        post(run, finish_background, run)
+
+def main_exe_worker(run, operation, algorithm_chunk, last_instant, source):
+    """Schedule with main.exe; the process is killed if the run is cancelled"""
+    try:
+        lines = source if isinstance(source, list) else process_lines(source.to_processes())
+        json_input = f"{scheduler.JSON}\n{algorithm_chunk}\n{last_instant}\n{len(lines)}\n" + "\n".join(lines)
+        # main.exe parses, schedules and prints in one process: it is timed as a whole
+        with profiler.phase("main.exe", "backend"):
+            process = start_main_exe()
+            run["process"] = process
+            if run["cancel"].is_set():
+                process.kill()
+            output, error_output = process.communicate(json_input.encode())
+        output, error_output = output.decode(), error_output.decode()
+        if run["cancel"].is_set():
+            post(run, show_cancelled)
+        elif process.returncode != 0:
+            post(run, show_error, f"Error (Return code: {process.returncode})",
+                 f"STDOUT:\n{output}\nSTDERR:\n{error_output}")
+        else:
+            # Ask the backend for machine-readable output and render the text ourselves
+            with profiler.phase("parse output"):
+                results = scheduler.parse_json(output)
+            if not results:
+                # A main.exe built before the json operation prints nothing it can parse
+                raise ValueError("backend does not support json output; rebuild main.exe "
+                                 "(g++ -O2 -o main.exe main.cpp)")
+            report_phases(run, operation, results)
+    except Exception as e:
+        post(run, show_error, "Error running scheduler", str(e))
+    finally:
+        post(run, finish_background, run)
+
+def show_workload(table, last_instant):
+    """Make a ProcessTable the workload: typed lines if it is small, else kept as the table"""
+    global imported_table
+    count = len(table)
+    shown = min(count, MAX_TYPED_PROCESSES)
+    lines = process_lines(table.process(process_id) for process_id in range(shown))
+    imported_table = table if count > MAX_TYPED_PROCESSES else None
+    if imported_table is not None:
+        lines.append(f"... and {count - shown} more (imported, read-only; Clear All to type processes)")
+    process_text.configure(state=tk.NORMAL)
+    process_text.delete("1.0", tk.END)
+    process_text.insert("1.0", "\n".join(lines))
+    if imported_table is not None:
+        process_text.configure(state=tk.DISABLED)
+    process_count_entry.delete(0, tk.END)
+    process_count_entry.insert(0, str(count))
+    time_entry.delete(0, tk.END)
+    time_entry.insert(0, str(last_instant))
+
+def import_worker(run, path):
+    import trace_io
+    try:
+        with profiler.phase("import trace"):
+            table = trace_io.import_trace(path)
+        post(run, show_workload, table, trace_io.default_last_instant(table))
+        post(run, status_var.set, f"Imported {len(table)} processes from the trace")
+    except Exception as e:
+        post(run, show_error, "Error importing trace", str(e))
+    finally:
+        post(run, finish_background, run)
+
+def import_trace():
+    """Turn a process-accounting log into the workload"""
+    if active_run is not None:
+        return
+    path = filedialog.askopenfilename(title="Import Accounting Trace",
+                                      filetypes=[("CSV traces", "*.csv"), ("All files", "*.*")])
+    if path:
+        status_var.set("Importing trace...")
+        start_background(import_worker, path, determinate=False)
+
+def open_worker(run, operation, path):
+    """Load a recording and show its stored results without scheduling again"""
+    import trace_io
+    try:
+        with profiler.phase("load recording"):
+            recording = trace_io.load(path)
+            results = recording.results()
+        last_instant = results[0]["last_instant"] if results else trace_io.default_last_instant(recording.table)
+        post(run, show_workload, recording.table, last_instant)
+        if results:
+            report_phases(run, operation, results)
+        else:
+            post(run, status_var.set, f"Loaded {len(recording.table)} processes")
+    except Exception as e:
+        post(run, show_error, "Error opening recording", str(e))
+    finally:
+        post(run, finish_background, run)
+
+def open_recording():
+    global color_map
+    if active_run is not None:
+        return
+    path = filedialog.askopenfilename(title="Open Recording",
+                                      filetypes=[("Recordings", "*.sched"), ("All files", "*.*")])
+    if path:
+        color_map = {}
+        status_var.set("Opening recording...")
+        start_background(open_worker, operation_entry.get(), path, determinate=False)
+
+def save_recording():
+    """Save the workload, and the results on screen if they were computed for it"""
+    import trace_io
+    if imported_table is not None:
+        workload = imported_table
+        results = shown_results if shown_table is imported_table else []
+    else:
+        try:
+            workload = scheduler.parse_processes(workload_source())
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
+            return
+        # Every policy but Aging ran on the workload without its priorities
+        stripped = list(scheduler.strip_priorities(workload))
+        results = [result for result in shown_results if shown_table is None and
+                   result["processes"] == (workload if result["algorithm_id"] == 8 else stripped)]
+    path = filedialog.asksaveasfilename(title="Save Recording", defaultextension=".sched",
+                                        filetypes=[("Recordings", "*.sched"), ("All files", "*.*")])
+    if not path:
+        return
+    try:
+        trace_io.save_recording(path, workload, results)
+        status_var.set(f"Saved {len(workload)} processes and {len(results)} results to {path}")
+    except OSError as e:
+        messagebox.showerror("Save Error", str(e))
+
 def run_scheduler():
     global color_map
     
-    if not validate_inputs():
+    if active_run is not None or not validate_inputs():
         return
         
     color_map = {}
     
     # Animate button
     animate_button(run_button)
-    
-    # Show progress
-    status_var.set("Running scheduler...")
-    root.update()
 
     operation = operation_entry.get()
     algo_index = algo_combobox.current()
@@ -269,67 +544,111 @@ def run_scheduler():
         return
         
     algorithms = str(algo_index)
-    total_time = time_entry.get()
-    num_processes = process_count_entry.get()
-    process_data = process_text.get("1.0", tk.END).strip().split("\n")
-    
-    # Filter out empty lines
-    process_data = [line for line in process_data if line.strip()]
+    quantum = quantum_entry.get().strip()
+    if quantum and algo_index in scheduler.QUANTUM_POLICIES:
+        algorithms = f"{algo_index}-{quantum}"
+    last_instant = int(time_entry.get())
+    source = workload_source()
 
-    input_data = f"{operation}\n{algorithms}\n{total_time}\n{num_processes}\n" + "\n".join(process_data)
-    
     # Debug: Show input data in status
-    print(f"Input data:\n{input_data}")
+    if imported_table is None:
+        print(f"Input data:\n{operation}\n{algorithms}\n{last_instant}\n{len(source)}\n" + "\n".join(source))
 
+    output_area.delete("1.0", tk.END)
+    status_var.set("Running scheduler...")
+    cpus = int(cpus_entry.get())
+    if cpus > 1:
+        # main.exe only models one CPU, so several always go through the simulator
+        queues = smp.PER_CPU if queues_combobox.current() == 1 else smp.GLOBAL
+        start_background(smp_worker, operation, scheduler.parse_algorithms(algorithms), last_instant, source,
+                         cpus, queues, determinate=False)
+    elif backend_combobox.get() == "main.exe":
+        start_background(main_exe_worker, operation, algorithms, last_instant, source, determinate=False)
+    else:
+        start_background(engine_worker, operation, scheduler.parse_algorithms(algorithms), last_instant, source)
+
+def compare_worker(run, source, last_instant, quantum):
+    import compare
     try:
-        result = subprocess.run(
-            ["main.exe"],
-            input=input_data.encode(),
-            capture_output=True,
-            timeout=10  # Increased timeout for aging algorithm
-        )
-        
-        output = result.stdout.decode()
-        error_output = result.stderr.decode()
-        
-        output_area.delete("1.0", tk.END)
-        
-        if result.returncode != 0:
-            output_area.insert(tk.END, f"Error (Return code: {result.returncode}):\n")
-            output_area.insert(tk.END, f"STDOUT:\n{output}\n")
-            output_area.insert(tk.END, f"STDERR:\n{error_output}")
-            status_var.set("Scheduler failed!")
+        processes = workload_processes(source)
+        with profiler.phase("compare", "engine"):
+            rows = compare.compare_algorithms(processes, last_instant, compare.algorithms_with_quantum(quantum),
+                                              cache=result_cache)
+        if run["cancel"].is_set():
+            # Pool workers can't be interrupted; their rows are just dropped
+            post(run, show_cancelled)
         else:
-            output_area.insert(tk.END, output)
-            
-            time_line, process_blocks = parse_output_for_gantt(output)
-            draw_gantt_chart(time_line, process_blocks)
-            create_timeline_graph(time_line, process_blocks)
-            
-            status_var.set("Scheduler completed successfully!")
-        
-        # Ensure the text is visible and scrollable
-        output_area.see(tk.END)
-        output_area.update_idletasks()
-        
-        root.after(3000, lambda: status_var.set("Ready"))
-
-    except subprocess.TimeoutExpired:
-        output_area.delete("1.0", tk.END)
-        output_area.insert(tk.END, "Error: Scheduler timed out (took longer than 10 seconds)")
-        output_area.see(tk.END)
-        status_var.set("Timeout error!")
-        root.after(3000, lambda: status_var.set("Ready"))
+            post(run, show_comparison, compare.format_comparison(rows))
+    except Exception as e:
+        post(run, show_error, "Error comparing algorithms", str(e))
+    finally:
+        post(run, finish_background, run)
+
+def show_comparison(table):
+    output_area.delete("1.0", tk.END)
+    output_area.insert(tk.END, table)
+    output_area.see("1.0")
+    status_var.set("Comparison completed successfully!")
+
+def compare_all():
+    """Run every policy on the current workload in parallel and show a comparison table"""
+    if active_run is not None or not validate_inputs():
+        return
+
+    animate_button(compare_button)
+    status_var.set("Comparing all algorithms...")
+    # RR and Aging use the Quantum field like a single run; blank keeps their defaults
+    quantum = quantum_entry.get().strip()
+    start_background(compare_worker, workload_source(), int(time_entry.get()),
+                     int(quantum) if quantum else None, determinate=False)
+
+def sweep_worker(run, source, last_instant, algorithm_id, quanta_text):
+    import sweep
+    try:
+        processes = workload_processes(source)
+        quanta = sweep.parse_quanta(quanta_text or sweep.DEFAULT_QUANTA)
+        post(run, status_var.set, f"Sweeping {len(quanta)} quanta...")
+        with profiler.phase("sweep", "engine"):
+            curve = sweep.sweep([processes], algorithm_id, quanta, last_instant)
+        if run["cancel"].is_set():
+            post(run, show_cancelled)
+        else:
+            best = sweep.best_quantum(curve)
+            post(run, show_sweep, sweep.format_sweep(curve), best["quantum"] if best else None)
     except Exception as e:
-        output_area.delete("1.0", tk.END)
-        output_area.insert(tk.END, f"Error running scheduler:\n{str(e)}")
-        output_area.see(tk.END)
-        output_area.update_idletasks()
-        status_var.set("Error occurred!")
-        root.after(3000, lambda: status_var.set("Ready"))
+        post(run, show_error, "Error sweeping quanta", str(e))
+    finally:
+        post(run, finish_background, run)
+
+def show_sweep(table, best_quantum):
+    output_area.delete("1.0", tk.END)
+    output_area.insert(tk.END, table)
+    output_area.see("1.0")
+    if best_quantum is not None:
+        # Leave the winner in the Quantum field, ready for a normal run
+        quantum_entry.delete(0, tk.END)
+        quantum_entry.insert(0, str(best_quantum))
+    status_var.set("Quantum sweep completed successfully!")
+
+def sweep_quantum():
+    """Run RR or Aging over the range of quanta in parallel and show the metric curves"""
+    if active_run is not None or not validate_inputs():
+        return
+
+    algorithm_id = algo_combobox.current()
+    if algorithm_id not in scheduler.QUANTUM_POLICIES:
+        messagebox.showerror("Error", "Select RR or AGING to sweep the quantum.")
+        return
+    animate_button(sweep_button)
+    # The quanta are parsed by the worker, which loads sweep (and NumPy) off the Tk thread
+    status_var.set("Sweeping quanta...")
+    start_background(sweep_worker, workload_source(), int(time_entry.get()), algorithm_id,
+                     sweep_entry.get().strip(), determinate=False)
 
 def add_process():
     """Add a new process line"""
+    if imported_table is not None:
+        return
     current_count = int(process_count_entry.get())
     new_count = current_count + 1
     process_count_entry.delete(0, tk.END)
@@ -346,6 +665,8 @@ def add_process():
 
 def remove_process():
     """Remove the last process line"""
+    if imported_table is not None:
+        return
     current_count = int(process_count_entry.get())
     if current_count > 1:
         new_count = current_count - 1
@@ -361,20 +682,25 @@ def remove_process():
 
 def clear_all():
     """Clear all inputs and outputs"""
+    global imported_table
+    imported_table = None
+    process_text.configure(state=tk.NORMAL)
     process_text.delete("1.0", tk.END)
     process_text.insert(tk.END, "A,0,3\nB,2,6\nC,4,4\nD,6,5\nE,8,2")
     output_area.delete("1.0", tk.END)
     output_area.insert("1.0", "Scheduler output will appear here after running...")
     output_area.update_idletasks()
-    canvas.delete("all")
+    metrics_area.delete("1.0", tk.END)
+    gantt_view.clear()
     
     # Clear timeline graph
-    for widget in timeline_frame.winfo_children():
-        if isinstance(widget, tk.Canvas):
-            widget.destroy()
+    create_timeline_graph(0, {})
     
     time_entry.delete(0, tk.END)
     time_entry.insert(0, "20")
+    quantum_entry.delete(0, tk.END)
+    cpus_entry.delete(0, tk.END)
+    cpus_entry.insert(0, "1")
     process_count_entry.delete(0, tk.END)
     process_count_entry.insert(0, "5")
     algo_combobox.current(0)
@@ -382,176 +708,277 @@ def clear_all():
     status_var.set("Inputs cleared")
     root.after(2000, lambda: status_var.set("Ready"))
 
-# Create main window with enhanced styling
-root = tk.Tk()
-root.title("🖥️ CPU Scheduler Visualizer Pro")
-root.configure(bg="#ecf0f1")
-root.geometry("1400x900")
-root.resizable(True, True)
-
-# Configure custom fonts
-title_font = font.Font(family="Arial", size=16, weight="bold")
-label_font = font.Font(family="Arial", size=10, weight="bold")
-input_font = font.Font(family="Arial", size=10)
-
-# Configure custom styles
-style = ttk.Style()
-style.theme_use('clam')
-style.configure('Custom.TCombobox', fieldbackground='white', background='#3498db')
-
-# Title section
-title_frame = tk.Frame(root, bg="#2c3e50", relief="raised", bd=2)
-title_frame.grid(row=0, column=0, columnspan=3, sticky="ew", padx=5, pady=5)
-title_label = tk.Label(title_frame, text="🖥️ CPU Scheduler Visualizer Pro", 
-                      font=title_font, fg="white", bg="#2c3e50", pady=10)
-title_label.pack()
-
-# Left side - Algorithm Configuration (NOW GETS MORE SPACE)
-config_frame = tk.LabelFrame(root, text="⚙️ Algorithm Configuration", font=label_font, 
-                           bg="#ecf0f1", fg="#2c3e50", relief="groove", bd=2)
-config_frame.grid(row=1, column=0, sticky="nsew", padx=(10,5), pady=5)
-
-# Operation input
-tk.Label(config_frame, text="Operation:", bg="#ecf0f1", font=label_font, fg="#34495e").grid(row=0, column=0, sticky='w', padx=10, pady=5)
-operation_entry = tk.Entry(config_frame, width=25, font=input_font, relief="groove", bd=2)
-operation_entry.insert(0, "trace")
-operation_entry.grid(row=0, column=1, padx=10, pady=5, sticky='ew')
-
-# Algorithm selection
-tk.Label(config_frame, text="Select Algorithm:", bg="#ecf0f1", font=label_font, fg="#34495e").grid(row=1, column=0, sticky='w', padx=10, pady=5)
-algo_combobox = ttk.Combobox(config_frame, values=[name for name, _ in algorithm_names], 
-                            state="readonly", width=23, font=input_font, style='Custom.TCombobox')
-algo_combobox.current(1)
-algo_combobox.grid(row=1, column=1, padx=10, pady=5, sticky='ew')
-algo_combobox.bind("<<ComboboxSelected>>", update_description)
-
-# Algorithm description
-algo_description_var = tk.StringVar()
-algo_description = tk.Label(config_frame, textvariable=algo_description_var, wraplength=300, 
-                           justify="left", bg="#ecf0f1", fg="#7f8c8d", font=("Arial", 9, "italic"))
-algo_description.grid(row=2, column=0, columnspan=2, sticky='w', padx=10, pady=2)
-update_description(None)
-
-# Time input
-tk.Label(config_frame, text="Total Time:", bg="#ecf0f1", font=label_font, fg="#34495e").grid(row=3, column=0, sticky='w', padx=10, pady=5)
-time_entry = tk.Entry(config_frame, width=25, font=input_font, relief="groove", bd=2)
-time_entry.insert(0, "20")
-time_entry.grid(row=3, column=1, padx=10, pady=5, sticky='ew')
-
-# Configure grid weights for config frame
-config_frame.grid_columnconfigure(1, weight=1)
-
-# Middle - Scheduler Output (NOW GETS LESS SPACE)
-output_frame = tk.LabelFrame(root, text="📊 Scheduler Output", font=label_font, 
-                            bg="#ecf0f1", fg="#2c3e50", relief="groove", bd=2)
-output_frame.grid(row=1, column=1, sticky="nsew", padx=5, pady=5)
-output_frame.grid_rowconfigure(0, weight=1)
-output_frame.grid_columnconfigure(0, weight=1)
-
-output_area = scrolledtext.ScrolledText(output_frame, width=50, height=18, 
-                                       font=("Courier New", 9), relief="groove", bd=2,
-                                       bg="#f8f9fa", selectbackground="#3498db",
-                                       wrap=tk.WORD)
-output_area.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
-
-# Right side - Process Configuration
-process_frame = tk.LabelFrame(root, text="📝 Process Configuration", font=label_font, 
-                            bg="#ecf0f1", fg="#2c3e50", relief="groove", bd=2)
-process_frame.grid(row=1, column=2, sticky="nsew", padx=(5,10), pady=5)
-
-# Process count with add/remove buttons
-tk.Label(process_frame, text="Process Count:", bg="#ecf0f1", font=label_font, fg="#34495e").grid(row=0, column=0, sticky='w', padx=10, pady=5)
-
-process_count_frame = tk.Frame(process_frame, bg="#ecf0f1")
-process_count_frame.grid(row=0, column=1, padx=10, pady=5, sticky='ew')
-
-process_count_entry = tk.Entry(process_count_frame, width=15, font=input_font, relief="groove", bd=2)
-process_count_entry.insert(0, "5")
-process_count_entry.pack(side=tk.LEFT, fill='x', expand=True)
-
-add_btn = tk.Button(process_count_frame, text="+", command=add_process, 
-                   bg="#27ae60", fg="white", font=("Arial", 9, "bold"), width=2)
-add_btn.pack(side=tk.RIGHT, padx=(2,0))
-
-remove_btn = tk.Button(process_count_frame, text="-", command=remove_process, 
-                      bg="#e74c3c", fg="white", font=("Arial", 9, "bold"), width=2)
-remove_btn.pack(side=tk.RIGHT, padx=2)
-
-# Process data input
-tk.Label(process_frame, text="Processes (name,arrival,service):", bg="#ecf0f1", font=label_font, 
-         fg="#34495e").grid(row=1, column=0, columnspan=2, sticky='w', padx=10, pady=(10,5))
-process_text = scrolledtext.ScrolledText(process_frame, width=35, height=15, font=("Courier New", 10),
-                                        relief="groove", bd=2)
-process_text.insert(tk.END, "A,0,3\nB,2,6\nC,4,4\nD,6,5\nE,8,2")
-process_text.grid(row=2, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
-
-# Button section in process frame
-button_frame = tk.Frame(process_frame, bg="#ecf0f1")
-button_frame.grid(row=3, column=0, columnspan=2, pady=10)
-
-run_button = tk.Button(button_frame, text="🚀 Run Scheduler", command=run_scheduler, 
-                      bg="#27ae60", fg="white", font=("Arial", 11, "bold"), 
-                      relief="raised", bd=3, padx=20, pady=5,
-                      activebackground="#2ecc71", cursor="hand2")
-run_button.pack(side=tk.LEFT, padx=5)
-
-clear_button = tk.Button(button_frame, text="🗑️ Clear All", command=clear_all, 
-                        bg="#e74c3c", fg="white", font=("Arial", 11, "bold"), 
-                        relief="raised", bd=3, padx=20, pady=5,
-                        activebackground="#c0392b", cursor="hand2")
-clear_button.pack(side=tk.LEFT, padx=5)
-
-# Configure grid weights for process frame
-process_frame.grid_columnconfigure(1, weight=1)
-process_frame.grid_rowconfigure(2, weight=1)
-
-# Status bar
-status_var = tk.StringVar(value="Ready")
-status_bar = tk.Label(root, textvariable=status_var, bg="#34495e", fg="white", 
-                     font=("Arial", 9), relief="sunken", bd=1, anchor="w")
-status_bar.grid(row=4, column=0, columnspan=3, sticky="ew", padx=5)
-
-# Create notebook for charts (Bottom section spanning all columns)
-chart_notebook = ttk.Notebook(root)
-chart_notebook.grid(row=2, column=0, columnspan=3, sticky="nsew", padx=10, pady=5)
-
-# Gantt chart tab
-gantt_frame = tk.Frame(chart_notebook, bg="#ecf0f1")
-chart_notebook.add(gantt_frame, text="📈 Gantt Chart")
-
-canvas = tk.Canvas(gantt_frame, width=500, height=300, bg="#ffffff", 
-                  relief="groove", bd=2, highlightthickness=0)
-canvas.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-# Timeline graph tab
-timeline_frame = tk.Frame(chart_notebook, bg="#ecf0f1")
-chart_notebook.add(timeline_frame, text="⏱️ Timeline Graph")
-
-# REVERSED SPACE ALLOCATION: Configure grid weights for responsive design
-root.grid_columnconfigure(0, weight=4)  # Algorithm config (MORE space - 4x)  
-root.grid_columnconfigure(1, weight=1)  # Output area (LESS space - 1x)
-root.grid_columnconfigure(2, weight=4)  # Process config (MORE space - 4x)
-root.grid_rowconfigure(1, weight=1)     # Main content area
-root.grid_rowconfigure(2, weight=1)     # Charts area
-
-# Add hover effects for buttons
-def on_enter(e):
-    e.widget.configure(relief="raised", bd=4)
-
-def on_leave(e):
-    e.widget.configure(relief="raised", bd=3)
-
-run_button.bind("<Enter>", on_enter)
-run_button.bind("<Leave>", on_leave)
-clear_button.bind("<Enter>", on_enter)
-clear_button.bind("<Leave>", on_leave)
-
-# Center the window
-root.update_idletasks()
-width = root.winfo_width()
-height = root.winfo_height()
-x = (root.winfo_screenwidth() // 2) - (width // 2)
-y = (root.winfo_screenheight() // 2) - (height // 2)
-root.geometry(f"{width}x{height}+{x}+{y}")
-
-root.mainloop()
\ No newline at end of file
+# The window is only built when run as a script, so worker processes that
+# re-import this module (e.g. the Compare All process pool) stay headless
+if __name__ == "__main__":
+    # Create main window with enhanced styling
+    root = tk.Tk()
+    root.title("🖥️ CPU Scheduler Visualizer Pro")
+    root.configure(bg="#ecf0f1")
+    root.geometry("1400x900")
+    root.resizable(True, True)
+
+    menu_bar = tk.Menu(root)
+    file_menu = tk.Menu(menu_bar, tearoff=0)
+    file_menu.add_command(label="Import Accounting Trace…", command=import_trace)
+    file_menu.add_separator()
+    file_menu.add_command(label="Open Recording…", command=open_recording)
+    file_menu.add_command(label="Save Recording…", command=save_recording)
+    menu_bar.add_cascade(label="File", menu=file_menu)
+    root.configure(menu=menu_bar)
+
+    # Configure custom fonts
+    title_font = font.Font(family="Arial", size=16, weight="bold")
+    label_font = font.Font(family="Arial", size=10, weight="bold")
+    input_font = font.Font(family="Arial", size=10)
+
+    # Configure custom styles
+    style = ttk.Style()
+    style.theme_use('clam')
+    style.configure('Custom.TCombobox', fieldbackground='white', background='#3498db')
+
+    # Title section
+    title_frame = tk.Frame(root, bg="#2c3e50", relief="raised", bd=2)
+    title_frame.grid(row=0, column=0, columnspan=3, sticky="ew", padx=5, pady=5)
+    title_label = tk.Label(title_frame, text="🖥️ CPU Scheduler Visualizer Pro", 
+                          font=title_font, fg="white", bg="#2c3e50", pady=10)
+    title_label.pack()
+
+    # Left side - Algorithm Configuration (NOW GETS MORE SPACE)
+    config_frame = tk.LabelFrame(root, text="⚙️ Algorithm Configuration", font=label_font, 
+                               bg="#ecf0f1", fg="#2c3e50", relief="groove", bd=2)
+    config_frame.grid(row=1, column=0, sticky="nsew", padx=(10,5), pady=5)
+
+    # Operation input
+    tk.Label(config_frame, text="Operation:", bg="#ecf0f1", font=label_font, fg="#34495e").grid(row=0, column=0, sticky='w', padx=10, pady=5)
+    operation_entry = tk.Entry(config_frame, width=25, font=input_font, relief="groove", bd=2)
+    operation_entry.insert(0, "trace")
+    operation_entry.grid(row=0, column=1, padx=10, pady=5, sticky='ew')
+
+    # Algorithm selection
+    tk.Label(config_frame, text="Select Algorithm:", bg="#ecf0f1", font=label_font, fg="#34495e").grid(row=1, column=0, sticky='w', padx=10, pady=5)
+    algo_combobox = ttk.Combobox(config_frame, values=[name for name, _ in algorithm_names], 
+                                state="readonly", width=23, font=input_font, style='Custom.TCombobox')
+    algo_combobox.current(1)
+    algo_combobox.grid(row=1, column=1, padx=10, pady=5, sticky='ew')
+    algo_combobox.bind("<<ComboboxSelected>>", update_description)
+
+    # Algorithm description
+    algo_description_var = tk.StringVar()
+    algo_description = tk.Label(config_frame, textvariable=algo_description_var, wraplength=300, 
+                               justify="left", bg="#ecf0f1", fg="#7f8c8d", font=("Arial", 9, "italic"))
+    algo_description.grid(row=2, column=0, columnspan=2, sticky='w', padx=10, pady=2)
+    update_description(None)
+
+    # Time input
+    tk.Label(config_frame, text="Total Time:", bg="#ecf0f1", font=label_font, fg="#34495e").grid(row=3, column=0, sticky='w', padx=10, pady=5)
+    time_entry = tk.Entry(config_frame, width=25, font=input_font, relief="groove", bd=2)
+    time_entry.insert(0, "20")
+    time_entry.grid(row=3, column=1, padx=10, pady=5, sticky='ew')
+
+    # Backend selection: in-process engine, or the compiled C++ scheduler
+    tk.Label(config_frame, text="Backend:", bg="#ecf0f1", font=label_font, fg="#34495e").grid(row=4, column=0, sticky='w', padx=10, pady=5)
+    backend_combobox = ttk.Combobox(config_frame, values=["Python engine", "main.exe"],
+                                   state="readonly", width=23, font=input_font, style='Custom.TCombobox')
+    backend_combobox.current(0)
+    backend_combobox.grid(row=4, column=1, padx=10, pady=5, sticky='ew')
+
+    # Quantum for RR and Aging (blank: the algorithm's default), and the range the sweep tries
+    # (blank: sweep.DEFAULT_QUANTA, filled in by the sweep worker)
+    tk.Label(config_frame, text="Quantum:", bg="#ecf0f1", font=label_font, fg="#34495e").grid(row=5, column=0, sticky='w', padx=10, pady=5)
+    quantum_entry = tk.Entry(config_frame, width=25, font=input_font, relief="groove", bd=2)
+    quantum_entry.grid(row=5, column=1, padx=10, pady=5, sticky='ew')
+
+    tk.Label(config_frame, text="Sweep Quanta:", bg="#ecf0f1", font=label_font, fg="#34495e").grid(row=6, column=0, sticky='w', padx=10, pady=5)
+    sweep_entry = tk.Entry(config_frame, width=25, font=input_font, relief="groove", bd=2)
+    sweep_entry.grid(row=6, column=1, padx=10, pady=5, sticky='ew')
+
+    # More than one CPU runs the SMP simulator, from one shared queue or one queue per CPU
+    tk.Label(config_frame, text="CPUs:", bg="#ecf0f1", font=label_font, fg="#34495e").grid(row=7, column=0, sticky='w', padx=10, pady=5)
+    cpus_entry = tk.Entry(config_frame, width=25, font=input_font, relief="groove", bd=2)
+    cpus_entry.insert(0, "1")
+    cpus_entry.grid(row=7, column=1, padx=10, pady=5, sticky='ew')
+
+    tk.Label(config_frame, text="Run Queues:", bg="#ecf0f1", font=label_font, fg="#34495e").grid(row=8, column=0, sticky='w', padx=10, pady=5)
+    queues_combobox = ttk.Combobox(config_frame, values=["Global queue", "Per-CPU + work stealing"],
+                                   state="readonly", width=23, font=input_font, style='Custom.TCombobox')
+    queues_combobox.current(0)
+    queues_combobox.grid(row=8, column=1, padx=10, pady=5, sticky='ew')
+
+    # Configure grid weights for config frame
+    config_frame.grid_columnconfigure(1, weight=1)
+
+    # Middle - Scheduler Output (NOW GETS LESS SPACE)
+    output_frame = tk.LabelFrame(root, text="📊 Scheduler Output", font=label_font, 
+                                bg="#ecf0f1", fg="#2c3e50", relief="groove", bd=2)
+    output_frame.grid(row=1, column=1, sticky="nsew", padx=5, pady=5)
+    output_frame.grid_rowconfigure(0, weight=1)
+    output_frame.grid_columnconfigure(0, weight=1)
+
+    output_area = scrolledtext.ScrolledText(output_frame, width=50, height=18, 
+                                           font=("Courier New", 9), relief="groove", bd=2,
+                                           bg="#f8f9fa", selectbackground="#3498db",
+                                           wrap=tk.WORD)
+    output_area.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+
+    # Right side - Process Configuration
+    process_frame = tk.LabelFrame(root, text="📝 Process Configuration", font=label_font, 
+                                bg="#ecf0f1", fg="#2c3e50", relief="groove", bd=2)
+    process_frame.grid(row=1, column=2, sticky="nsew", padx=(5,10), pady=5)
+
+    # Process count with add/remove buttons
+    tk.Label(process_frame, text="Process Count:", bg="#ecf0f1", font=label_font, fg="#34495e").grid(row=0, column=0, sticky='w', padx=10, pady=5)
+
+    process_count_frame = tk.Frame(process_frame, bg="#ecf0f1")
+    process_count_frame.grid(row=0, column=1, padx=10, pady=5, sticky='ew')
+
+    process_count_entry = tk.Entry(process_count_frame, width=15, font=input_font, relief="groove", bd=2)
+    process_count_entry.insert(0, "5")
+    process_count_entry.pack(side=tk.LEFT, fill='x', expand=True)
+
+    add_btn = tk.Button(process_count_frame, text="+", command=add_process, 
+                       bg="#27ae60", fg="white", font=("Arial", 9, "bold"), width=2)
+    add_btn.pack(side=tk.RIGHT, padx=(2,0))
+
+    remove_btn = tk.Button(process_count_frame, text="-", command=remove_process, 
+                          bg="#e74c3c", fg="white", font=("Arial", 9, "bold"), width=2)
+    remove_btn.pack(side=tk.RIGHT, padx=2)
+
+    # Process data input
+    tk.Label(process_frame, text="Processes (name,arrival,service):", bg="#ecf0f1", font=label_font, 
+             fg="#34495e").grid(row=1, column=0, columnspan=2, sticky='w', padx=10, pady=(10,5))
+    process_text = scrolledtext.ScrolledText(process_frame, width=35, height=15, font=("Courier New", 10),
+                                            relief="groove", bd=2)
+    process_text.insert(tk.END, "A,0,3\nB,2,6\nC,4,4\nD,6,5\nE,8,2")
+    process_text.grid(row=2, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
+
+    # Button section in process frame
+    button_frame = tk.Frame(process_frame, bg="#ecf0f1")
+    button_frame.grid(row=3, column=0, columnspan=2, pady=10)
+
+    run_button = tk.Button(button_frame, text="🚀 Run Scheduler", command=run_scheduler, 
+                          bg="#27ae60", fg="white", font=("Arial", 11, "bold"), 
+                          relief="raised", bd=3, padx=20, pady=5,
+                          activebackground="#2ecc71", cursor="hand2")
+    run_button.pack(side=tk.LEFT, padx=5)
+
+    compare_button = tk.Button(button_frame, text="📊 Compare All", command=compare_all, 
+                              bg="#3498db", fg="white", font=("Arial", 11, "bold"), 
+                              relief="raised", bd=3, padx=20, pady=5,
+                              activebackground="#2980b9", cursor="hand2")
+    compare_button.pack(side=tk.LEFT, padx=5)
+
+    sweep_button = tk.Button(button_frame, text="🎚️ Sweep Quantum", command=sweep_quantum, 
+                            bg="#8e44ad", fg="white", font=("Arial", 11, "bold"), 
+                            relief="raised", bd=3, padx=20, pady=5,
+                            activebackground="#9b59b6", cursor="hand2")
+    sweep_button.pack(side=tk.LEFT, padx=5)
+
+    clear_button = tk.Button(button_frame, text="🗑️ Clear All", command=clear_all, 
+                            bg="#e74c3c", fg="white", font=("Arial", 11, "bold"), 
+                            relief="raised", bd=3, padx=20, pady=5,
+                            activebackground="#c0392b", cursor="hand2")
+    clear_button.pack(side=tk.LEFT, padx=5)
+
+    cancel_button = tk.Button(button_frame, text="⏹ Cancel", command=cancel_run, state=tk.DISABLED,
+                             bg="#7f8c8d", fg="white", font=("Arial", 11, "bold"), 
+                             relief="raised", bd=3, padx=20, pady=5,
+                             activebackground="#95a5a6", cursor="hand2")
+    cancel_button.pack(side=tk.LEFT, padx=5)
+
+    # Configure grid weights for process frame
+    process_frame.grid_columnconfigure(1, weight=1)
+    process_frame.grid_rowconfigure(2, weight=1)
+
+    # Status bar
+    status_frame = tk.Frame(root, bg="#34495e")
+    status_frame.grid(row=4, column=0, columnspan=3, sticky="ew", padx=5)
+    status_var = tk.StringVar(value="Ready")
+    status_bar = tk.Label(status_frame, textvariable=status_var, bg="#34495e", fg="white", 
+                         font=("Arial", 9), relief="sunken", bd=1, anchor="w")
+    status_bar.pack(side=tk.LEFT, fill=tk.X, expand=True)
+    progress_var = tk.DoubleVar(value=0)
+    progress_bar = ttk.Progressbar(status_frame, variable=progress_var, maximum=100, length=200)
+    progress_bar.pack(side=tk.RIGHT, padx=5)
+
+    # Create notebook for charts (Bottom section spanning all columns)
+    chart_notebook = ttk.Notebook(root)
+    chart_notebook.grid(row=2, column=0, columnspan=3, sticky="nsew", padx=10, pady=5)
+
+    # Gantt chart tab
+    gantt_frame = tk.Frame(chart_notebook, bg="#ecf0f1")
+    chart_notebook.add(gantt_frame, text="📈 Gantt Chart")
+
+    gantt_view = GanttView(gantt_frame, color_for=generate_color, width=500, height=300,
+                           bg="#ffffff", relief="groove", bd=2, highlightthickness=0)
+    gantt_view.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+    # Timeline graph tab: matplotlib is loaded when the tab is first opened
+    timeline_frame = tk.Frame(chart_notebook, bg="#ecf0f1")
+    chart_notebook.add(timeline_frame, text="⏱️ Timeline Graph")
+    timeline_placeholder = tk.Label(timeline_frame, text="Loading timeline…", bg="#ecf0f1",
+                                    fg="#7f8c8d", font=("Arial", 10, "italic"))
+    timeline_placeholder.pack(expand=True)
+    chart_notebook.bind("<<NotebookTabChanged>>", on_chart_tab_changed)
+
+    # Metrics tab: waiting/response distributions, utilization, switches, throughput
+    metrics_frame = tk.Frame(chart_notebook, bg="#ecf0f1")
+    chart_notebook.add(metrics_frame, text="📐 Metrics")
+    metrics_area = scrolledtext.ScrolledText(metrics_frame, font=("Courier New", 9), relief="groove", bd=2,
+                                            bg="#f8f9fa", wrap=tk.NONE)
+    metrics_area.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+    # Profile tab: per-phase timings of the last run
+    profile_frame = tk.Frame(chart_notebook, bg="#ecf0f1")
+    chart_notebook.add(profile_frame, text="🔬 Profile")
+    profile_controls = tk.Frame(profile_frame, bg="#ecf0f1")
+    profile_controls.pack(fill=tk.X, padx=10, pady=(10, 0))
+    profile_var = tk.BooleanVar(value=False)
+    memory_var = tk.BooleanVar(value=False)
+    tk.Checkbutton(profile_controls, text="Enable profiling", variable=profile_var, command=toggle_profiling,
+                   bg="#ecf0f1", font=("Arial", 10)).pack(side=tk.LEFT)
+    memory_check = tk.Checkbutton(profile_controls, text="Track memory (slower)", variable=memory_var,
+                                  bg="#ecf0f1", font=("Arial", 10))
+    memory_check.pack(side=tk.LEFT, padx=10)
+    tk.Button(profile_controls, text="Export Chrome Trace…", command=export_trace,
+              bg="#34495e", fg="white", font=("Arial", 9, "bold"), relief="raised", bd=2,
+              cursor="hand2").pack(side=tk.RIGHT)
+    profile_area = scrolledtext.ScrolledText(profile_frame, font=("Courier New", 9), relief="groove", bd=2,
+                                             bg="#f8f9fa", wrap=tk.NONE)
+    profile_area.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+    show_profile()
+
+    # REVERSED SPACE ALLOCATION: Configure grid weights for responsive design
+    root.grid_columnconfigure(0, weight=4)  # Algorithm config (MORE space - 4x)  
+    root.grid_columnconfigure(1, weight=1)  # Output area (LESS space - 1x)
+    root.grid_columnconfigure(2, weight=4)  # Process config (MORE space - 4x)
+    root.grid_rowconfigure(1, weight=1)     # Main content area
+    root.grid_rowconfigure(2, weight=1)     # Charts area
+
+    # Add hover effects for buttons
+    def on_enter(e):
+        e.widget.configure(relief="raised", bd=4)
+
+    def on_leave(e):
+        e.widget.configure(relief="raised", bd=3)
+
+    run_button.bind("<Enter>", on_enter)
+    run_button.bind("<Leave>", on_leave)
+    compare_button.bind("<Enter>", on_enter)
+    compare_button.bind("<Leave>", on_leave)
+    sweep_button.bind("<Enter>", on_enter)
+    sweep_button.bind("<Leave>", on_leave)
+    clear_button.bind("<Enter>", on_enter)
+    clear_button.bind("<Leave>", on_leave)
+
+    # Center the window
+    root.update_idletasks()
+    width = root.winfo_width()
+    height = root.winfo_height()
+    x = (root.winfo_screenwidth() // 2) - (width // 2)
+    y = (root.winfo_screenheight() // 2) - (height // 2)
+    root.geometry(f"{width}x{height}+{x}+{y}")
+
+    # Startup ends when the first paint is done; pass --startup-time to print it and exit
+    root.after_idle(startup_finished, time.perf_counter_ns())
+    root.mainloop()
\ No newline at end of file
@@ -8,6 +8,7 @@
 #include <sstream>
 #include <iomanip>
 #include <cmath>
+#include <climits>
 
 #define all(v) v.begin(), v.end()
 
@@ -16,6 +17,7 @@ using namespace std;
 /** Global Constants **/
 const string TRACE = "trace";
 const string SHOW_STATISTICS = "stats";
+const string JSON = "json";
 const string ALGORITHMS[9] = {"", "FCFS", "RR-", "SPN", "SRT", "HRRN", "FB-1", "FB-2i", "AGING"};
 
 bool sortByServiceTime(const tuple<string, int, int> &a, const tuple<string, int, int> &b)
@@ -27,61 +29,41 @@ bool sortByArrivalTime(const tuple<string, int, int> &a, const tuple<string, int
     return (get<1>(a) < get<1>(b));
 }
 
-bool descendingly_by_response_ratio(tuple<string, double, int> a, tuple<string, double, int> b)
+void clear_results()
 {
-    return get<1>(a) > get<1>(b);
+    segments.clear();
+    fill(all(finishTime), 0);
+    fill(all(turnAroundTime), 0);
+    fill(all(normTurn), 0);
 }
 
-bool byPriorityLevel (const tuple<int,int,int>&a,const tuple<int,int,int>&b){
-    if(get<0>(a)==get<0>(b))
-        return get<2>(a)> get<2>(b);
-    return get<0>(a) > get<0>(b);
-}
-
-void clear_timeline()
+// Record that processIndex ran during [start, end), merging with the previous run when contiguous
+void run(int processIndex, int start, int end)
 {
-    for(int i=0; i<last_instant; i++)
-        for(int j=0; j<process_count; j++)
-            timeline[i][j] = ' ';
+    end = min(end, last_instant);
+    if (start >= end)
+        return;
+    if (!segments.empty() && get<0>(segments.back()) == processIndex && get<2>(segments.back()) == start)
+        get<2>(segments.back()) = end;
+    else
+        segments.push_back(make_tuple(processIndex, start, end));
 }
 
-string getProcessName(tuple<string, int, int> &a)
+const string &getProcessName(const tuple<string, int, int> &a)
 {
     return get<0>(a);
 }
 
-int getArrivalTime(tuple<string, int, int> &a)
+int getArrivalTime(const tuple<string, int, int> &a)
 {
     return get<1>(a);
 }
 
-int getServiceTime(tuple<string, int, int> &a)
-{
-    return get<2>(a);
-}
-
-int getPriorityLevel(tuple<string, int, int> &a)
+int getServiceTime(const tuple<string, int, int> &a)
 {
     return get<2>(a);
 }
 
-double calculate_response_ratio(int wait_time, int service_time)
-{
-    return (wait_time + service_time)*1.0 / service_time;
-}
-
-void fillInWaitTime(){
-    for (int i = 0; i < process_count; i++)
-    {
-        int arrivalTime = getArrivalTime(processes[i]);
-        for (int k = arrivalTime; k < finishTime[i]; k++)
-        {
-            if (timeline[k][i] != '*')
-                timeline[k][i] = '.';
-        }
-    }
-}
-
 void firstComeFirstServe()
 {
     int time = getArrivalTime(processes[0]);
@@ -95,10 +77,7 @@ void firstComeFirstServe()
         turnAroundTime[processIndex] = (finishTime[processIndex] - arrivalTime);
         normTurn[processIndex] = (turnAroundTime[processIndex] * 1.0 / serviceTime);
 
-        for (int j = time; j < finishTime[processIndex]; j++)
-            timeline[j][processIndex] = '*';
-        for (int j = arrivalTime; j < time; j++)
-            timeline[j][processIndex] = '.';
+        run(processIndex, time, finishTime[processIndex]);
         time += serviceTime;
     }
 }
@@ -120,7 +99,7 @@ void roundRobin(int originalQuantum)
             int arrivalTime = getArrivalTime(processes[processIndex]);
             int serviceTime = getServiceTime(processes[processIndex]);
             currentQuantum--;
-            timeline[time][processIndex]='*';
+            run(processIndex, time, time + 1);
             while(j<process_count && getArrivalTime(processes[j])==time+1){
                 q.push(make_pair(j,getServiceTime(processes[j])));
                 j++;
@@ -149,7 +128,6 @@ void roundRobin(int originalQuantum)
             j++;
         }
     }
-    fillInWaitTime();
 }
 
 void shortestProcessNext()
@@ -169,18 +147,12 @@ void shortestProcessNext()
             int serviceTime = getServiceTime(processes[processIndex]);
             pq.pop();
 
-            int temp = arrivalTime;
-            for (; temp < i; temp++)
-                timeline[temp][processIndex] = '.';
-
-            temp = i;
-            for (; temp < i + serviceTime; temp++)
-                timeline[temp][processIndex] = '*';
+            run(processIndex, i, i + serviceTime);
 
             finishTime[processIndex] = (i + serviceTime);
             turnAroundTime[processIndex] = (finishTime[processIndex] - arrivalTime);
             normTurn[processIndex] = (turnAroundTime[processIndex] * 1.0 / serviceTime);
-            i = temp - 1;
+            i = i + serviceTime - 1;
         }
     }
 }
@@ -202,7 +174,7 @@ void shortestRemainingTime()
             pq.pop();
             int serviceTime = getServiceTime(processes[processIndex]);
             int arrivalTime = getArrivalTime(processes[processIndex]);
-            timeline[i][processIndex] = '*';
+            run(processIndex, i, i + 1);
 
             if (remainingTime == 1) // process finished
             {
@@ -216,50 +188,121 @@ void shortestRemainingTime()
             }
         }
     }
-    fillInWaitTime();
 }
 
-void highestResponseRatioNext()
+// Kinetic tournament tree over the response ratios of the ready processes.
+// A ratio (t - arrival + service) / service is a line in t, so every node keeps
+// the winner of its two children and the first instant the loser overtakes it.
+// Advancing the clock only revisits nodes whose certificate has expired, so
+// picking the next process is O(log n) amortized. Ratios are compared exactly
+// as integer cross-products; ties go to the process that was given first.
+struct RatioTournament
 {
+    int size = 1;
+    long long now = 0;
+    vector<int> winner;
+    vector<long long> expires;
+
+    RatioTournament(int count)
+    {
+        while (size < count)
+            size *= 2;
+        winner.assign(2 * size, -1);
+        expires.assign(2 * size, LLONG_MAX);
+    }
+
+    bool beats(int i, int j)
+    {
+        long long lhs = (now - getArrivalTime(processes[i]) + getServiceTime(processes[i])) * getServiceTime(processes[j]);
+        long long rhs = (now - getArrivalTime(processes[j]) + getServiceTime(processes[j])) * getServiceTime(processes[i]);
+        return lhs > rhs || (lhs == rhs && i < j);
+    }
+
+    // First instant after now at which loser beats w
+    long long overtakes(int w, int loser)
+    {
+        long long serviceW = getServiceTime(processes[w]), serviceL = getServiceTime(processes[loser]);
+        long long slope = serviceW - serviceL;
+        if (slope <= 0)
+            return LLONG_MAX;
+        long long offset = (serviceL - getArrivalTime(processes[loser])) * serviceW - (serviceW - getArrivalTime(processes[w])) * serviceL;
+        // loser wins at t when t * slope + offset > 0 (or == 0 with the lower index)
+        long long bound = -offset;
+        long long floorDiv = bound / slope - (bound % slope != 0 && bound < 0);
+        long long instant = (loser < w && bound % slope == 0) ? floorDiv : floorDiv + 1;
+        return max(instant, now + 1);
+    }
+
+    void pull(int node)
+    {
+        int left = winner[2 * node], right = winner[2 * node + 1];
+        long long certificate = LLONG_MAX;
+        if (left < 0)
+            winner[node] = right;
+        else if (right < 0)
+            winner[node] = left;
+        else
+        {
+            int w = beats(left, right) ? left : right;
+            certificate = overtakes(w, w == left ? right : left);
+            winner[node] = w;
+        }
+        expires[node] = min(certificate, min(expires[2 * node], expires[2 * node + 1]));
+    }
+
+    void refresh(int node)
+    {
+        if (node >= size || expires[node] > now)
+            return;
+        refresh(2 * node);
+        refresh(2 * node + 1);
+        pull(node);
+    }
 
-    // Vector of tuple <process_name, process_response_ratio, time_in_service> for processes that are in the ready queue
-    vector<tuple<string, double, int>> present_processes;
+    void advance(long long time)
+    {
+        now = time;
+        refresh(1);
+    }
+
+    void set(int processIndex, int value)
+    {
+        int node = size + processIndex;
+        winner[node] = value;
+        for (node /= 2; node; node /= 2)
+            pull(node);
+    }
+
+    int best()
+    {
+        return winner[1];
+    }
+};
+
+void highestResponseRatioNext()
+{
+    RatioTournament ready(process_count);
     int j=0;
     for (int current_instant = 0; current_instant < last_instant; current_instant++)
     {
+        ready.advance(current_instant);
         while(j<process_count && getArrivalTime(processes[j])<=current_instant){
-            present_processes.push_back(make_tuple(getProcessName(processes[j]), 1.0, 0));
+            ready.set(j, j);
             j++;
         }
-        // Calculate response ratio for every process
-        for (auto &proc : present_processes)
-        {
-            string process_name = get<0>(proc);
-            int process_index = processToIndex[process_name];
-            int wait_time = current_instant - getArrivalTime(processes[process_index]);
-            int service_time = getServiceTime(processes[process_index]);
-            get<1>(proc) = calculate_response_ratio(wait_time, service_time);
-        }
 
-        // Sort present processes by highest to lowest response ratio
-        sort(all(present_processes), descendingly_by_response_ratio);
-
-        if (!present_processes.empty())
+        int process_index = ready.best();
+        if (process_index >= 0)
         {
-            int process_index = processToIndex[get<0>(present_processes[0])];
-            while(current_instant<last_instant && get<2>(present_processes[0]) != getServiceTime(processes[process_index])){
-                timeline[current_instant][process_index]='*';
-                current_instant++;
-                get<2>(present_processes[0])++;
-            }
-            current_instant--;
-            present_processes.erase(present_processes.begin());
+            ready.set(process_index, -1);
+            int end = min(current_instant + getServiceTime(processes[process_index]), last_instant);
+            run(process_index, current_instant, end);
+            current_instant = end - 1;
             finishTime[process_index] = current_instant + 1;
             turnAroundTime[process_index] = finishTime[process_index] - getArrivalTime(processes[process_index]);
             normTurn[process_index] = (turnAroundTime[process_index] * 1.0 / getServiceTime(processes[process_index]));
         }
     }
-    fillInWaitTime();
 }
 
 void feedbackQ1()
@@ -285,7 +328,7 @@ void feedbackQ1()
                     j++;
             }
             remainingServiceTime[processIndex]--;
-            timeline[time][processIndex]='*';
+            run(processIndex, time, time + 1);
             if(remainingServiceTime[processIndex]==0){
                 finishTime[processIndex]=time+1;
                 turnAroundTime[processIndex] = (finishTime[processIndex] - arrivalTime);
@@ -303,7 +346,6 @@ void feedbackQ1()
                 j++;
         }
     }
-    fillInWaitTime();
 }
 
 void feedbackQ2i()
@@ -334,7 +376,8 @@ void feedbackQ2i()
             while(currentQuantum && remainingServiceTime[processIndex]){
                 currentQuantum--;
                 remainingServiceTime[processIndex]--;
-                timeline[temp++][processIndex]='*';
+                run(processIndex, temp, temp + 1);
+                temp++;
             }
 
             if(remainingServiceTime[processIndex]==0){
@@ -355,39 +398,52 @@ void feedbackQ2i()
                 j++;
         }
     }
-    fillInWaitTime();
 }
 
 void aging(int originalQuantum)
 {
-    vector<tuple<int,int,int>>v; //tuple of priority level, process index and total waiting time
-    int j=0,currentProcess=-1;
+    // Every waiting process gains one priority level and one unit of waiting time per
+    // scheduling step, so keys are kept relative to the step count and never change
+    // while a process waits. Tuple of (step - priority level, step - waiting time, process index):
+    // the smallest is the highest priority, then the longest wait, then the first process given.
+    priority_queue<tuple<int,int,int>, vector<tuple<int,int,int>>, greater<tuple<int,int,int>>> ready;
+    vector<int> remaining(process_count, -1); // -1: a priority-only process never completes
+    for (int i = 0; i < process_count; i++)
+        if (hasServiceTime[i])
+            remaining[i] = getServiceTime(processes[i]);
+    int j=0,currentProcess=-1,step=0;
     for(int time =0;time<last_instant;time++){
+        step++;
         while(j<process_count && getArrivalTime(processes[j])<=time){
-            v.push_back(make_tuple(getPriorityLevel(processes[j]),j,0));
+            // admitted before this step's increment: priority + 1, waited 1
+            ready.push(make_tuple(step - 1 - priorityLevels[j], step - 1, j));
             j++;
         }
-
-        for(int i=0;i<v.size();i++){
-            if(get<1>(v[i])==currentProcess){
-                get<2>(v[i])=0;
-                get<0>(v[i])=getPriorityLevel(processes[currentProcess]);
-            }
-            else{
-                get<0>(v[i])++;
-                get<2>(v[i])++;
-            }
-        }
-        sort(v.begin(),v.end(),byPriorityLevel);
-        currentProcess=get<1>(v[0]);
-        int currentQuantum = originalQuantum;
-        while(currentQuantum-- && time<last_instant){
-            timeline[time][currentProcess]='*';
+        // The process that just ran drops back to its base priority
+        if(currentProcess>=0)
+            ready.push(make_tuple(step - priorityLevels[currentProcess], step, currentProcess));
+        if(ready.empty())
+            continue;
+
+        currentProcess=get<2>(ready.top());
+        ready.pop();
+        int currentQuantum = originalQuantum, ran = 0;
+        while(currentQuantum-- && time<last_instant && remaining[currentProcess]!=0){
+            run(currentProcess, time, time + 1);
             time++;
+            ran++;
+            if(remaining[currentProcess]>0)
+                remaining[currentProcess]--;
+        }
+        if(remaining[currentProcess]==0){
+            finishTime[currentProcess] = time;
+            turnAroundTime[currentProcess] = time - getArrivalTime(processes[currentProcess]);
+            normTurn[currentProcess] = (turnAroundTime[currentProcess] * 1.0 / getServiceTime(processes[currentProcess]));
+            currentProcess = -1;
         }
-        time--;
+        if(ran)
+            time--;
     }
-    fillInWaitTime();
 }
 
 void printAlgorithm(int algorithm_index)
@@ -471,18 +527,75 @@ void printStats(int algorithm_index)
     printNormTurn();
 }
 
+string jsonEscape(const string &s)
+{
+    string escaped;
+    for (char c : s)
+    {
+        if (c == '"' || c == '\\')
+            escaped += '\\';
+        escaped += c;
+    }
+    return escaped;
+}
+
+// One JSON object per algorithm with the per-process metrics and the run segments
+void printJson(int algorithm_index)
+{
+    int algorithm_id = algorithms[algorithm_index].first - '0';
+    string name = ALGORITHMS[algorithm_id];
+    if (algorithm_id == 2)
+        name += to_string(algorithms[algorithm_index].second);
+    cout << "{\"algorithm\":\"" << name << "\",\"algorithm_id\":" << algorithm_id
+         << ",\"quantum\":" << algorithms[algorithm_index].second
+         << ",\"last_instant\":" << last_instant << ",\"processes\":[";
+    for (int i = 0; i < process_count; i++)
+    {
+        if (i)
+            cout << ",";
+        cout << "{\"name\":\"" << jsonEscape(getProcessName(processes[i]))
+             << "\",\"arrival\":" << getArrivalTime(processes[i]);
+        if (algorithm_id == 8 && hasServiceTime[i])
+            cout << ",\"priority\":" << priorityLevels[i];
+        cout << ",\"service\":" << getServiceTime(processes[i])
+             << ",\"finish\":" << finishTime[i]
+             << ",\"turnaround\":" << turnAroundTime[i] << ",\"norm_turn\":";
+        // In double precision like the Python engine; a service of 0 (an Aging priority) gives 0, not NaN
+        int serviceTime = getServiceTime(processes[i]);
+        printf("%.17g", serviceTime ? turnAroundTime[i] * 1.0 / serviceTime : 0.0);
+        cout << "}";
+    }
+    cout << "],\"segments\":[";
+    for (int i = 0; i < (int)segments.size(); i++)
+    {
+        if (i)
+            cout << ",";
+        cout << "[" << get<0>(segments[i]) << "," << get<1>(segments[i]) << "," << get<2>(segments[i]) << "]";
+    }
+    cout << "]}";
+}
+
 void printTimeline(int algorithm_index)
 {
     for (int i = 0; i <= last_instant; i++)
         cout << i % 10<<" ";
     cout <<"\n";
     cout << "------------------------------------------------\n";
+    // The grid is only built here, from the segments: a process waits ('.')
+    // from its arrival until it finishes whenever it is not running ('*')
+    vector<string> rows(process_count, string(last_instant, ' '));
+    for (int i = 0; i < process_count; i++)
+        for (int k = getArrivalTime(processes[i]); k < min(finishTime[i], last_instant); k++)
+            rows[i][k] = '.';
+    for (auto &segment : segments)
+        for (int k = get<1>(segment); k < get<2>(segment); k++)
+            rows[get<0>(segment)][k] = '*';
     for (int i = 0; i < process_count; i++)
     {
         cout << getProcessName(processes[i]) << "     |";
         for (int j = 0; j < last_instant; j++)
         {
-            cout << timeline[j][i]<<"|";
+            cout << rows[i][j]<<"|";
         }
         cout << " \n";
     }
@@ -535,12 +648,14 @@ int main()
     parse();
     for (int idx = 0; idx < (int)algorithms.size(); idx++)
     {
-        clear_timeline();
+        clear_results();
         execute_algorithm(algorithms[idx].first, algorithms[idx].second,operation);
         if (operation == TRACE)
             printTimeline(idx);
         else if (operation == SHOW_STATISTICS)
             printStats(idx);
+        else if (operation == JSON)
+            printJson(idx);
         cout << "\n";
     }
     return 0;
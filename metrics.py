@@ -0,0 +1,141 @@
+"""Scheduling metrics beyond the mean turnaround of the stats output.
+
+compute_metrics() walks a result's segments once to find each process's
+first run, the CPU's busy time and idle gaps and the context switches.
+Everything else (waiting time, percentiles, throughput) is array
+arithmetic on a ProcessTable.
+
+    python metrics.py < input.txt
+
+reads the usual main.exe input and prints a metrics report per algorithm.
+"""
+
+import sys
+
+import numpy as np
+
+import scheduler
+from process_table import PERCENTILES, ProcessTable
+
+THROUGHPUT_WINDOWS = 10  # default number of throughput windows over the schedule
+MAX_LISTED = 100         # processes listed one per line in the report
+
+
+def compute_metrics(result, window=None, percentiles=PERCENTILES):
+    """Per-process arrays and summary numbers for one result
+
+    Response time is the wait until a process first runs; processes that
+    never ran are left out of its mean and percentiles. Utilization and
+    idle gaps cover [0, end of the last segment]; with several CPUs (an
+    smp.simulate() result) utilization is over all of them and a gap is a
+    time when every CPU is idle. A context switch is a dispatch of a
+    different process than the one that last ran on that CPU.
+    Throughput counts completions in each `window` time units (by default
+    the schedule split in THROUGHPUT_WINDOWS).
+    """
+    table = ProcessTable.from_result(result)
+    cpus = result.get("cpus", 1)
+    first_run = [-1] * len(table)
+    idle_gaps = []
+    busy = switches = clock = 0
+    previous = -1
+    for process_index, start, end in result["segments"]:
+        if first_run[process_index] < 0:
+            first_run[process_index] = start
+        if start > clock:
+            idle_gaps.append((clock, start))
+        if previous >= 0 and process_index != previous:
+            switches += 1
+        previous = process_index
+        busy += end - start
+        clock = max(clock, end)
+    span = clock
+    if cpus > 1:
+        # Interleaved CPUs would look like switches; count them per CPU instead
+        switches = sum(1 for segments in result["cpu_segments"]
+                       for before, after in zip(segments, segments[1:]) if before[0] != after[0])
+
+    summary = table.summary(percentiles)
+    first_run = np.asarray(first_run, dtype=np.int64)
+    started = first_run >= 0
+    response = np.where(started, first_run - table.arrival, -1)
+    responded = response[started]
+    summary["mean_response"] = float(responded.mean()) if responded.size else 0.0
+    points = np.percentile(responded, percentiles) if responded.size and percentiles else [0.0] * len(percentiles)
+    for percentile, point in zip(percentiles, points):
+        summary[f"response_p{percentile:g}"] = float(point)
+
+    if window is None:
+        window = max(1, -(-span // THROUGHPUT_WINDOWS))
+    done = table.finish[table.finished()]
+    # A completion at time t belongs to the window (k * window, (k + 1) * window]
+    counts = np.bincount((done - 1) // window, minlength=-(-span // window))
+    throughput = [(k * window, (k + 1) * window, int(count)) for k, count in enumerate(counts)]
+
+    idle = span - busy
+    summary.update({
+        "cpus": cpus,
+        "span": span,
+        "busy": busy,
+        "idle": sum(end - start for start, end in idle_gaps) if cpus > 1 else idle,
+        "utilization": busy / (span * cpus) if span else 0.0,
+        "idle_gaps": len(idle_gaps),
+        "longest_idle_gap": max((end - start for start, end in idle_gaps), default=0),
+        "context_switches": switches,
+        "throughput": summary["finished"] / span if span else 0.0,
+    })
+    return {
+        "table": table,
+        "waiting": table.waiting(),
+        "response": response,
+        "idle_gaps": idle_gaps,
+        "window": window,
+        "throughput": throughput,
+        "summary": summary,
+    }
+
+
+def format_metrics(result, metrics=None):
+    """Plain-text metrics report for one result"""
+    if metrics is None:
+        metrics = compute_metrics(result)
+    summary = metrics["summary"]
+    table = metrics["table"]
+    lines = [f"{result['name']}: {summary['finished']}/{summary['processes']} processes finished",
+             f"{'':12}" + "".join(f"{label:>10}" for label in ["Mean"] + [f"p{p:g}" for p in PERCENTILES])]
+    for metric, label in (("turnaround", "Turnaround"), ("norm_turn", "NormTurn"),
+                          ("waiting", "Waiting"), ("response", "Response")):
+        values = [summary[f"mean_{metric}"]] + [summary[f"{metric}_p{p:g}"] for p in PERCENTILES]
+        lines.append(f"{label:12}" + "".join(f"{value:10.2f}" for value in values))
+    lines.append("")
+    capacity = f"{summary['cpus']} x {summary['span']}" if summary["cpus"] > 1 else summary["span"]
+    lines.append(f"CPU utilization  {100 * summary['utilization']:.1f}% "
+                 f"(busy {summary['busy']} of {capacity})")
+    lines.append(f"Idle             {summary['idle']} in {summary['idle_gaps']} gaps "
+                 f"(longest {summary['longest_idle_gap']})")
+    lines.append(f"Context switches {summary['context_switches']}")
+    if "migrations" in result:
+        lines.append(f"Migrations       {result['migrations']} ({result['steals']} steals)")
+    lines.append(f"Throughput       {summary['throughput']:.3f} per time unit; "
+                 f"per {metrics['window']}-unit window: "
+                 + " ".join(str(count) for _, _, count in metrics["throughput"]))
+    lines.append("")
+    lines.append(f"{'Process':12}{'Waiting':>10}{'Response':>10}")
+    finished = table.finished()
+    for process_id in range(min(len(table), MAX_LISTED)):
+        waiting = str(metrics["waiting"][process_id]) if finished[process_id] else "-"
+        response = metrics["response"][process_id]
+        lines.append(f"{table.names[process_id]:12}{waiting:>10}{response if response >= 0 else '-':>10}")
+    if len(table) > MAX_LISTED:
+        lines.append(f"... {len(table) - MAX_LISTED} more")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    _, algorithms, last_instant, processes = scheduler.parse_input(sys.stdin.read())
+    for result in scheduler.schedule(processes, last_instant, algorithms):
+        print(format_metrics(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -13,8 +13,9 @@ string operation;
 int last_instant, process_count;
 vector<pair<char, int>> algorithms;
 vector<tuple<string,int,int>> processes;
-vector<vector<char>>timeline;
-unordered_map<string,int>processToIndex;
+vector<tuple<int,int,int>>segments; // (process index, start, end) runs on the CPU, in time order
+vector<int>priorityLevels; // Aging: the third field, or the priority of a name,arrival,priority,service line
+vector<bool>hasServiceTime; // Aging: false when the third field is only a priority level
 
 
 //Results
@@ -56,9 +57,13 @@ void parse_processes()
         process_arrival_time = stoi(temp_str);
         getline(stream, temp_str, ',');
         process_service_time = stoi(temp_str);
+        priorityLevels.push_back(process_service_time);
+        // An optional fourth field is the service time; the third is then only Aging's priority
+        hasServiceTime.push_back(bool(getline(stream, temp_str, ',')));
+        if (hasServiceTime.back())
+            process_service_time = stoi(temp_str);
 
         processes.push_back( make_tuple(process_name, process_arrival_time, process_service_time) );
-        processToIndex[process_name] = i;
     }
 }
 
@@ -71,10 +76,6 @@ void parse()
     finishTime.resize(process_count);
     turnAroundTime.resize(process_count);
     normTurn.resize(process_count);
-    timeline.resize(last_instant);
-    for(int i=0; i<last_instant; i++)
-        for(int j=0; j<process_count; j++)
-            timeline[i].push_back(' ');
 }
 
 
@@ -0,0 +1,158 @@
+"""Per-phase timing of the run pipeline, exportable as a Chrome trace.
+
+Code marks its phases with the shared `profiler`:
+
+    with profiling.profiler.phase("schedule", "engine"):
+        results = scheduler.schedule(...)
+
+Each phase records its wall time and the net change in the process's
+allocated memory blocks (sys.getallocatedblocks()). With memory tracking
+on, it also records the net and peak bytes that tracemalloc sees. Both
+memory figures are process-wide: while a phase is open, allocations by
+other threads (say, the Tk thread redrawing during a worker's phase)
+count towards it too. export_chrome_trace() writes the phases as
+trace-event JSON, for chrome://tracing or Perfetto.
+
+The profiler starts disabled. phase() then returns one shared do-nothing
+context manager, so instrumented code costs a method call per phase.
+"""
+
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+MAX_EVENTS = 10000  # oldest phases are dropped beyond this
+
+_DISABLED = contextlib.nullcontext()
+
+
+class _Phase:
+    def __init__(self, profiler, name, category):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+
+    def __enter__(self):
+        self.memory = self.profiler.track_memory and tracemalloc.is_tracing()
+        if self.memory:
+            self.start_bytes = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        self.start_blocks = sys.getallocatedblocks()
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter_ns()
+        event = {"name": self.name, "category": self.category, "run": self.profiler.run,
+                 "thread": threading.current_thread().name, "tid": threading.get_ident(),
+                 "start_ns": self.start, "duration_ns": end - self.start,
+                 "process_blocks": sys.getallocatedblocks() - self.start_blocks}
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            # Nested phases reset the peak too, so an outer phase's peak only covers its tail
+            event["net_bytes"] = current - self.start_bytes
+            event["peak_bytes"] = max(peak - self.start_bytes, 0)
+        with self.profiler.lock:
+            self.profiler.events.append(event)
+        return False
+
+
+class Profiler:
+    """Collects phase timings; does nothing until enabled"""
+
+    def __init__(self):
+        self.enabled = False
+        self.track_memory = False
+        self.events = deque(maxlen=MAX_EVENTS)
+        self.lock = threading.Lock()
+        self.run = 0
+
+    def enable(self, track_memory=False):
+        self.enabled = True
+        self.track_memory = track_memory
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def disable(self):
+        self.enabled = False
+        if self.track_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.track_memory = False
+
+    def phase(self, name, category="run"):
+        """Context manager timing one phase (a no-op while disabled)"""
+        if not self.enabled:
+            return _DISABLED
+        return _Phase(self, name, category)
+
+    def record(self, name, start_ns, end_ns, category="run"):
+        """Add a phase the caller timed itself with perf_counter_ns(), even while disabled
+
+        For phases that end before profiling could be enabled, such as startup.
+        """
+        event = {"name": name, "category": category, "run": self.run,
+                 "thread": threading.current_thread().name, "tid": threading.get_ident(),
+                 "start_ns": start_ns, "duration_ns": end_ns - start_ns}
+        with self.lock:
+            self.events.append(event)
+
+    def start_run(self):
+        """Number the phases that follow as a new run"""
+        self.run += 1
+
+    def run_events(self, run=None):
+        """Phases of one run (the latest by default), in the order they ended"""
+        run = self.run if run is None else run
+        with self.lock:
+            return [event for event in self.events if event["run"] == run]
+
+    def clear(self):
+        with self.lock:
+            self.events.clear()
+
+    def chrome_trace(self):
+        """All recorded phases as a trace-event JSON document"""
+        with self.lock:
+            events = list(self.events)
+        pid = os.getpid()
+        trace = []
+        for event in events:
+            args = {key: event[key] for key in ("run", "process_blocks", "net_bytes", "peak_bytes") if key in event}
+            trace.append({"name": event["name"], "cat": event["category"], "ph": "X",
+                          "ts": event["start_ns"] / 1000, "dur": event["duration_ns"] / 1000,
+                          "pid": pid, "tid": event["tid"], "args": args})
+        names = {event["tid"]: event["thread"] for event in events}
+        trace.extend({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                     for tid, name in names.items())
+        return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path):
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+
+def format_phases(events):
+    """Table of phases: wall time, process-wide block change and (if tracked) memory"""
+    if not events:
+        return "No phases recorded. Enable profiling and run the scheduler.\n"
+    lines = [f"{'Phase':22}{'Thread':>14}{'Wall ms':>10}{'Proc blks':>10}{'Net KiB':>10}{'Peak KiB':>10}"]
+    for event in events:
+        blocks = str(event["process_blocks"]) if "process_blocks" in event else "-"
+        net = f"{event['net_bytes'] / 1024:.1f}" if "net_bytes" in event else "-"
+        peak = f"{event['peak_bytes'] / 1024:.1f}" if "peak_bytes" in event else "-"
+        lines.append(f"{event['name']:22}{event['thread'][:13]:>14}{event['duration_ns'] / 1e6:10.2f}"
+                     f"{blocks:>10}{net:>10}{peak:>10}")
+    total = sum(event["duration_ns"] for event in events) / 1e6
+    lines.append(f"{'Sum':22}{'':>14}{total:10.2f}")
+    lines.append("")
+    lines.append("Proc blks, Net and Peak are process-wide: they include other threads' allocations.")
+    return "\n".join(lines) + "\n"
+
+
+# The profiler the GUI and chart views report to
+profiler = Profiler()
@@ -0,0 +1,1119 @@
+"""In-process scheduling engine.
+
+Python port of the policies in main.cpp. It produces the same schedules
+as main.exe, so the GUI (or anything else) can run a workload directly
+instead of spawning the backend and scraping its stdout.
+"""
+
+import heapq
+import json
+import struct
+import threading
+from collections import deque
+
+TRACE = "trace"
+SHOW_STATISTICS = "stats"
+JSON = "json"
+ALGORITHMS = ["", "FCFS", "RR-", "SPN", "SRT", "HRRN", "FB-1", "FB-2i", "AGING"]
+
+# Labels printed in front of the timeline header by execute_algorithm() in main.cpp
+TRACE_LABELS = ["", "FCFS  ", "RR-", "SPN   ", "SRT   ", "HRRN  ", "FB-1  ", "FB-2i ", "Aging "]
+
+
+# ---------------------------------------------------------------------------
+# Parsing (same input layout as parser1.h)
+# ---------------------------------------------------------------------------
+
+def parse_algorithms(algorithm_chunk):
+    """Parse "1,2-4,8-1" into [(1, 1), (2, 4), (8, 1)]
+
+    Like parser1.h, a missing quantum falls back to the id itself, so a bare
+    "2" runs RR-2.
+    """
+    algorithms = []
+    for item in algorithm_chunk.split(","):
+        parts = item.strip().split("-")
+        algorithm_id = int(parts[0][0])
+        quantum = int(parts[1]) if len(parts) > 1 and parts[1] else int(parts[0])
+        algorithms.append((algorithm_id, quantum))
+    return algorithms
+
+
+def parse_processes(lines):
+    """Parse "name,arrival,service" lines into (name, arrival, service) tuples
+
+    Aging reads the third field as a priority level. A fourth field gives
+    such a process a service time too, "name,arrival,priority,service", and
+    parses to (name, arrival, priority, service); other policies only look at
+    the service time, which is always the last element.
+    """
+    return list(iter_processes(lines))
+
+
+def strip_priorities(processes):
+    """The processes as every policy but Aging sees them: (name, arrival, service)
+
+    Only Aging reads the priority of a "name,arrival,priority,service"
+    line. Returns a generator, so streamed workloads stay lazy.
+    """
+    return ((process[0], process[1], process[-1]) if len(process) == 4 else process
+            for process in processes)
+
+
+def iter_processes(lines):
+    """parse_processes() one line at a time, for workloads read as a stream"""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        name, *fields = line.split(",")
+        yield (name.strip(), *(int(field) for field in fields))
+
+
+def parse_input(text):
+    """Parse a full main.exe input into (operation, algorithms, last_instant, processes)"""
+    tokens = text.split()
+    operation, algorithm_chunk = tokens[0], tokens[1]
+    last_instant, process_count = int(tokens[2]), int(tokens[3])
+    processes = parse_processes(tokens[4:4 + process_count])
+    return operation, parse_algorithms(algorithm_chunk), last_instant, processes
+
+
+# ---------------------------------------------------------------------------
+# Result helpers
+# ---------------------------------------------------------------------------
+
+# _run() calls between two progress callbacks
+PROGRESS_INTERVAL = 4096
+
+
+class Cancelled(Exception):
+    """Raised out of execute_algorithm() when its progress callback returns False"""
+
+
+class _Progress(threading.local):
+    # Callback for the run in progress on this thread, if any
+    callback = None
+    calls = 0
+
+
+_progress = _Progress()
+
+
+def algorithm_name(algorithm_id, quantum):
+    """Name as printed by printAlgorithm() in main.cpp"""
+    if algorithm_id == 2:
+        return f"{ALGORITHMS[algorithm_id]}{quantum}"
+    return ALGORITHMS[algorithm_id]
+
+
+def _new_result(algorithm_id, quantum, processes, last_instant):
+    if isinstance(processes, _ProcessWindow):
+        return processes.new_result(algorithm_id, quantum, last_instant)
+    count = len(processes)
+    return {
+        "algorithm_id": algorithm_id,
+        "quantum": quantum,
+        "name": algorithm_name(algorithm_id, quantum),
+        "processes": processes,
+        "last_instant": last_instant,
+        "finish": [0] * count,
+        "turnaround": [0] * count,
+        "norm_turn": [0.0] * count,
+        # (process index, start, end) runs on the CPU, in time order
+        "segments": [],
+    }
+
+
+def _run(result, process_index, start, end):
+    if _progress.callback is not None:
+        _progress.calls += 1
+        if _progress.calls >= PROGRESS_INTERVAL:
+            _progress.calls = 0
+            if _progress.callback(result) is False:
+                raise Cancelled()
+    # main.cpp writes past last_instant for long non-preemptive runs; clip instead
+    end = min(end, result["last_instant"])
+    if start >= end:
+        return
+    segments = result["segments"]
+    if segments and segments[-1][0] == process_index and segments[-1][2] == start:
+        segments[-1] = (process_index, segments[-1][1], end)
+    else:
+        segments.append((process_index, start, end))
+
+
+def _finish(result, process_index, time):
+    process = result["processes"][process_index]
+    arrival_time, service_time = process[1], process[-1]
+    result["finish"][process_index] = time
+    result["turnaround"][process_index] = time - arrival_time
+    # A service of 0 would divide by zero; main.cpp's json output reports 0 for it as well
+    result["norm_turn"][process_index] = (time - arrival_time) * 1.0 / service_time if service_time else 0.0
+    sink = result.get("sink")
+    if sink is not None:
+        sink.complete(result, process_index)
+
+
+def process_segments(result):
+    """Per-process lists of (start, end, mark) intervals, '*' running and '.' waiting
+
+    A process waits from its arrival until it finishes whenever it is not
+    running, which is what fillInWaitTime() in main.cpp marks.
+    """
+    last_instant = result["last_instant"]
+    runs = [[] for _ in result["processes"]]
+    for process_index, start, end in result["segments"]:
+        runs[process_index].append((start, end))
+    lanes = []
+    for process, finish, process_runs in zip(result["processes"], result["finish"], runs):
+        lane = []
+        time = process[1]
+        wait_end = min(finish, last_instant)
+        for start, end in process_runs:
+            if time < min(start, wait_end):
+                lane.append((time, min(start, wait_end), "."))
+            lane.append((start, end, "*"))
+            time = max(time, end)
+        if time < wait_end:
+            lane.append((time, wait_end, "."))
+        lanes.append(lane)
+    return lanes
+
+
+def build_timeline(result):
+    """Dense timeline[process_index][time] grid of ' ', '*' and '.' for the trace view"""
+    timeline = []
+    for lane in process_segments(result):
+        row = [" "] * result["last_instant"]
+        for start, end, mark in lane:
+            row[start:end] = mark * (end - start)
+        timeline.append(row)
+    return timeline
+
+
+def _ratio_beats(processes, i, j, time):
+    """Whether process i's response ratio (wait + service) / service beats j's at `time`
+
+    The ratios are cross-multiplied, so they compare exactly and a service
+    time of 0 never divides by zero. Ties go to the lower input index.
+    """
+    _, arrival_i, service_i = processes[i]
+    _, arrival_j, service_j = processes[j]
+    lhs = (time - arrival_i + service_i) * service_j
+    rhs = (time - arrival_j + service_j) * service_i
+    return lhs > rhs or (lhs == rhs and i < j)
+
+
+# ---------------------------------------------------------------------------
+# Policies (tick loops, line for line as in main.cpp)
+# ---------------------------------------------------------------------------
+
+def first_come_first_serve(processes, last_instant):
+    result = _new_result(1, -1, processes, last_instant)
+    if not processes:
+        return result
+    time = processes[0][1]
+    for i, (_, _, service_time) in enumerate(processes):
+        _finish(result, i, time + service_time)
+        _run(result, i, time, time + service_time)
+        time += service_time
+    return result
+
+
+def round_robin(processes, last_instant, quantum):
+    result = _new_result(2, quantum, processes, last_instant)
+    count = len(processes)
+    queue = []  # [process index, remaining service]; front is queue[head]
+    head = 0
+    j = 0
+    if count and processes[0][1] == 0:
+        queue.append([0, processes[0][2]])
+        j += 1
+    current_quantum = quantum
+    for time in range(last_instant):
+        if head < len(queue):
+            front = queue[head]
+            front[1] -= 1
+            process_index, remaining = front
+            current_quantum -= 1
+            _run(result, process_index, time, time + 1)
+            while j < count and processes[j][1] == time + 1:
+                queue.append([j, processes[j][2]])
+                j += 1
+
+            if remaining == 0:
+                _finish(result, process_index, time + 1)
+                head += 1
+                current_quantum = quantum
+            elif current_quantum == 0:
+                head += 1
+                queue.append([process_index, remaining])
+                current_quantum = quantum
+        while j < count and processes[j][1] == time + 1:
+            queue.append([j, processes[j][2]])
+            j += 1
+    return result
+
+
+def shortest_process_next(processes, last_instant):
+    result = _new_result(3, -1, processes, last_instant)
+    count = len(processes)
+    ready = []  # (service time, index)
+    j = 0
+    i = 0
+    while i < last_instant:
+        while j < count and processes[j][1] <= i:
+            heapq.heappush(ready, (processes[j][2], j))
+            j += 1
+        if ready:
+            service_time, process_index = heapq.heappop(ready)
+            _run(result, process_index, i, i + service_time)
+            _finish(result, process_index, i + service_time)
+            i += service_time
+        else:
+            i += 1
+    return result
+
+
+def shortest_remaining_time(processes, last_instant):
+    result = _new_result(4, -1, processes, last_instant)
+    count = len(processes)
+    ready = []  # (remaining time, index)
+    j = 0
+    for i in range(last_instant):
+        while j < count and processes[j][1] == i:
+            heapq.heappush(ready, (processes[j][2], j))
+            j += 1
+        if ready:
+            remaining, process_index = heapq.heappop(ready)
+            _run(result, process_index, i, i + 1)
+            if remaining == 1:
+                _finish(result, process_index, i + 1)
+            else:
+                heapq.heappush(ready, (remaining - 1, process_index))
+    return result
+
+
+def highest_response_ratio_next(processes, last_instant):
+    result = _new_result(5, -1, processes, last_instant)
+    count = len(processes)
+    present = []  # indices of processes in the ready queue
+    j = 0
+    current_instant = 0
+    while current_instant < last_instant:
+        while j < count and processes[j][1] <= current_instant:
+            present.append(j)
+            j += 1
+        if present:
+            process_index = present[0]
+            for i in present[1:]:
+                if _ratio_beats(processes, i, process_index, current_instant):
+                    process_index = i
+            present.remove(process_index)
+            run = min(processes[process_index][2], last_instant - current_instant)
+            _run(result, process_index, current_instant, current_instant + run)
+            current_instant += run
+            _finish(result, process_index, current_instant)
+        else:
+            current_instant += 1
+    return result
+
+
+def _feedback(algorithm_id, processes, last_instant, increasing_quantum):
+    result = _new_result(algorithm_id, -1, processes, last_instant)
+    count = len(processes)
+    ready = []  # (priority level, index)
+    remaining = {}
+    j = 0
+    if count and processes[0][1] == 0:
+        heapq.heappush(ready, (0, 0))
+        remaining[0] = processes[0][2]
+        j += 1
+
+    def admit(bound):
+        # FB-1 admits arrivals exactly at time+1, FB-2i everything up to time+1
+        nonlocal j
+        while j < count and (processes[j][1] <= bound if increasing_quantum else processes[j][1] == bound):
+            heapq.heappush(ready, (0, j))
+            remaining[j] = processes[j][2]
+            j += 1
+
+    time = 0
+    while time < last_instant:
+        if ready:
+            priority_level, process_index = heapq.heappop(ready)
+            admit(time + 1)
+            current_quantum = 2 ** priority_level if increasing_quantum else 1
+            temp = time
+            while current_quantum and remaining[process_index]:
+                current_quantum -= 1
+                remaining[process_index] -= 1
+                _run(result, process_index, temp, temp + 1)
+                temp += 1
+
+            if remaining[process_index] == 0:
+                _finish(result, process_index, temp)
+            elif ready:
+                heapq.heappush(ready, (priority_level + 1, process_index))
+            else:
+                heapq.heappush(ready, (priority_level, process_index))
+            time = temp - 1
+        admit(time + 1)
+        time += 1
+    return result
+
+
+def feedback_q1(processes, last_instant):
+    return _feedback(6, processes, last_instant, increasing_quantum=False)
+
+
+def feedback_q2i(processes, last_instant):
+    return _feedback(7, processes, last_instant, increasing_quantum=True)
+
+
+def _aging_service(process):
+    # Only "name,arrival,priority,service" processes ever complete
+    return process[3] if len(process) == 4 else None
+
+
+def aging(processes, last_instant, quantum):
+    """Aging reads the third process field as the base priority level"""
+    result = _new_result(8, quantum, processes, last_instant)
+    count = len(processes)
+    entries = []  # [priority level, index, total waiting time]
+    remaining = [_aging_service(process) for process in processes]
+    j = 0
+    current_process = -1
+    time = 0
+    while time < last_instant:
+        while j < count and processes[j][1] <= time:
+            entries.append([processes[j][2], j, 0])
+            j += 1
+
+        for entry in entries:
+            if entry[1] == current_process:
+                entry[2] = 0
+                entry[0] = processes[current_process][2]
+            else:
+                entry[0] += 1
+                entry[2] += 1
+        if not entries:
+            time += 1
+            continue
+        # byPriorityLevel: highest priority, then longest wait, then input order
+        entry = max(entries, key=lambda e: (e[0], e[2], -e[1]))
+        current_process = entry[1]
+        current_quantum = quantum
+        ran = 0
+        while current_quantum != 0 and time < last_instant and remaining[current_process] != 0:
+            current_quantum -= 1
+            _run(result, current_process, time, time + 1)
+            time += 1
+            ran += 1
+            if remaining[current_process] is not None:
+                remaining[current_process] -= 1
+        if remaining[current_process] == 0:
+            _finish(result, current_process, time)
+            entries.remove(entry)
+            current_process = -1
+        if ran == 0:
+            time += 1
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Event-driven policies
+#
+# Same schedules as the tick loops above, but time jumps straight to the
+# next arrival, quantum expiry or completion, so the cost grows with the
+# number of scheduling decisions rather than with last_instant.
+# ---------------------------------------------------------------------------
+
+class _Arrivals:
+    """Admits processes in input order, the way the tick loops in main.cpp do.
+
+    Loops that test `arrival == time` only admit process j if its arrival is
+    not behind the check that first reached it; otherwise j (and everything
+    after it) is never admitted. Loops that test `arrival <= time` have no
+    such gap.
+    """
+
+    def __init__(self, processes, exact, floor=0):
+        self.processes = processes
+        self.exact = exact
+        self.floor = floor
+        self.next = 0
+
+    def next_time(self):
+        """Arrival time of the next process that can still be admitted, or None"""
+        try:
+            arrival_time = self.processes[self.next][1]
+        except IndexError:
+            return None
+        if self.exact and arrival_time < self.floor:
+            return None
+        return arrival_time
+
+    def admit(self, bound):
+        """Indices of the processes admitted by every check up to `bound`"""
+        admitted = []
+        while True:
+            arrival_time = self.next_time()
+            if arrival_time is None or arrival_time > bound:
+                return admitted
+            admitted.append(self.next)
+            self.floor = arrival_time
+            self.next += 1
+
+
+def first_come_first_serve_events(processes, last_instant):
+    result = _new_result(1, -1, processes, last_instant)
+    if not processes:
+        return result
+    time = processes[0][1]
+    for i, (_, _, service_time) in enumerate(processes):
+        _run(result, i, time, time + service_time)
+        _finish(result, i, time + service_time)
+        time += service_time
+    return result
+
+
+def round_robin_events(processes, last_instant, quantum):
+    result = _new_result(2, quantum, processes, last_instant)
+    queue = deque()  # [process index, remaining service]
+    arrivals = _Arrivals(processes, exact=True, floor=1)
+    if processes and processes[0][1] == 0:
+        queue.append([0, processes[0][2]])
+        arrivals.next = 1
+    time = 0
+    while time < last_instant:
+        if not queue:
+            next_arrival = arrivals.next_time()
+            if next_arrival is None or next_arrival >= last_instant:
+                break
+            time = next_arrival
+            queue.extend([j, processes[j][2]] for j in arrivals.admit(time))
+            continue
+        process_index, remaining = queue[0]
+        # A quantum below 1 never counts down to zero in main.cpp
+        slice_length = min(remaining, quantum) if quantum > 0 else remaining
+        end = time + slice_length
+        _run(result, process_index, time, end)
+        if end > last_instant:
+            break
+        queue.extend([j, processes[j][2]] for j in arrivals.admit(end))
+        queue.popleft()
+        if remaining == slice_length:
+            _finish(result, process_index, end)
+        else:
+            queue.append([process_index, remaining - slice_length])
+        time = end
+    return result
+
+
+def shortest_process_next_events(processes, last_instant):
+    result = _new_result(3, -1, processes, last_instant)
+    ready = []  # (service time, index)
+    arrivals = _Arrivals(processes, exact=False)
+    time = 0
+    while time < last_instant:
+        for j in arrivals.admit(time):
+            heapq.heappush(ready, (processes[j][2], j))
+        if not ready:
+            next_arrival = arrivals.next_time()
+            if next_arrival is None:
+                break
+            time = next_arrival
+            continue
+        service_time, process_index = heapq.heappop(ready)
+        _run(result, process_index, time, time + service_time)
+        _finish(result, process_index, time + service_time)
+        time += service_time
+    return result
+
+
+def shortest_remaining_time_events(processes, last_instant):
+    result = _new_result(4, -1, processes, last_instant)
+    ready = []  # (remaining time, index)
+    arrivals = _Arrivals(processes, exact=True, floor=0)
+    time = 0
+    while time < last_instant:
+        for j in arrivals.admit(time):
+            heapq.heappush(ready, (processes[j][2], j))
+        next_arrival = arrivals.next_time()
+        if not ready:
+            if next_arrival is None:
+                break
+            time = next_arrival
+            continue
+        # The shortest job only gets cheaper, so it keeps the CPU until it
+        # completes or the next arrival might preempt it
+        remaining, process_index = heapq.heappop(ready)
+        end = min(time + remaining, last_instant)
+        if next_arrival is not None:
+            end = min(end, next_arrival)
+        _run(result, process_index, time, end)
+        if end - time == remaining:
+            _finish(result, process_index, end)
+        else:
+            heapq.heappush(ready, (remaining - (end - time), process_index))
+        time = end
+    return result
+
+
+class _RatioTournament:
+    """Kinetic tournament tree over the ready processes' response ratios.
+
+    A process's ratio (t - arrival + service) / service is a line in t, so
+    each internal node keeps the winner of its two children together with
+    the first instant at which the loser overtakes it. Advancing the clock
+    only revisits nodes whose certificate has expired, and inserting or
+    removing a process recomputes one leaf-to-root path, so picking the next
+    process costs O(log n) amortized instead of a scan of the whole queue.
+    Comparisons are exact integer cross-products with ties going to the
+    lower index, matching _response_ratio_key. Leaves are reused as
+    processes leave, so the tree only grows with the ready queue.
+    """
+
+    NEVER = float("inf")
+
+    def __init__(self, processes):
+        self.processes = processes
+        self.size = 1
+        self.winner = [-1] * 2
+        self.expires = [self.NEVER] * 2
+        self.leaves = {}  # process index -> leaf slot
+        self.free = [0]
+        self.time = 0
+
+    def _beats(self, i, j, time):
+        return _ratio_beats(self.processes, i, j, time)
+
+    def _overtakes(self, winner, loser, time):
+        """First instant after `time` at which `loser` beats `winner`"""
+        _, arrival_w, service_w = self.processes[winner]
+        _, arrival_l, service_l = self.processes[loser]
+        # loser wins at t when t * slope + offset > 0 (or == 0 with the lower index)
+        slope = service_w - service_l
+        if slope <= 0:
+            return self.NEVER
+        offset = (service_l - arrival_l) * service_w - (service_w - arrival_w) * service_l
+        if loser < winner:
+            instant = -(offset // slope)
+        else:
+            instant = -offset // slope + 1
+        return max(instant, time + 1)
+
+    def _pull(self, node):
+        left, right = self.winner[2 * node], self.winner[2 * node + 1]
+        certificate = self.NEVER
+        if left < 0:
+            winner = right
+        elif right < 0:
+            winner = left
+        else:
+            winner, loser = (left, right) if self._beats(left, right, self.time) else (right, left)
+            certificate = self._overtakes(winner, loser, self.time)
+        self.winner[node] = winner
+        self.expires[node] = min(certificate, self.expires[2 * node], self.expires[2 * node + 1])
+
+    def _refresh(self, node):
+        if self.expires[node] > self.time or node >= self.size:
+            return
+        self._refresh(2 * node)
+        self._refresh(2 * node + 1)
+        self._pull(node)
+
+    def advance(self, time):
+        self.time = time
+        self._refresh(1)
+
+    def _set(self, slot, value):
+        node = self.size + slot
+        self.winner[node] = value
+        node //= 2
+        while node:
+            self._pull(node)
+            node //= 2
+
+    def _grow(self):
+        leaves = self.winner[self.size:]
+        self.free = list(range(2 * self.size - 1, self.size - 1, -1))
+        self.size *= 2
+        self.winner = [-1] * self.size + leaves + [-1] * (self.size - len(leaves))
+        self.expires = [self.NEVER] * (2 * self.size)
+        for node in range(self.size - 1, 0, -1):
+            self._pull(node)
+
+    def add(self, process_index):
+        if not self.free:
+            self._grow()
+        slot = self.free.pop()
+        self.leaves[process_index] = slot
+        self._set(slot, process_index)
+
+    def remove(self, process_index):
+        slot = self.leaves.pop(process_index)
+        self.free.append(slot)
+        self._set(slot, -1)
+
+    def best(self):
+        """Index of the highest-ratio ready process at the current time, or -1"""
+        return self.winner[1]
+
+
+def highest_response_ratio_next_events(processes, last_instant):
+    result = _new_result(5, -1, processes, last_instant)
+    ready = _RatioTournament(processes)
+    arrivals = _Arrivals(processes, exact=False)
+    time = 0
+    while time < last_instant:
+        ready.advance(time)
+        for process_index in arrivals.admit(time):
+            ready.add(process_index)
+        process_index = ready.best()
+        if process_index < 0:
+            next_arrival = arrivals.next_time()
+            if next_arrival is None:
+                break
+            time = next_arrival
+            continue
+        ready.remove(process_index)
+        end = min(time + processes[process_index][2], last_instant)
+        _run(result, process_index, time, end)
+        _finish(result, process_index, end)
+        time = end
+    return result
+
+
+def _feedback_events(algorithm_id, processes, last_instant, increasing_quantum):
+    result = _new_result(algorithm_id, -1, processes, last_instant)
+    ready = []  # (priority level, index)
+    remaining = {}
+    arrivals = _Arrivals(processes, exact=not increasing_quantum, floor=1)
+    if processes and processes[0][1] == 0:
+        heapq.heappush(ready, (0, 0))
+        remaining[0] = processes[0][2]
+        arrivals.next = 1
+
+    def admit(bound):
+        for j in arrivals.admit(bound):
+            heapq.heappush(ready, (0, j))
+            remaining[j] = processes[j][2]
+
+    time = 0
+    while time < last_instant:
+        if not ready:
+            next_arrival = arrivals.next_time()
+            if next_arrival is None or next_arrival > last_instant:
+                break
+            # An idle tick admits the arrivals of the following tick
+            time = max(time, next_arrival - 1)
+            admit(time + 1)
+            time += 1
+            continue
+        priority_level, process_index = heapq.heappop(ready)
+        admit(time + 1)
+        current_quantum = 2 ** priority_level if increasing_quantum else 1
+        left = remaining[process_index]
+        quanta = 1
+        if not ready:
+            # Alone in the queue the process keeps its level and is picked again
+            # at every quantum until an arrival shows up right after a decision
+            quanta = min(-(-left // current_quantum), -(-(last_instant - time) // current_quantum))
+            next_arrival = arrivals.next_time()
+            if next_arrival is not None:
+                quanta = min(quanta, (next_arrival - 2 - time) // current_quantum + 1)
+        served = min(quanta * current_quantum, left)
+        temp = time + served
+        _run(result, process_index, time, temp)
+        remaining[process_index] = left - served
+        if remaining[process_index] == 0:
+            del remaining[process_index]
+            _finish(result, process_index, temp)
+        elif ready:
+            heapq.heappush(ready, (priority_level + 1, process_index))
+        else:
+            heapq.heappush(ready, (priority_level, process_index))
+        admit(temp)
+        time = temp
+    return result
+
+
+def feedback_q1_events(processes, last_instant):
+    return _feedback_events(6, processes, last_instant, increasing_quantum=False)
+
+
+def feedback_q2i_events(processes, last_instant):
+    return _feedback_events(7, processes, last_instant, increasing_quantum=True)
+
+
+def aging_events(processes, last_instant, quantum):
+    result = _new_result(8, quantum, processes, last_instant)
+    # Every waiting process gains one priority level and one unit of waiting
+    # time per scheduling step, so keys are stored relative to the step count
+    # and never change while a process waits:
+    # (-(priority - step), -(waiting time - step), index), smallest first.
+    ready = []
+    remaining = {}  # index -> service left, for processes that have a service time
+    arrivals = _Arrivals(processes, exact=False)
+    current_process = -1
+    step = 0
+    time = 0
+    while time < last_instant:
+        step += 1
+        for j in arrivals.admit(time):
+            # Admitted before this step's increment: priority + 1, waited 1
+            heapq.heappush(ready, (step - 1 - processes[j][2], step - 1, j))
+            if len(processes[j]) == 4:
+                remaining[j] = processes[j][3]
+        if current_process >= 0:
+            # The process that just ran drops back to its base priority
+            heapq.heappush(ready, (step - processes[current_process][2], step, current_process))
+        if not ready:
+            next_arrival = arrivals.next_time()
+            if next_arrival is None:
+                break
+            time = next_arrival
+            continue
+        current_process = heapq.heappop(ready)[2]
+        end = min(time + quantum, last_instant) if quantum >= 0 else last_instant
+        if current_process in remaining:
+            end = min(end, time + remaining[current_process])
+            remaining[current_process] -= end - time
+        _run(result, current_process, time, end)
+        if remaining.get(current_process) == 0:
+            # Retired: it is not pushed back on the next step
+            del remaining[current_process]
+            _finish(result, current_process, end)
+            current_process = -1
+        time = max(end, time + 1)
+    return result
+
+
+TICK = "tick"
+EVENTS = "events"
+
+# algorithm id -> (tick loop, event-driven) implementations
+_POLICIES = {
+    1: (first_come_first_serve, first_come_first_serve_events),
+    2: (round_robin, round_robin_events),
+    3: (shortest_process_next, shortest_process_next_events),
+    4: (shortest_remaining_time, shortest_remaining_time_events),
+    5: (highest_response_ratio_next, highest_response_ratio_next_events),
+    6: (feedback_q1, feedback_q1_events),
+    7: (feedback_q2i, feedback_q2i_events),
+    8: (aging, aging_events),
+}
+# Policies that take a quantum: RR and Aging
+QUANTUM_POLICIES = (2, 8)
+
+
+def execute_algorithm(algorithm_id, quantum, processes, last_instant, mode=EVENTS, progress=None):
+    """Run one policy (ids as in main.cpp, 1-8) and return its result dict
+
+    `mode` is EVENTS (jump from one scheduling decision to the next) or TICK
+    (step one time unit at a time like main.cpp); both give the same result.
+    `progress`, if given, is called with the partial result every
+    PROGRESS_INTERVAL scheduled runs; returning False stops the run with
+    Cancelled.
+    """
+    if algorithm_id not in _POLICIES:
+        raise ValueError(f"Unknown algorithm id: {algorithm_id}")
+    if mode not in (TICK, EVENTS):
+        raise ValueError(f"Unknown simulation mode: {mode}")
+    policy = _POLICIES[algorithm_id][mode == EVENTS]
+    if algorithm_id != 8:
+        processes = list(strip_priorities(processes))
+    return _call_policy(policy, algorithm_id, quantum, processes, last_instant, progress)
+
+
+def _call_policy(policy, algorithm_id, quantum, processes, last_instant, progress):
+    _progress.callback, _progress.calls = progress, 0
+    try:
+        if algorithm_id in QUANTUM_POLICIES:
+            return policy(processes, last_instant, quantum)
+        result = policy(processes, last_instant)
+    finally:
+        _progress.callback = None
+    result["quantum"] = quantum
+    return result
+
+
+def schedule(processes, last_instant, algorithms, mode=EVENTS, progress=None):
+    """Run every (algorithm_id, quantum) pair against the same workload"""
+    return [execute_algorithm(algorithm_id, quantum, processes, last_instant, mode, progress)
+            for algorithm_id, quantum in algorithms]
+
+
+# ---------------------------------------------------------------------------
+# Streaming (workloads that are read, and reported, a process at a time)
+# ---------------------------------------------------------------------------
+
+class _SegmentStream:
+    """Stands in for result["segments"], holding only the newest segment
+
+    _run() may still extend the newest segment, so it is passed on only
+    once the next one starts (or the run ends).
+    """
+
+    def __init__(self, on_segment):
+        self.on_segment = on_segment
+        self.last = None
+        self.count = 0
+
+    def __bool__(self):
+        return self.last is not None
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        return self.last
+
+    def __setitem__(self, index, segment):
+        self.last = segment
+
+    def append(self, segment):
+        self.flush()
+        self.last = segment
+        self.count += 1
+
+    def flush(self):
+        if self.last is not None and self.on_segment is not None:
+            self.on_segment(self.last)
+        self.last = None
+
+
+class _ProcessWindow:
+    """Stands in for the processes list of the event-driven policies
+
+    Process j is read from the source the first time a policy looks at it
+    and dropped again when it completes, so memory follows the ready queue
+    instead of the whole workload. The source must be sorted by arrival,
+    as the policies assume anyway.
+    """
+
+    def __init__(self, source, on_finish, on_segment=None):
+        self.source = iter(source)
+        self.on_finish = on_finish
+        self.on_segment = on_segment
+        self.live = {}  # index -> process, admitted or about to be
+        self.read = 0
+        self.count = 0
+        self.finished = 0
+        self.turnaround_sum = 0
+        self.norm_turn_sum = 0.0
+
+    def __getitem__(self, index):
+        while index >= self.read:
+            try:
+                process = next(self.source)
+            except StopIteration:
+                raise IndexError(index) from None
+            self.live[self.read] = process
+            self.read += 1
+        return self.live[index]
+
+    def __bool__(self):
+        if self.read == 0:
+            try:
+                self[0]
+            except IndexError:
+                return False
+        return True
+
+    def __iter__(self):
+        index = 0
+        while True:
+            try:
+                yield self[index]
+            except IndexError:
+                return
+            index += 1
+
+    def new_result(self, algorithm_id, quantum, last_instant):
+        return {
+            "algorithm_id": algorithm_id,
+            "quantum": quantum,
+            "name": algorithm_name(algorithm_id, quantum),
+            "processes": self,
+            "last_instant": last_instant,
+            # Only the live processes have entries; complete() moves them out
+            "finish": {},
+            "turnaround": {},
+            "norm_turn": {},
+            "segments": _SegmentStream(self.on_segment),
+            "sink": self,
+        }
+
+    def complete(self, result, index):
+        self._emit(index, self.live.pop(index), result["finish"].pop(index),
+                   result["turnaround"].pop(index), result["norm_turn"].pop(index))
+
+    def _emit(self, index, process, finish, turnaround, norm_turn):
+        self.count += 1
+        if finish:
+            self.finished += 1
+        self.turnaround_sum += turnaround
+        self.norm_turn_sum += norm_turn
+        self.on_finish({"index": index, "name": process[0], "arrival": process[1],
+                        **({"priority": process[2]} if len(process) == 4 else {}),
+                        "service": process[-1], "finish": finish, "turnaround": turnaround,
+                        "norm_turn": norm_turn})
+
+    def close(self, result):
+        """Report the processes that never completed: the live ones, then the unread rest"""
+        result["segments"].flush()
+        for index in sorted(self.live):
+            self._emit(index, self.live[index], 0, 0, 0.0)
+        self.live.clear()
+        for process in self.source:
+            self._emit(self.read, process, 0, 0, 0.0)
+            self.read += 1
+
+
+def stream_algorithm(algorithm_id, quantum, processes, last_instant, on_finish, on_segment=None,
+                     progress=None):
+    """Run one policy over an iterable of processes in bounded memory
+
+    Like execute_algorithm() in EVENTS mode, but nothing is accumulated:
+    `on_finish` gets each process's record (the fields of
+    result_to_record() plus its "index") as soon as it completes, or at the
+    end if it never does, and `on_segment` gets each (process index, start,
+    end) run in time order. Returns the compare.summarize() row.
+    """
+    if algorithm_id not in _POLICIES:
+        raise ValueError(f"Unknown algorithm id: {algorithm_id}")
+    if algorithm_id != 8:
+        processes = strip_priorities(processes)
+    window = _ProcessWindow(processes, on_finish, on_segment)
+    policy = _POLICIES[algorithm_id][1]
+    result = _call_policy(policy, algorithm_id, quantum, window, last_instant, progress)
+    window.close(result)
+    count = window.count
+    finished = window.finished
+    return {
+        "name": result["name"],
+        "algorithm_id": algorithm_id,
+        "quantum": quantum,
+        # Over the finished processes only, like ProcessTable.summary()
+        "mean_turnaround": window.turnaround_sum / finished if finished else 0.0,
+        "mean_norm_turn": window.norm_turn_sum / finished if finished else 0.0,
+        "finished": finished,
+        "processes": count,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Output (same layout as printTimeline/printStats/printJson in main.cpp)
+# ---------------------------------------------------------------------------
+
+def format_trace(result):
+    algorithm_id = result["algorithm_id"]
+    label = TRACE_LABELS[algorithm_id]
+    if algorithm_id == 2:
+        label = f"RR-{result['quantum']}  "
+    lines = [label + "".join(f"{i % 10} " for i in range(result["last_instant"] + 1))]
+    lines.append("-" * 48)
+    for process, row in zip(result["processes"], build_timeline(result)):
+        lines.append(f"{process[0]}     |" + "".join(f"{mark}|" for mark in row) + " ")
+    lines.append("-" * 48)
+    return "\n".join(lines) + "\n"
+
+
+def _float32(value):
+    # main.cpp keeps normTurn (and its running sum) in single precision
+    return struct.unpack("f", struct.pack("f", value))[0]
+
+
+def _format_float(value):
+    return f"{value:2.2f}" if value >= 10 else f" {value:2.2f}"
+
+
+def format_stats(result):
+    processes = result["processes"]
+    count = len(processes)
+    lines = [result["name"]]
+    lines.append("Process    " + "".join(f"|  {process[0]}  " for process in processes) + "|")
+    lines.append("Arrival    " + "".join(f"|{process[1]:3d}  " for process in processes) + "|")
+    lines.append("Service    |" + "".join(f"{process[-1]:3d}  |" for process in processes) + " Mean|")
+    lines.append("Finish     " + "".join(f"|{finish:3d}  " for finish in result["finish"]) + "|-----|")
+    mean_turnaround = sum(result["turnaround"]) / count if count else 0.0
+    lines.append("Turnaround |" + "".join(f"{t:3d}  |" for t in result["turnaround"])
+                 + _format_float(mean_turnaround) + "|")
+    norm_turn = [_float32(n) for n in result["norm_turn"]]
+    norm_turn_sum = 0.0
+    for n in norm_turn:
+        norm_turn_sum = _float32(norm_turn_sum + n)
+    mean_norm_turn = norm_turn_sum / count if count else 0.0
+    lines.append("NormTurn   |" + "".join(_format_float(n) + "|" for n in norm_turn)
+                 + _format_float(mean_norm_turn) + "|")
+    return "\n".join(lines) + "\n"
+
+
+def result_to_record(result):
+    """Plain JSON-ready record: per-process metrics plus [process index, start, end] segments"""
+    return {
+        "algorithm": result["name"],
+        "algorithm_id": result["algorithm_id"],
+        "quantum": result["quantum"],
+        "last_instant": result["last_instant"],
+        "processes": [
+            {"name": process[0], "arrival": process[1],
+             **({"priority": process[2]} if len(process) == 4 else {}),
+             "service": process[-1], "finish": finish, "turnaround": turnaround, "norm_turn": norm_turn}
+            for process, finish, turnaround, norm_turn
+            in zip(result["processes"], result["finish"], result["turnaround"], result["norm_turn"])
+        ],
+        "segments": [list(segment) for segment in result["segments"]],
+    }
+
+
+def record_to_result(record):
+    """Inverse of result_to_record()"""
+    processes = record["processes"]
+    return {
+        "algorithm_id": record["algorithm_id"],
+        "quantum": record["quantum"],
+        "name": record["algorithm"],
+        "processes": [(p["name"], p["arrival"], p["priority"], p["service"]) if "priority" in p
+                      else (p["name"], p["arrival"], p["service"]) for p in processes],
+        "last_instant": record["last_instant"],
+        "finish": [p["finish"] for p in processes],
+        "turnaround": [p["turnaround"] for p in processes],
+        "norm_turn": [float(p["norm_turn"]) for p in processes],
+        "segments": [tuple(segment) for segment in record["segments"]],
+    }
+
+
+def format_json(result):
+    """One line of the `json` operation output"""
+    return json.dumps(result_to_record(result), separators=(",", ":"))
+
+
+def parse_json(output):
+    """Read `json` operation output (from this engine or main.exe) back into results"""
+    return [record_to_result(json.loads(line)) for line in output.splitlines() if line.strip()]
+
+
+def format_output(operation, results):
+    """Render results exactly like main.exe does for the given operation"""
+    chunks = []
+    for result in results:
+        if operation == TRACE:
+            chunks.append(format_trace(result))
+        elif operation == SHOW_STATISTICS:
+            chunks.append(format_stats(result))
+        elif operation == JSON:
+            chunks.append(format_json(result))
+        chunks.append("\n")
+    return "".join(chunks)
+
+
+def run(text, mode=EVENTS, progress=None):
+    """Drop-in replacement for piping `text` through main.exe; returns (output, results)"""
+    operation, algorithms, last_instant, processes = parse_input(text)
+    results = schedule(processes, last_instant, algorithms, mode, progress)
+    return format_output(operation, results), results
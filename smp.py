@@ -0,0 +1,374 @@
+"""Multi-processor (SMP) scheduling simulation.
+
+The policies in scheduler.py model a single CPU. simulate() runs the same
+eight policies on N CPUs. They share either one global ready queue, or use
+one queue per CPU: arrivals join the shortest queue, and a CPU whose
+queue is empty steals from the longest one. Decisions happen at arrivals,
+quantum expiries and completions, as in the event-driven engine:
+
+    result = smp.simulate(2, 4, processes, 1000, cpus=8, queues=smp.PER_CPU)
+    smp.cpu_lanes(result)    # {"CPU 0": [(start, end, process name)], ...}
+
+The result has the engine's keys plus "cpus", "queues", "cpu_segments"
+(one list of (process index, start, end) runs per CPU), "migrations" and
+"steals". Its "segments" holds every CPU's runs ordered by start time.
+With one CPU the single-CPU engine is used, so the schedule is exactly
+main.cpp's. On several CPUs each policy follows its textbook rule:
+FCFS, SPN and HRRN run a process to completion; RR requeues it at the
+tail after each quantum; SRT preempts the CPU with the most remaining
+work when a shorter process waits; FB-1 / FB-2i demote after each
+quantum unless the queue is empty; Aging ages every process still
+waiting whenever its queue dispatches.
+"""
+
+import heapq
+from collections import deque
+
+import scheduler
+
+GLOBAL = "global"
+PER_CPU = "per-cpu"
+
+
+class _Fifo:
+    """FCFS and RR: served in the order queued"""
+
+    def __init__(self, simulation):
+        self.items = deque()
+
+    def __len__(self):
+        return len(self.items)
+
+    def push(self, process_index):
+        self.items.append(process_index)
+
+    def pop(self, time):
+        return self.items.popleft()
+
+
+class _Shortest:
+    """SPN and SRT: least remaining service first, ties to the lower index"""
+
+    def __init__(self, simulation):
+        self.remaining = simulation.remaining
+        self.heap = []
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, process_index):
+        heapq.heappush(self.heap, (self.remaining[process_index], process_index))
+
+    def pop(self, time):
+        return heapq.heappop(self.heap)[1]
+
+    def peek(self):
+        """Remaining service of the process pop() would return"""
+        return self.heap[0][0]
+
+
+class _Ratio:
+    """HRRN: highest (wait + service) / service at dispatch time, ties to the lower index"""
+
+    def __init__(self, simulation):
+        self.processes = simulation.processes
+        self.items = []
+
+    def __len__(self):
+        return len(self.items)
+
+    def push(self, process_index):
+        self.items.append(process_index)
+
+    def pop(self, time):
+        items, processes = self.items, self.processes
+        best = 0
+        for k in range(1, len(items)):
+            i, j = items[k], items[best]
+            lhs = (time - processes[i][1] + processes[i][2]) * processes[j][2]
+            rhs = (time - processes[j][1] + processes[j][2]) * processes[i][2]
+            if lhs > rhs or (lhs == rhs and i < j):
+                best = k
+        items[best], items[-1] = items[-1], items[best]
+        return items.pop()
+
+
+class _Levels:
+    """FB-1 / FB-2i: one FIFO per priority level, lowest level first"""
+
+    def __init__(self, simulation):
+        self.level = simulation.level
+        self.levels = []
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def push(self, process_index):
+        level = self.level[process_index]
+        while len(self.levels) <= level:
+            self.levels.append(deque())
+        self.levels[level].append(process_index)
+        self.count += 1
+
+    def pop(self, time):
+        self.count -= 1
+        for queue in self.levels:
+            if queue:
+                return queue.popleft()
+
+
+class _Aging:
+    """Aging: each dispatch raises the priority of every process still waiting here
+
+    A process queued at step s with priority p has priority p + (now - s),
+    so the highest is the smallest s - p; ties go to the longest waiting.
+    """
+
+    def __init__(self, simulation):
+        self.processes = simulation.processes
+        self.heap = []
+        self.step = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, process_index):
+        heapq.heappush(self.heap, (self.step - self.processes[process_index][2], self.step, process_index))
+
+    def pop(self, time):
+        self.step += 1
+        return heapq.heappop(self.heap)[2]
+
+
+_QUEUES = {1: _Fifo, 2: _Fifo, 3: _Shortest, 4: _Shortest, 5: _Ratio, 6: _Levels, 7: _Levels, 8: _Aging}
+
+
+class _Simulation:
+    def __init__(self, algorithm_id, quantum, processes, last_instant, cpus, queues, steal, progress=None):
+        self.algorithm_id = algorithm_id
+        self.progress = progress
+        self.quantum = quantum
+        self.processes = processes
+        self.last_instant = last_instant
+        self.cpus = cpus
+        self.steal = steal and queues == PER_CPU
+        count = len(processes)
+        if algorithm_id == 8:
+            # Aging only finishes processes given a service time
+            self.remaining = [process[3] if len(process) == 4 else None for process in processes]
+        else:
+            self.remaining = [process[-1] for process in processes]
+        self.level = [0] * count
+        self.last_cpu = [-1] * count
+        self.queues = [_QUEUES[algorithm_id](self) for _ in range(1 if queues == GLOBAL else cpus)]
+        self.current = [-1] * cpus
+        self.start = [0] * cpus
+        self.end = [0] * cpus
+        self.busy = []  # (slice end, cpu, dispatch number) heap; stale after a preemption
+        self.dispatches = [0] * cpus
+        self.idle = list(range(cpus))  # heap of idle CPUs, lowest first
+        self.waiting = 0  # processes queued over all queues
+        self.result = {
+            "algorithm_id": algorithm_id,
+            "quantum": quantum,
+            "name": scheduler.algorithm_name(algorithm_id, quantum),
+            "processes": processes,
+            "last_instant": last_instant,
+            "finish": [0] * count,
+            "turnaround": [0] * count,
+            "norm_turn": [0.0] * count,
+            "segments": [],
+            "cpus": cpus,
+            "queues": queues,
+            "cpu_segments": [[] for _ in range(cpus)],
+            "migrations": 0,
+            "steals": 0,
+        }
+
+    def _queue(self, cpu):
+        return self.queues[0] if len(self.queues) == 1 else self.queues[cpu]
+
+    def _slice(self, process_index):
+        remaining = self.remaining[process_index]
+        if self.algorithm_id in (2, 8):
+            length = self.quantum
+        elif self.algorithm_id == 6:
+            length = 1
+        elif self.algorithm_id == 7:
+            length = 2 ** self.level[process_index]
+        else:
+            return remaining
+        return length if remaining is None else min(length, remaining)
+
+    def _push(self, queue, process_index):
+        queue.push(process_index)
+        self.waiting += 1
+
+    def _dispatch(self, cpu, queue, time):
+        """Start the next process of `queue` on the idle `cpu`"""
+        process_index = queue.pop(time)
+        self.waiting -= 1
+        if self.last_cpu[process_index] not in (-1, cpu):
+            self.result["migrations"] += 1
+        self.last_cpu[process_index] = cpu
+        self.current[cpu] = process_index
+        self.start[cpu] = time
+        self.end[cpu] = time + self._slice(process_index)
+        self.dispatches[cpu] += 1
+        heapq.heappush(self.busy, (self.end[cpu], cpu, self.dispatches[cpu]))
+
+    def _stop(self, cpu, time, idle=True):
+        """Take the running process off `cpu` at `time`, recording what it ran"""
+        process_index, start = self.current[cpu], self.start[cpu]
+        self.current[cpu] = -1
+        self.dispatches[cpu] += 1  # its entry in self.busy is stale now
+        if idle:
+            heapq.heappush(self.idle, cpu)
+        end = min(time, self.last_instant)
+        if start < end:
+            segments = self.result["cpu_segments"][cpu]
+            if segments and segments[-1][0] == process_index and segments[-1][2] == start:
+                segments[-1] = (process_index, segments[-1][1], end)
+            else:
+                segments.append((process_index, start, end))
+        if self.remaining[process_index] is not None:
+            self.remaining[process_index] -= time - start
+        return process_index
+
+    def _finish(self, process_index, time):
+        process = self.processes[process_index]
+        result = self.result
+        result["finish"][process_index] = time
+        result["turnaround"][process_index] = time - process[1]
+        result["norm_turn"][process_index] = (time - process[1]) * 1.0 / process[-1] if process[-1] else 0.0
+
+    def _admit(self, process_index):
+        if len(self.queues) == 1:
+            queue = self.queues[0]
+        else:
+            # Join the CPU with the least work queued or running
+            cpu = min(range(self.cpus), key=lambda c: (len(self.queues[c]) + (self.current[c] >= 0), c))
+            queue = self.queues[cpu]
+        self._push(queue, process_index)
+
+    def _fill(self, time):
+        """Give idle CPUs a process, stealing from the longest queue for per-CPU queues"""
+        if not self.waiting or not self.idle:
+            return
+        if len(self.queues) == 1:
+            while self.idle and self.waiting:
+                self._dispatch(heapq.heappop(self.idle), self.queues[0], time)
+            return
+        for cpu in sorted(self.idle):
+            if self.queues[cpu]:
+                self._dispatch(cpu, self.queues[cpu], time)
+        self.idle = [cpu for cpu in self.idle if self.current[cpu] < 0]
+        heapq.heapify(self.idle)
+        while self.steal and self.idle and self.waiting:
+            self.result["steals"] += 1
+            self._dispatch(heapq.heappop(self.idle), max(self.queues, key=len), time)
+
+    def _preempt(self, time):
+        """SRT: a waiting process with less work left displaces the running one with the most"""
+        for index, queue in enumerate(self.queues):
+            domain = range(self.cpus) if len(self.queues) == 1 else [index]
+            while queue:
+                cpu = max(domain, key=lambda c: self._left(c, time))
+                if queue.peek() >= self._left(cpu, time):
+                    break
+                preempted = self._stop(cpu, time, idle=False)
+                self._dispatch(cpu, queue, time)
+                self._push(queue, preempted)
+
+    def _left(self, cpu, time):
+        if self.current[cpu] < 0:
+            return -1
+        return self.remaining[self.current[cpu]] - (time - self.start[cpu])
+
+    def run(self):
+        processes, cpus = self.processes, self.cpus
+        arriving = 0
+        time = 0
+        busy = self.busy
+        calls = 0
+        while True:
+            if self.progress is not None:
+                calls += 1
+                if calls >= scheduler.PROGRESS_INTERVAL:
+                    calls = 0
+                    if self.progress(self.result) is False:
+                        raise scheduler.Cancelled()
+            expired = []
+            while busy and busy[0][0] <= time:
+                _, cpu, dispatch = heapq.heappop(busy)
+                if dispatch == self.dispatches[cpu]:
+                    expired.append((cpu, self._stop(cpu, time)))
+            expired.sort()
+            admitted = arriving
+            while arriving < len(processes) and processes[arriving][1] <= time:
+                self._admit(arriving)
+                arriving += 1
+            # Like the single-CPU RR, a process whose quantum expired queues behind new arrivals
+            for cpu, process_index in expired:
+                if self.remaining[process_index] == 0:
+                    self._finish(process_index, time)
+                    continue
+                queue = self._queue(cpu)
+                if self.algorithm_id in (6, 7) and queue:
+                    self.level[process_index] += 1
+                self._push(queue, process_index)
+            if time < self.last_instant:
+                self._fill(time)
+                if self.algorithm_id == 4 and arriving > admitted:
+                    # Running processes only get shorter: arrivals are the only reason to preempt
+                    self._preempt(time)
+            while busy and busy[0][2] != self.dispatches[busy[0][1]]:
+                heapq.heappop(busy)
+            events = [busy[0][0]] if busy else []
+            if arriving < len(processes):
+                events.append(processes[arriving][1])
+            if not events or min(events) > self.last_instant:
+                break
+            time = min(events)
+        for cpu in range(cpus):
+            if self.current[cpu] >= 0:
+                self._stop(cpu, self.last_instant)
+        merged = sorted((start, cpu, process_index, end)
+                        for cpu, segments in enumerate(self.result["cpu_segments"])
+                        for process_index, start, end in segments)
+        self.result["segments"] = [(process_index, start, end) for start, _, process_index, end in merged]
+        return self.result
+
+
+def simulate(algorithm_id, quantum, processes, last_instant, cpus=1, queues=GLOBAL, steal=True, progress=None):
+    """Run one policy (ids as in main.cpp, 1-8) on `cpus` processors
+
+    `queues` is GLOBAL (one shared ready queue) or PER_CPU (one queue per
+    CPU, with idle CPUs stealing from the longest queue when `steal`).
+    `progress`, if given, is called with the partial result every
+    scheduler.PROGRESS_INTERVAL events; returning False stops the run with
+    scheduler.Cancelled.
+    """
+    if algorithm_id not in _QUEUES:
+        raise ValueError(f"Unknown algorithm id: {algorithm_id}")
+    if cpus < 1:
+        raise ValueError("Need at least one CPU")
+    if queues not in (GLOBAL, PER_CPU):
+        raise ValueError(f"Unknown queue layout: {queues}")
+    if cpus == 1:
+        result = scheduler.execute_algorithm(algorithm_id, quantum, processes, last_instant, progress=progress)
+        result.update(cpus=1, queues=queues, cpu_segments=[list(result["segments"])], migrations=0, steals=0)
+        return result
+    if algorithm_id in (2, 8) and quantum < 1:
+        raise ValueError(f"{scheduler.ALGORITHMS[algorithm_id]} needs a quantum of at least 1")
+    if algorithm_id != 8:
+        processes = list(scheduler.strip_priorities(processes))
+    return _Simulation(algorithm_id, quantum, processes, last_instant, cpus, queues, steal, progress).run()
+
+
+def cpu_lanes(result):
+    """One Gantt lane per CPU: "CPU n" -> [(start, end, process name)]"""
+    names = [process[0] for process in result["processes"]]
+    return {f"CPU {cpu}": [(start, end, names[process_index]) for process_index, start, end in segments]
+            for cpu, segments in enumerate(result.get("cpu_segments", [result["segments"]]))}
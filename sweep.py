@@ -0,0 +1,145 @@
+"""Tune the RR / Aging quantum by sweeping a range of values.
+
+Every (workload, quantum) pair is scheduled in a process pool. The metrics
+of each quantum are averaged over the workloads into one curve per
+metric, and the quantum with the lowest objective is reported.
+
+    python sweep.py workloads/ -a 2 -q 1-20
+    python sweep.py big.txt -a 8 -q 1,2,4,8,16 -t 500 --objective turnaround_p99
+"""
+
+import argparse
+import csv
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import scheduler
+import metrics
+from batch import default_last_instant, iter_workloads
+
+# Policies that take a quantum
+SWEEP_ALGORITHMS = scheduler.QUANTUM_POLICIES
+CURVES = ["mean_turnaround", "turnaround_p99", "mean_norm_turn", "mean_waiting", "context_switches"]
+DEFAULT_QUANTA = "1-20"
+
+
+def parse_quanta(text):
+    """Parse "1-20", "1-20:2" (a step) or "1,2,4,8" (or a mix) into a sorted list of quanta"""
+    quanta = set()
+    for item in text.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        bounds, _, step = item.partition(":")
+        low, _, high = bounds.partition("-")
+        low = int(low)
+        high = int(high) if high else low
+        step = int(step) if step else 1
+        if step <= 0 or high < low:
+            raise ValueError(f"Bad quantum range: {item}")
+        quanta.update(range(low, high + 1, step))
+    if not quanta:
+        raise ValueError("No quanta given")
+    return sorted(quanta)
+
+
+def _sweep_one(job):
+    workload_index, algorithm_id, quantum, processes, last_instant = job
+    result = scheduler.execute_algorithm(algorithm_id, quantum, processes, last_instant)
+    summary = metrics.compute_metrics(result, percentiles=(99,))["summary"]
+    row = {curve: summary[curve] for curve in CURVES}
+    row.update(workload=workload_index, quantum=quantum,
+               finished=summary["finished"], processes=summary["processes"])
+    return row
+
+
+def sweep(workloads, algorithm_id, quanta, last_instant=None, max_workers=None):
+    """One curve row per quantum, each metric averaged over the workloads
+
+    `workloads` is a list of process lists. Without `last_instant` each
+    workload gets a horizon long enough to finish it (see
+    batch.default_last_instant). max_workers=1 runs everything in this
+    process.
+    """
+    if algorithm_id not in SWEEP_ALGORITHMS:
+        raise ValueError(f"Only RR (2) and Aging (8) take a quantum, not algorithm {algorithm_id}")
+    jobs = [(workload_index, algorithm_id, quantum, processes,
+             default_last_instant(processes) if last_instant is None else last_instant)
+            for quantum in quanta for workload_index, processes in enumerate(workloads)]
+    if max_workers == 1 or len(jobs) <= 1:
+        rows = [_sweep_one(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            rows = list(pool.map(_sweep_one, jobs, chunksize=max(1, len(jobs) // 64)))
+
+    curve = []
+    for quantum in quanta:
+        runs = [row for row in rows if row["quantum"] == quantum]
+        point = {"name": scheduler.algorithm_name(algorithm_id, quantum), "quantum": quantum,
+                 "finished": sum(row["finished"] for row in runs),
+                 "processes": sum(row["processes"] for row in runs)}
+        for name in CURVES:
+            point[name] = sum(row[name] for row in runs) / len(runs) if runs else 0.0
+        curve.append(point)
+    return curve
+
+
+def best_quantum(curve, objective="mean_turnaround"):
+    """Point that finishes the most processes, then has the lowest objective
+
+    The means only cover finished processes, so a quantum that finishes
+    fewer of them must not win on its objective alone.
+    """
+    if not curve:
+        return None
+    return min(curve, key=lambda point: (-point["finished"], point[objective], point["quantum"]))
+
+
+def format_sweep(curve, objective="mean_turnaround"):
+    """Table of the curve with the best quantum marked"""
+    best = best_quantum(curve, objective)
+    lines = ["Quantum |  Mean TAT |   p99 TAT | Mean NormTurn | Mean Wait | Switches | Finished",
+             "--------+-----------+-----------+---------------+-----------+----------+---------"]
+    for point in curve:
+        marker = " *" if point is best else ""
+        lines.append(f"{point['quantum']:7d} |{point['mean_turnaround']:10.2f} |{point['turnaround_p99']:10.2f} |"
+                     f"{point['mean_norm_turn']:14.2f} |{point['mean_waiting']:10.2f} |"
+                     f"{point['context_switches']:9.1f} | {point['finished']}/{point['processes']}{marker}")
+    if best is not None:
+        lines.append("")
+        lines.append(f"Best quantum by {objective}: {best['quantum']} ({best['name']})")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep the RR or Aging quantum over workload files.")
+    parser.add_argument("paths", nargs="+", help="workload files or directories ('-' for stdin)")
+    parser.add_argument("-a", "--algorithm", type=int, choices=SWEEP_ALGORITHMS, default=2,
+                        help="2 for RR, 8 for Aging (default: 2)")
+    parser.add_argument("-q", "--quanta", default=DEFAULT_QUANTA,
+                        help=f"quanta to try, e.g. 1-20, 1-64:4 or 1,2,4,8 (default: {DEFAULT_QUANTA})")
+    parser.add_argument("-t", "--last-instant", type=int, default=None,
+                        help="simulation horizon (default: enough to finish every workload)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--objective", choices=CURVES, default="mean_turnaround",
+                        help="metric the best quantum minimizes")
+    parser.add_argument("-f", "--format", choices=["table", "csv"], default="table")
+    args = parser.parse_args(argv)
+
+    try:
+        quanta = parse_quanta(args.quanta)
+    except ValueError as e:
+        parser.error(str(e))
+    workloads = [processes for _, processes in iter_workloads(args.paths)]
+    curve = sweep(workloads, args.algorithm, quanta, args.last_instant, args.jobs)
+    if args.format == "csv":
+        writer = csv.DictWriter(sys.stdout, fieldnames=["quantum"] + CURVES + ["finished", "processes"],
+                                extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(curve)
+    else:
+        print(format_sweep(curve, args.objective), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+import compare
+
+
+def test_algorithms_with_quantum():
+    assert compare.algorithms_with_quantum() == compare.ALL_ALGORITHMS
+    algorithms = compare.algorithms_with_quantum(5)
+    assert [algorithm_id for algorithm_id, _ in algorithms] == list(range(1, 9))
+    assert dict(algorithms)[2] == dict(algorithms)[8] == 5
+    assert dict(algorithms)[3] == 3
+
+
+def test_format_comparison_names_the_quanta():
+    processes = [("A", 0, 3), ("B", 2, 6), ("C", 4, 4)]
+    rows = compare.compare_algorithms(processes, 20, compare.algorithms_with_quantum(4), max_workers=1)
+    table = compare.format_comparison(rows)
+    assert "RR-4 " in table and "AGING-4 " in table
@@ -0,0 +1,50 @@
+import random
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import scheduler
+
+MAIN_CPP = Path(__file__).with_name("main.cpp")
+
+
+@pytest.fixture(scope="module")
+def main_exe(tmp_path_factory):
+    compiler = shutil.which("g++")
+    if compiler is None:
+        pytest.skip("g++ is needed to build main.cpp")
+    exe = tmp_path_factory.mktemp("main") / "main"
+    subprocess.run([compiler, "-O2", "-o", str(exe), str(MAIN_CPP)], check=True)
+    return exe
+
+
+def run_json(exe, text):
+    output = subprocess.run([str(exe)], input=text, capture_output=True, text=True, check=True).stdout
+    return scheduler.parse_json(output)
+
+
+def test_json_parity_with_zero_service(main_exe):
+    # A three-field Aging line puts its priority, here 0, in the service slot
+    text = f"{scheduler.JSON}\n8-1,8\n20\n3\nA,0,0\nB,1,3\nC,2,2"
+    _, expected = scheduler.run(text)
+    results = run_json(main_exe, text)
+    assert [result["norm_turn"] for result in results] == [result["norm_turn"] for result in expected]
+    assert [result["segments"] for result in results] == [result["segments"] for result in expected]
+
+
+def random_lines(seed, count=25, priorities=False):
+    rng = random.Random(seed)
+    arrivals = sorted([0] + [rng.randint(1, 4 * count) for _ in range(count - 1)])
+    return [f"P{i},{arrival}," + (f"{rng.randint(0, 9)}," if priorities else "") + f"{rng.randint(1, 9)}"
+            for i, arrival in enumerate(arrivals)]
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("algorithms, priorities", [("1,2-1,2-3,3,4,5,6,7", False), ("8-1,8-3", True)])
+def test_json_parity_with_engine(main_exe, seed, algorithms, priorities):
+    lines = random_lines(seed, priorities=priorities)
+    text = f"{scheduler.JSON}\n{algorithms}\n{80 + 10 * seed}\n{len(lines)}\n" + "\n".join(lines)
+    output, _ = scheduler.run(text)
+    assert run_json(main_exe, text) == scheduler.parse_json(output)
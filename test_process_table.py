@@ -0,0 +1,40 @@
+import warnings
+
+import compare
+import scheduler
+from process_table import ProcessTable
+
+# Three-field Aging lines carry the priority in the service slot, so it can be 0
+AGING_PRIORITY_ZERO = [("A", 0, 0), ("B", 1, 3), ("C", 2, 2)]
+
+
+def test_zero_service_norm_turn_is_zero():
+    result = scheduler.execute_algorithm(8, 1, AGING_PRIORITY_ZERO, 20)
+    table = ProcessTable.from_result(result)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        summary = table.summary()
+        norm_turn = table.norm_turn()
+    assert list(norm_turn) == [0.0, 0.0, 0.0]
+    assert summary["mean_norm_turn"] == 0.0
+    assert compare.summarize(result)["mean_norm_turn"] == 0.0
+
+
+def test_means_cover_finished_processes_only():
+    table = ProcessTable(["A", "B", "C"], [0, 0, 2], [2, 4, 3], finish=[2, 6, 0])
+    summary = table.summary(percentiles=())
+    assert summary["finished"] == 2
+    assert summary["mean_turnaround"] == 4.0
+    assert summary["mean_norm_turn"] == 1.25
+    assert summary["mean_waiting"] == 1.0
+
+
+def test_stream_summary_matches_table_summary():
+    processes = [("A", 0, 3), ("B", 2, 6), ("C", 4, 4), ("D", 6, 5), ("E", 8, 2)]
+    for last_instant in (8, 20):
+        result = scheduler.execute_algorithm(1, 1, processes, last_instant)
+        row = scheduler.stream_algorithm(1, 1, processes, last_instant, lambda record: None)
+        summary = compare.summarize(result)
+        assert row["finished"] == summary["finished"]
+        assert abs(row["mean_turnaround"] - summary["mean_turnaround"]) < 1e-9
+        assert abs(row["mean_norm_turn"] - summary["mean_norm_turn"]) < 1e-9
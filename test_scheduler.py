@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+import scheduler
+import smp
+
+ZERO_SERVICE = [("A", 0, 0), ("B", 1, 3), ("C", 2, 0), ("D", 3, 2)]
+# Aging lines with a service time of 0
+ZERO_SERVICE_AGING = [("A", 0, 5, 0), ("B", 1, 2, 3), ("C", 2, 1, 2)]
+
+
+def random_processes(seed, count=30):
+    """Sorted arrivals with a single one at t=0, like workload.py; Aging lines carry a priority"""
+    rng = random.Random(seed)
+    arrivals = sorted([0] + [rng.randint(1, 4 * count) for _ in range(count - 1)])
+    return [(f"P{i}", arrival, rng.randint(0, 9), rng.randint(1, 9)) for i, arrival in enumerate(arrivals)]
+
+
+@pytest.mark.parametrize("algorithm_id", range(1, 9))
+@pytest.mark.parametrize("seed", range(20))
+def test_tick_and_events_agree(algorithm_id, seed):
+    processes = random_processes(seed)
+    quantum = seed % 4 + 1
+    # Short enough that some seeds leave processes unfinished
+    last_instant = 100 + 10 * seed
+    tick = scheduler.execute_algorithm(algorithm_id, quantum, processes, last_instant, scheduler.TICK)
+    events = scheduler.execute_algorithm(algorithm_id, quantum, processes, last_instant, scheduler.EVENTS)
+    assert events == tick
+
+
+@pytest.mark.parametrize("algorithm_id", range(1, 9))
+@pytest.mark.parametrize("mode", [scheduler.TICK, scheduler.EVENTS])
+@pytest.mark.parametrize("processes", [ZERO_SERVICE, ZERO_SERVICE_AGING])
+def test_zero_service_norm_turn_is_zero(algorithm_id, mode, processes):
+    result = scheduler.execute_algorithm(algorithm_id, 2, processes, 20, mode)
+    for process, norm_turn in zip(processes, result["norm_turn"]):
+        if process[-1] == 0:
+            assert norm_turn == 0.0
+
+
+@pytest.mark.parametrize("algorithm_id", range(1, 9))
+def test_zero_service_on_several_cpus(algorithm_id):
+    result = smp.simulate(algorithm_id, 2, ZERO_SERVICE, 20, cpus=2)
+    assert result["norm_turn"][0] == 0.0
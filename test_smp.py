@@ -0,0 +1,26 @@
+import pytest
+
+import scheduler
+import smp
+
+PROCESSES = [(f"P{i}", i, 1 + i % 7) for i in range(10000)]
+
+
+@pytest.mark.parametrize("cpus", [1, 4])
+def test_progress_false_cancels(cpus):
+    calls = []
+
+    def progress(result):
+        calls.append(result)
+        return False
+
+    with pytest.raises(scheduler.Cancelled):
+        smp.simulate(2, 2, PROCESSES, 60000, cpus, smp.PER_CPU, progress=progress)
+    assert len(calls) == 1
+
+
+def test_progress_does_not_change_the_schedule():
+    plain = smp.simulate(4, 1, PROCESSES, 60000, 4)
+    watched = smp.simulate(4, 1, PROCESSES, 60000, 4, progress=lambda result: True)
+    assert watched["cpu_segments"] == plain["cpu_segments"]
+    assert watched["finish"] == plain["finish"]
@@ -0,0 +1,17 @@
+import sweep
+
+
+def point(quantum, finished, mean_turnaround, processes=30):
+    return {"quantum": quantum, "finished": finished, "processes": processes,
+            "mean_turnaround": mean_turnaround}
+
+
+def test_best_quantum_prefers_more_finished_when_none_complete():
+    curve = [point(2, 26, 10.60), point(8, 20, 9.50), point(16, 11, 9.07)]
+    assert sweep.best_quantum(curve)["quantum"] == 2
+
+
+def test_best_quantum_ties_on_objective_then_quantum():
+    curve = [point(4, 30, 8.0), point(3, 30, 8.0), point(1, 30, 9.0), point(5, 29, 1.0)]
+    assert sweep.best_quantum(curve)["quantum"] == 3
+    assert sweep.best_quantum([]) is None
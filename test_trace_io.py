@@ -0,0 +1,25 @@
+import batch
+import compare
+import scheduler
+import trace_io
+
+TIED_TRACE = """name,pid,start,end,cpu
+build,1,100.0,104.0,0.04
+test,2,100.0,103.0,0.03
+lint,3,100.01,101.0,0.02
+deploy,4,100.05,102.0,0.05
+"""
+
+
+def test_tied_starts_are_fully_scheduled(tmp_path):
+    trace = tmp_path / "t.csv"
+    trace.write_text(TIED_TRACE)
+    table = trace_io.import_trace(str(trace))
+    assert list(table.arrival).count(0) == 1
+
+    recording = tmp_path / "t.sched"
+    trace_io.save_recording(str(recording), table)
+    processes = trace_io.load(str(recording)).processes()
+    last_instant = batch.default_last_instant(processes)
+    for result in scheduler.schedule(processes, last_instant, scheduler.parse_algorithms("2-4,6,7")):
+        assert compare.summarize(result)["finished"] == len(processes), result["name"]
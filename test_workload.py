@@ -0,0 +1,44 @@
+import itertools
+
+import pytest
+
+import scheduler
+import workload
+from batch import default_last_instant
+
+# Aging only finishes processes given a service time, which generated workloads don't have
+POLICIES = [(1, 1), (2, 1), (2, 4), (3, 1), (4, 1), (5, 1), (6, 1), (7, 1)]
+ARRIVALS = {
+    "poisson": [{}, {"rate": 0.3}, {"rate": 2.0}],
+    "bursty": [{}, {"rate": 0.3, "burst": 4}],
+    "periodic": [{}, {"period": 3, "jitter": 3}],
+}
+
+
+def workloads():
+    for arrival, params in ARRIVALS.items():
+        for arrival_params, service, seed in itertools.product(params, workload.SERVICE_DISTRIBUTIONS, range(6)):
+            yield arrival, arrival_params, service, seed
+
+
+@pytest.mark.parametrize("arrival,arrival_params,service,seed", list(workloads()))
+def test_generated_workloads_are_fully_scheduled(arrival, arrival_params, service, seed):
+    processes = list(workload.generate(200, arrival, service, seed, arrival_params))
+    arrivals = [process[1] for process in processes]
+    assert arrivals.count(0) <= 1
+    assert arrivals == sorted(arrivals)
+    last_instant = default_last_instant(processes)
+    for algorithm_id, quantum in POLICIES:
+        result = scheduler.execute_algorithm(algorithm_id, quantum, processes, last_instant)
+        assert all(result["finish"]), result["name"]
+        if algorithm_id != 1:
+            assert all(turnaround >= process[-1]
+                       for turnaround, process in zip(result["turnaround"], processes)), result["name"]
+
+
+def test_fcfs_runs_back_to_back_like_main_cpp():
+    # FCFS in main.cpp starts each process when the previous one ends, even
+    # before it arrives, so a gap in the arrivals gives negative turnaround
+    result = scheduler.execute_algorithm(1, 1, [("A", 0, 2), ("B", 10, 3)], 15)
+    assert result["segments"] == [(0, 0, 2), (1, 2, 5)]
+    assert result["turnaround"] == [2, -5]
@@ -0,0 +1,145 @@
+"""Matplotlib timeline graph that stays alive between runs.
+
+One figure and one FigureCanvasTkAgg are created up front. Each process
+is a single PolyCollection of its merged segments, and a new schedule
+only replaces the vertices and colours of the existing collections. When
+the axes layout is unchanged (same processes and horizon) the bars are
+redrawn by blitting over a cached background instead of re-rendering
+the whole figure. Per-segment labels are drawn only while they are wide
+enough to read.
+"""
+
+import tkinter as tk
+import warnings
+from matplotlib.figure import Figure
+from matplotlib.collections import PolyCollection
+from matplotlib.ticker import AutoLocator, ScalarFormatter
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+from profiling import profiler
+
+BAR_HEIGHT = 0.8
+MIN_LABEL_PIXELS = 10  # narrower segments get no '*' / '.' label
+MAX_LABELS = 400       # more labels than this are never legible
+MAX_UNIT_TICKS = 60    # up to this horizon every time unit gets a tick
+
+
+class _TimedCanvas(FigureCanvasTkAgg):
+    # draw_idle() ends up here too, so deferred full redraws are timed as well
+    def draw(self):
+        with profiler.phase("timeline render", "render"):
+            super().draw()
+
+
+def segment_polygons(lane, row):
+    """Rectangle vertices for each (start, end, mark) segment of one lane, centred on `row`"""
+    bottom, top = row - BAR_HEIGHT / 2, row + BAR_HEIGHT / 2
+    return [((start, bottom), (start, top), (end, top), (end, bottom)) for start, end, _ in lane]
+
+
+class TimelineGraph:
+    """Persistent figure showing one row of merged bars per process"""
+
+    def __init__(self, master, color_for=None):
+        self.color_for = color_for or (lambda name: "#3498db")
+        self.figure = Figure(figsize=(6, 4))
+        self.figure.patch.set_facecolor("#ecf0f1")
+        self.ax = self.figure.add_subplot()
+        self.canvas = _TimedCanvas(self.figure, master)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.collections = []
+        self.labels = []
+        self.layout = None
+        self.background = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        self._setup_axes(0, [])
+
+    def _setup_axes(self, last_instant, names):
+        ax = self.ax
+        ax.set_xlim(0, last_instant + 1 if last_instant else 10)
+        ax.set_ylim(-0.5, max(len(names), 1) - 0.5)
+        ax.set_xlabel("Time Units", fontweight="bold", fontsize=9)
+        ax.set_ylabel("Processes", fontweight="bold", fontsize=9)
+        ax.set_title("Process Timeline", fontweight="bold", pad=15, fontsize=10)
+        ax.set_yticks(range(len(names)))
+        ax.set_yticklabels(names)
+        if last_instant and last_instant <= MAX_UNIT_TICKS:
+            ax.set_xticks(range(last_instant + 1))
+            ax.set_xticklabels([str(i % 10) for i in range(last_instant + 1)])
+        else:
+            ax.xaxis.set_major_locator(AutoLocator())
+            ax.xaxis.set_major_formatter(ScalarFormatter())
+        ax.grid(True, alpha=0.3)
+        ax.set_axisbelow(True)
+        with warnings.catch_warnings():
+            # Crowded axes just keep the margins they have
+            warnings.simplefilter("ignore", UserWarning)
+            self.figure.tight_layout()
+
+    def _artists(self):
+        return self.collections + [label for label in self.labels if label.get_visible()]
+
+    def _on_draw(self, event):
+        # A full draw skips animated artists: cache what's behind them, then add them
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        for artist in self._artists():
+            self.ax.draw_artist(artist)
+
+    def _blit(self):
+        self.canvas.restore_region(self.background)
+        for artist in self._artists():
+            self.ax.draw_artist(artist)
+        self.canvas.blit(self.figure.bbox)
+
+    def set_data(self, last_instant, lanes):
+        """Show a new schedule: `lanes` maps process name -> [(start, end, mark)]"""
+        names = list(lanes)
+        layout = (last_instant, names)
+        relayout = layout != self.layout
+        if relayout:
+            self._setup_axes(last_instant, names)
+            self.layout = layout
+
+        # Reuse one collection per process, adding or dropping collections as needed
+        while len(self.collections) < len(names):
+            collection = PolyCollection([], linewidths=1, edgecolors="black", alpha=0.8, animated=True)
+            self.ax.add_collection(collection)
+            self.collections.append(collection)
+        while len(self.collections) > len(names):
+            self.collections.pop().remove()
+        for row, (name, collection) in enumerate(zip(names, self.collections)):
+            collection.set_verts(segment_polygons(lanes[name], row))
+            collection.set_facecolor(self.color_for(name))
+
+        self._update_labels(last_instant, lanes)
+
+        if relayout or self.background is None:
+            self.canvas.draw_idle()
+        else:
+            with profiler.phase("timeline blit", "render"):
+                self._blit()
+
+    def _update_labels(self, last_instant, lanes):
+        """Centre a mark on every segment wide enough for it, unless that would be too many"""
+        width = self.ax.get_window_extent().width
+        pixels_per_unit = width / (last_instant + 1 if last_instant else 10)
+        min_units = MIN_LABEL_PIXELS / pixels_per_unit if pixels_per_unit else float("inf")
+        wanted = [((start + end) / 2, row, mark)
+                  for row, lane in enumerate(lanes.values())
+                  for start, end, mark in lane if end - start >= min_units]
+        if len(wanted) > MAX_LABELS:
+            wanted = []
+        for i, (x, y, mark) in enumerate(wanted):
+            if i < len(self.labels):
+                label = self.labels[i]
+                label.set_position((x, y))
+                label.set_text(mark)
+                label.set_visible(True)
+            else:
+                self.labels.append(self.ax.text(x, y, mark, ha="center", va="center", fontweight="bold",
+                                                color="white", fontsize=8, animated=True))
+        for label in self.labels[len(wanted):]:
+            label.set_visible(False)
+
+    def clear(self):
+        self.set_data(0, {})
@@ -0,0 +1,398 @@
+"""Import process-accounting traces and save workloads and schedules in a binary format.
+
+Accounting logs record when each process started and how much CPU it
+used. import_trace() turns one into an engine workload: arrival is the
+start time and service the CPU time, both counted in ticks of `tick`
+seconds from the first start. Processes that tie with the first one
+arrive one tick later, so only one process arrives at t=0. Two log formats are read:
+
+- CSV with a header row. The columns are found by name: name/comm/command,
+  pid, start/btime, end and cpu/cpu_time, or utime plus stime. Without a
+  CPU column the service is the wall time, end - start. Times are seconds.
+- Linux BSD process accounting files (acct v3, as written by `accton`),
+  read straight into NumPy.
+
+A recording holds a workload and, optionally, schedules computed for it.
+Its columns are raw int64 arrays at fixed offsets, so load() maps the file
+and reads nothing but the header and the names. A large trace and its
+results reopen at once, without parsing or re-simulating:
+
+    python trace_io.py import /var/log/account/pacct -o day.sched --tick 0.01
+    python trace_io.py record day.sched -a 1,2-4,5
+    python trace_io.py dump day.sched > day.txt
+
+batch.py and sweep.py accept recordings wherever they take workload files.
+"""
+
+import argparse
+import csv
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+
+import numpy as np
+
+import scheduler
+from process_table import ProcessTable
+
+MAGIC = b"CPUSCHED"
+VERSION = 1
+ALIGNMENT = 64  # every array starts on a multiple of this
+_PREAMBLE = struct.Struct("<8sII")  # magic, version, header length
+
+DEFAULT_TICK = 0.01  # seconds per time unit
+STREAM_CHUNK = 65536  # processes converted to tuples at a time by iter_processes()
+
+# struct acct_v3 from <linux/acct.h>; times are comp_t in AHZ ticks
+ACCT_V3 = np.dtype([("flag", "u1"), ("version", "u1"), ("tty", "<u2"), ("exitcode", "<u4"),
+                    ("uid", "<u4"), ("gid", "<u4"), ("pid", "<u4"), ("ppid", "<u4"),
+                    ("btime", "<u4"), ("etime", "<f4"), ("utime", "<u2"), ("stime", "<u2"),
+                    ("mem", "<u2"), ("io", "<u2"), ("rw", "<u2"), ("minflt", "<u2"),
+                    ("majflt", "<u2"), ("swaps", "<u2"), ("comm", "S16")])
+ACCT_HZ = 100
+
+CSV_COLUMNS = {
+    "name": ("name", "comm", "command", "process", "job"),
+    "pid": ("pid", "id", "job_id"),
+    "start": ("start", "start_time", "btime", "begin", "submit"),
+    "end": ("end", "end_time", "finish", "stop"),
+    "cpu": ("cpu", "cpu_time", "cputime", "cpu_seconds"),
+    "utime": ("utime", "user"),
+    "stime": ("stime", "sys", "system"),
+}
+
+
+# Accounting traces
+
+def _ticks(seconds, tick):
+    return np.rint(np.asarray(seconds, dtype=np.float64) / tick).astype(np.int64)
+
+
+def _workload(names, pids, start, cpu, tick):
+    """Sorted, uniquely named ProcessTable from per-process columns in seconds"""
+    start = np.asarray(start, dtype=np.float64)
+    order = np.argsort(start, kind="stable")
+    arrival = _ticks(start - start.min(), tick)[order] if start.size else np.zeros(0, np.int64)
+    # As in workload.single_start(): RR and FB-1 only admit the first process at t=0, and
+    # a tied one there would block every later process
+    arrival[1:] = np.maximum(arrival[1:], 1)
+    # A process that used less than a tick still ran
+    service = np.maximum(_ticks(cpu, tick), 1)[order]
+    seen = {}
+    unique = []
+    for index in order.tolist():
+        # Lanes and colors are keyed by name, and names can't hold the input separators
+        name = "_".join(str(names[index]).replace(",", " ").split()) or "P"
+        if pids is not None:
+            name = f"{name}-{pids[index]}"
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        unique.append(name if count == 0 else f"{name}.{count}")
+    return ProcessTable(unique, arrival, service)
+
+
+def _column(fields, key):
+    for candidate in CSV_COLUMNS[key]:
+        if candidate in fields:
+            return fields[candidate]
+    return None
+
+
+def read_accounting_csv(lines, tick=DEFAULT_TICK, delimiter=","):
+    """ProcessTable for a CSV accounting log with a header row"""
+    reader = csv.reader(lines, delimiter=delimiter)
+    header = next(reader, None)
+    if header is None:
+        raise ValueError("Empty trace")
+    fields = {name.strip().lower(): position for position, name in enumerate(header)}
+    name, pid, start, end = (_column(fields, key) for key in ("name", "pid", "start", "end"))
+    cpu, utime, stime = (_column(fields, key) for key in ("cpu", "utime", "stime"))
+    if start is None:
+        raise ValueError(f"Trace has no start column (one of {', '.join(CSV_COLUMNS['start'])})")
+    if cpu is None and (utime is None or stime is None) and end is None:
+        raise ValueError("Trace needs a cpu column, utime and stime columns, or an end column")
+
+    names, pids, starts, cpus = [], [], [], []
+    for line_num, row in enumerate(reader, 2):
+        if not row or not "".join(row).strip():
+            continue
+        try:
+            started = float(row[start])
+            if cpu is not None:
+                used = float(row[cpu])
+            elif utime is not None and stime is not None:
+                used = float(row[utime]) + float(row[stime])
+            else:
+                used = float(row[end]) - started
+        except (ValueError, IndexError):
+            raise ValueError(f"Line {line_num}: bad trace row {delimiter.join(row)!r}")
+        if used < 0:
+            raise ValueError(f"Line {line_num}: negative CPU time")
+        names.append(row[name].strip() if name is not None else f"P{len(names)}")
+        if pid is not None:
+            pids.append(row[pid].strip())
+        starts.append(started)
+        cpus.append(used)
+    return _workload(names, pids if pid is not None else None, starts, cpus, tick)
+
+
+def _comp_t(values):
+    """Decode comp_t: 13-bit mantissa, 3-bit base-8 exponent"""
+    values = values.astype(np.int64)
+    return (values & 0x1FFF) << (3 * (values >> 13))
+
+
+def read_acct(path, tick=DEFAULT_TICK):
+    """ProcessTable for a Linux acct v3 process accounting file"""
+    records = np.fromfile(path, dtype=ACCT_V3)
+    if records.size and np.any((records["version"] & 0x7F) != 3):
+        raise ValueError(f"{path}: not a little-endian acct v3 file")
+    cpu = (_comp_t(records["utime"]) + _comp_t(records["stime"])) / ACCT_HZ
+    # btime has one-second resolution; processes started in the same second keep file order
+    names = [comm.decode(errors="replace") for comm in records["comm"].tolist()]
+    return _workload(names, records["pid"].tolist(), records["btime"], cpu, tick)
+
+
+def _is_acct(path):
+    with open(path, "rb") as f:
+        head = f.read(ACCT_V3.itemsize)
+    return len(head) == ACCT_V3.itemsize and head[1] & 0x7F == 3
+
+
+def import_trace(path, tick=DEFAULT_TICK, trace_format=None, delimiter=","):
+    """ProcessTable for an accounting trace; trace_format is "csv", "acct" or None to detect"""
+    if trace_format is None:
+        trace_format = "acct" if path != "-" and _is_acct(path) else "csv"
+    if trace_format == "acct":
+        return read_acct(path, tick)
+    if path == "-":
+        return read_accounting_csv(sys.stdin, tick, delimiter)
+    with open(path, newline="") as f:
+        return read_accounting_csv(f, tick, delimiter)
+
+
+# Recordings
+
+def _align(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def save_recording(path, table, results=()):
+    """Write a workload and any results scheduled for it to `path`
+
+    `table` is a ProcessTable or a list of process tuples. Results from
+    smp.simulate() keep their per-CPU runs.
+    """
+    if not isinstance(table, ProcessTable):
+        table = ProcessTable.from_processes(table)
+    arrays = {
+        "names": np.frombuffer("\n".join(table.names).encode(), dtype=np.uint8),
+        "arrival": table.arrival,
+        "service": table.service,
+        "priority": table.priority,
+        "has_priority": table.has_priority,
+    }
+    runs = []
+    for index, result in enumerate(results):
+        run = {key: result[key] for key in ("algorithm_id", "quantum", "name", "last_instant")}
+        arrays[f"finish{index}"] = np.asarray(result["finish"], dtype=np.int64)
+        arrays[f"segments{index}"] = np.asarray(result["segments"], dtype=np.int64).reshape(-1, 3)
+        if result.get("cpus", 1) > 1:
+            run.update({key: result[key] for key in ("cpus", "queues", "migrations", "steals")})
+            arrays[f"cpu_segments{index}"] = np.asarray(
+                [(cpu, *segment) for cpu, segments in enumerate(result["cpu_segments"]) for segment in segments],
+                dtype=np.int64).reshape(-1, 4)
+        runs.append(run)
+
+    # Offsets depend on the header's length, which depends on the offsets: leave room for them
+    layout = {name: {"dtype": array.dtype.str, "shape": list(array.shape), "offset": 0}
+              for name, array in arrays.items()}
+    header = {"count": len(table), "arrays": layout, "results": runs}
+    size = len(json.dumps(header)) + 16 * len(arrays)
+    offset = _align(_PREAMBLE.size + size)
+    for name, array in arrays.items():
+        layout[name]["offset"] = offset
+        offset = _align(offset + array.nbytes)
+    encoded = json.dumps(header).encode()
+    assert len(encoded) <= size
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(_PREAMBLE.pack(MAGIC, VERSION, len(encoded)))
+        f.write(encoded)
+        for name, array in arrays.items():
+            f.seek(layout[name]["offset"])
+            f.write(np.ascontiguousarray(array).tobytes())
+        f.truncate(offset)
+    os.replace(temporary, path)
+
+
+def is_recording(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+class Recording:
+    """A recording mapped into memory; its arrays are read-only views of the file"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < _PREAMBLE.size:
+            raise ValueError(f"{path}: not a recording")
+        magic, version, length = _PREAMBLE.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not a recording")
+        if version != VERSION:
+            raise ValueError(f"{path}: recording version {version}, expected {VERSION}")
+        header = json.loads(self._map[_PREAMBLE.size:_PREAMBLE.size + length])
+        self.layout = header["arrays"]
+        self.runs = header["results"]
+        names = self.array("names").tobytes().decode()
+        self.table = ProcessTable(names.split("\n") if header["count"] else [],
+                                  self.array("arrival"), self.array("service"),
+                                  self.array("priority"), self.array("has_priority"))
+        self._processes = None
+
+    def array(self, name):
+        entry = self.layout[name]
+        dtype = np.dtype(entry["dtype"])
+        count = int(np.prod(entry["shape"]))
+        if count == 0:
+            return np.zeros(entry["shape"], dtype=dtype)
+        return np.frombuffer(self._map, dtype=dtype, count=count, offset=entry["offset"]).reshape(entry["shape"])
+
+    def __len__(self):
+        return len(self.runs)
+
+    def processes(self):
+        """The workload as the engine's process tuples (built once)"""
+        if self._processes is None:
+            self._processes = self.table.to_processes()
+        return self._processes
+
+    def iter_processes(self):
+        """The workload's process tuples one at a time, for scheduler.stream_algorithm()"""
+        table = self.table
+        for start in range(0, len(table), STREAM_CHUNK):
+            names = table.names[start:start + STREAM_CHUNK]
+            arrival = table.arrival[start:start + STREAM_CHUNK].tolist()
+            service = table.service[start:start + STREAM_CHUNK].tolist()
+            priority = table.priority[start:start + STREAM_CHUNK].tolist()
+            has_priority = table.has_priority[start:start + STREAM_CHUNK].tolist()
+            for fields in zip(names, arrival, priority, service, has_priority):
+                yield fields[:4] if fields[4] else (fields[0], fields[1], fields[3])
+
+    def finished_table(self, index):
+        """ProcessTable of result `index`, finish times included, without building tuples"""
+        return ProcessTable(self.table.names, self.table.arrival, self.table.service,
+                            self.table.priority, self.table.has_priority, self.array(f"finish{index}"))
+
+    def result(self, index):
+        """Result `index` as an engine result dict"""
+        run = self.runs[index]
+        table = self.finished_table(index)
+        result = {
+            "algorithm_id": run["algorithm_id"],
+            "quantum": run["quantum"],
+            "name": run["name"],
+            "processes": self.processes(),
+            "last_instant": run["last_instant"],
+            "finish": table.finish.tolist(),
+            "turnaround": table.turnaround().tolist(),
+            "norm_turn": table.norm_turn().tolist(),
+            "segments": list(map(tuple, self.array(f"segments{index}").tolist())),
+        }
+        if "cpus" in run:
+            result.update({key: run[key] for key in ("cpus", "queues", "migrations", "steals")})
+            result["cpu_segments"] = cpu_segments = [[] for _ in range(run["cpus"])]
+            for cpu, *segment in self.array(f"cpu_segments{index}").tolist():
+                cpu_segments[cpu].append(tuple(segment))
+        return result
+
+    def results(self):
+        return [self.result(index) for index in range(len(self.runs))]
+
+    def copy_table(self):
+        """The workload as an in-memory ProcessTable that outlives close()"""
+        table = self.table
+        return ProcessTable(table.names, table.arrival.copy(), table.service.copy(),
+                            table.priority.copy(), table.has_priority.copy())
+
+    def close(self):
+        """Unmap the file; arrays taken from this recording must be gone by then"""
+        self.table = None
+        self._map.close()
+
+
+def load(path):
+    return Recording(path)
+
+
+def default_last_instant(table):
+    """Vectorized batch.default_last_instant() for a ProcessTable"""
+    return int(table.arrival.max() + table.service.sum()) if len(table) else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import accounting traces and record schedules.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    importer = commands.add_parser("import", help="convert an accounting trace into a recording")
+    importer.add_argument("trace", help="CSV or acct v3 file ('-' for CSV on stdin)")
+    importer.add_argument("-o", "--output", required=True, help="recording to write")
+    importer.add_argument("--tick", type=float, default=DEFAULT_TICK,
+                          help=f"seconds per time unit (default: {DEFAULT_TICK})")
+    importer.add_argument("--format", choices=["csv", "acct"], default=None, help="trace format (default: detect)")
+    importer.add_argument("--delimiter", default=",", help="CSV field separator (default: ',')")
+
+    recorder = commands.add_parser("record", help="schedule a recording's workload and store the results in it")
+    recorder.add_argument("recording")
+    recorder.add_argument("-a", "--algorithms", default="1", help="algorithm chunk, e.g. 1,2-4,5 (default: 1)")
+    recorder.add_argument("-t", "--last-instant", type=int, default=None,
+                          help="simulation horizon (default: enough to finish the workload)")
+
+    dumper = commands.add_parser("dump", help="print a recording as main.exe input or its results")
+    dumper.add_argument("recording")
+    dumper.add_argument("--results", choices=[scheduler.TRACE, scheduler.SHOW_STATISTICS, scheduler.JSON],
+                        default=None, help="print the stored results in this operation's format instead")
+    args = parser.parse_args(argv)
+
+    if args.command == "import":
+        if args.tick <= 0:
+            parser.error("--tick must be positive")
+        try:
+            table = import_trace(args.trace, args.tick, args.format, args.delimiter)
+        except ValueError as e:
+            parser.error(str(e))
+        save_recording(args.output, table)
+        print(f"{len(table)} processes from {args.trace} written to {args.output}", file=sys.stderr)
+    elif args.command == "record":
+        recording = load(args.recording)
+        processes = recording.processes()
+        last_instant = (default_last_instant(recording.table) if args.last_instant is None
+                        else args.last_instant)
+        results = recording.results() + scheduler.schedule(processes, last_instant,
+                                                           scheduler.parse_algorithms(args.algorithms))
+        table = recording.copy_table()
+        # Windows can't replace a file that is still mapped
+        recording.close()
+        save_recording(args.recording, table, results)
+    else:
+        recording = load(args.recording)
+        if args.results:
+            sys.stdout.write(scheduler.format_output(args.results, recording.results()))
+        else:
+            for process in recording.processes():
+                print(",".join(str(field) for field in process))
+
+
+if __name__ == "__main__":
+    main()
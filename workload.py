@@ -0,0 +1,155 @@
+"""Synthetic workload generator.
+
+Processes are produced lazily, in arrival order, as the (name, arrival,
+service) tuples the engine uses, so even million-process workloads never
+have to sit in memory. All times are whole time units and every run is
+reproducible from its seed.
+
+At most one process arrives at t=0; any others that round to 0 arrive
+at t=1 instead. Like main.cpp, RR and FB-1 only admit the first process
+at t=0, and a second one there would block every process after it.
+Later ties, such as the members of a burst, are kept.
+
+    python workload.py -n 1000000 --arrival poisson --rate 0.15 --service pareto --seed 42 > big.txt
+"""
+
+import argparse
+import itertools
+import math
+import random
+import sys
+
+ARRIVAL_PROCESSES = ("poisson", "bursty", "periodic")
+SERVICE_DISTRIBUTIONS = ("exponential", "pareto", "bimodal")
+
+
+# ---------------------------------------------------------------------------
+# Arrival processes: infinite, non-decreasing integer arrival times
+# (generate() moves all but the first t=0 arrival to t=1)
+# ---------------------------------------------------------------------------
+
+def poisson_arrivals(rng, rate=0.15):
+    """Poisson process: exponential gaps with `rate` arrivals per time unit"""
+    clock = 0.0
+    while True:
+        yield int(clock)
+        clock += rng.expovariate(rate)
+
+
+def bursty_arrivals(rng, rate=0.15, burst=8):
+    """Bursts arrive as a Poisson process; each burst brings about `burst` processes at once"""
+    clock = 0.0
+    while True:
+        # Geometric burst size with mean `burst`
+        size = 1 + int(math.log(1.0 - rng.random()) / math.log(1.0 - 1.0 / burst)) if burst > 1 else 1
+        for _ in range(size):
+            yield int(clock)
+        clock += rng.expovariate(rate / burst)
+
+
+def periodic_arrivals(rng, period=7, jitter=0):
+    """One arrival every `period` time units, each delayed by up to `jitter`"""
+    jitter = min(jitter, period)
+    for k in itertools.count():
+        yield k * period + (rng.randint(0, jitter) if jitter else 0)
+
+
+# ---------------------------------------------------------------------------
+# Service time distributions: infinite positive integer service times
+# ---------------------------------------------------------------------------
+
+def exponential_service(rng, mean=5.0):
+    while True:
+        yield max(1, round(rng.expovariate(1.0 / mean)))
+
+
+def pareto_service(rng, alpha=1.5, minimum=1):
+    """Heavy-tailed: most processes are short, a few are enormous"""
+    while True:
+        yield max(1, round(minimum * rng.paretovariate(alpha)))
+
+
+def bimodal_service(rng, short=2, long=50, long_fraction=0.1):
+    while True:
+        yield long if rng.random() < long_fraction else short
+
+
+def single_start(arrivals):
+    """The arrival times with only the first one at t=0; the rest of the t=0 arrivals come at t=1"""
+    arrivals = iter(arrivals)
+    yield next(arrivals)
+    for arrival_time in arrivals:
+        yield max(arrival_time, 1)
+
+
+_ARRIVALS = {"poisson": poisson_arrivals, "bursty": bursty_arrivals, "periodic": periodic_arrivals}
+_SERVICES = {"exponential": exponential_service, "pareto": pareto_service, "bimodal": bimodal_service}
+
+
+def generate(count, arrival="poisson", service="exponential", seed=None,
+             arrival_params=None, service_params=None):
+    """Yield `count` (name, arrival, service) tuples in arrival order
+
+    `arrival` is one of ARRIVAL_PROCESSES and `service` one of
+    SERVICE_DISTRIBUTIONS; their keyword parameters go in arrival_params and
+    service_params (e.g. {"rate": 0.2}, {"alpha": 1.2, "minimum": 2}).
+    Only the first process can arrive at t=0 (see single_start()).
+    """
+    if arrival not in _ARRIVALS:
+        raise ValueError(f"Unknown arrival process: {arrival}")
+    if service not in _SERVICES:
+        raise ValueError(f"Unknown service distribution: {service}")
+    rng = random.Random(seed)
+    arrivals = single_start(_ARRIVALS[arrival](rng, **(arrival_params or {})))
+    services = _SERVICES[service](rng, **(service_params or {}))
+    for i, arrival_time, service_time in zip(range(1, count + 1), arrivals, services):
+        yield f"P{i}", arrival_time, service_time
+
+
+def write_workload(processes, out):
+    """Stream processes as name,arrival,service lines"""
+    for name, arrival_time, service_time in processes:
+        out.write(f"{name},{arrival_time},{service_time}\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic scheduler workloads.")
+    parser.add_argument("-n", "--count", type=int, default=100, help="processes per workload")
+    parser.add_argument("-w", "--workloads", type=int, default=1,
+                        help="number of workloads, separated by blank lines (seeds seed, seed+1, ...)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--arrival", choices=ARRIVAL_PROCESSES, default="poisson")
+    parser.add_argument("--rate", type=float, default=0.15, help="poisson/bursty: arrivals per time unit")
+    parser.add_argument("--burst", type=float, default=8, help="bursty: mean burst size")
+    parser.add_argument("--period", type=int, default=7, help="periodic: time between arrivals")
+    parser.add_argument("--jitter", type=int, default=0, help="periodic: maximum delay of an arrival")
+    parser.add_argument("--service", choices=SERVICE_DISTRIBUTIONS, default="exponential")
+    parser.add_argument("--mean", type=float, default=5.0, help="exponential: mean service time")
+    parser.add_argument("--alpha", type=float, default=1.5, help="pareto: tail index")
+    parser.add_argument("--min", type=int, default=1, dest="minimum", help="pareto: minimum service time")
+    parser.add_argument("--short", type=int, default=2, help="bimodal: short service time")
+    parser.add_argument("--long", type=int, default=50, help="bimodal: long service time")
+    parser.add_argument("--long-fraction", type=float, default=0.1, help="bimodal: share of long processes")
+    args = parser.parse_args(argv)
+
+    arrival_params = {
+        "poisson": {"rate": args.rate},
+        "bursty": {"rate": args.rate, "burst": args.burst},
+        "periodic": {"period": args.period, "jitter": args.jitter},
+    }[args.arrival]
+    service_params = {
+        "exponential": {"mean": args.mean},
+        "pareto": {"alpha": args.alpha, "minimum": args.minimum},
+        "bimodal": {"short": args.short, "long": args.long, "long_fraction": args.long_fraction},
+    }[args.service]
+
+    for w in range(args.workloads):
+        if w:
+            sys.stdout.write("\n")
+        seed = None if args.seed is None else args.seed + w
+        write_workload(generate(args.count, args.arrival, args.service, seed,
+                                arrival_params, service_params), sys.stdout)
+
+
+if __name__ == "__main__":
+    main()